@@ -587,6 +587,49 @@ class _DynamicBlockData(_BlockData):
                 "category has been specified."
             )
 
+    def _get_shift_plan(self, t_shift, ctype, tolerance=1e-8):
+        """Get lists of the destination and source vardatas for shifting
+        the variables of the specified ctypes by `t_shift`, i.e. the value
+        of `dest[i]` is to be set to that of `source[i]`.
+
+        The plan is built once for each shift, set of ctypes, and
+        tolerance, then cached, as it only depends on the structure of
+        the block, which does not change after construction.
+        """
+        if isinstance(ctype, type):
+            ctype_key = ctype
+        else:
+            ctype_key = tuple(ctype)
+        time = self.time
+        key = (t_shift, ctype_key, tolerance, len(time))
+        try:
+            plans = self._shift_plans
+        except AttributeError:
+            plans = self._shift_plans = {}
+        if key in plans:
+            return plans[key]
+
+        variables = list(self.component_objects(ctype))
+        dest = []
+        source = []
+        # The outer loop is over time so we don't have to call
+        # `find_nearest_index` for every variable, and so the
+        # plan is applied in the same order as it would be by
+        # looping over time points.
+        for t in time:
+            ts = t + t_shift
+            idx = time.find_nearest_index(ts, tolerance)
+            if idx is None:
+                # t + sample_time is outside the model's "horizon"
+                continue
+            ts = time.at(idx)
+            for var in variables:
+                dest.append(var[t])
+                source.append(var[ts])
+
+        plan = plans[key] = (dest, source)
+        return plan
+
     def advance_by_time(
         self,
         t_shift,
@@ -598,20 +641,11 @@ class _DynamicBlockData(_BlockData):
         """Set values for the variables of the specified ctypes
         to their values `t_shift` in the future.
         """
-        time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                var[t].set_value(var[ts].value)
+        dest, source = self._get_shift_plan(t_shift, ctype, tolerance)
+        # Values were validated when they were set at the source time
+        # point, so we don't validate them again.
+        for var, source_var in zip(dest, source):
+            var.set_value(source_var.value, skip_validation=True)
 
     def advance_one_sample(
         self,
@@ -724,23 +758,12 @@ class _DynamicBlockData(_BlockData):
         """
         zL = self.ipopt_zL_in
         zU = self.ipopt_zU_in
-        time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                if var[t] in zL and var[ts] in zL:
-                    zL[var[t]] = zL[var[ts]]
-                if var[t] in zU and var[ts] in zU:
-                    zU[var[t]] = zU[var[ts]]
+        dest, source = self._get_shift_plan(t_shift, ctype, tolerance)
+        for var, source_var in zip(dest, source):
+            if var in zL and source_var in zL:
+                zL[var] = zL[source_var]
+            if var in zU and source_var in zU:
+                zU[var] = zU[source_var]
 
     def advance_ipopt_multipliers_one_sample(
         self,
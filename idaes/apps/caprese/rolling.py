@@ -18,6 +18,8 @@ from pyomo.core.base.componentuid import ComponentUID
 from collections import OrderedDict
 import bisect
 
+import numpy as np
+
 
 class TimeList(list):
     """
@@ -287,3 +289,390 @@ class VectorSeries(OrderedDict):
         self.time.extend(tpoints)
         for series, new_data in zip(self.values(), data):
             series.extend(new_data)
+
+
+class ArraySeries(object):
+    """
+    A series of floating point values stored in a NumPy array, which
+    grows geometrically so that appending a value is amortized O(1).
+    Indexing with a slice returns a view of the stored values, not a copy.
+    """
+
+    _initial_capacity = 16
+
+    def __init__(self, values=None, capacity=None):
+        if values is None:
+            values = []
+        values = np.asarray(values, dtype=float).ravel()
+        n = len(values)
+        if capacity is None:
+            capacity = self._initial_capacity
+        capacity = max(capacity, n, 1)
+        self._array = np.empty(capacity, dtype=float)
+        self._array[:n] = values
+        self._len = n
+
+    @property
+    def array(self):
+        """A view of the stored values"""
+        return self._array[: self._len]
+
+    def _reserve(self, n_new):
+        capacity = len(self._array)
+        required = self._len + n_new
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        array = np.empty(capacity, dtype=float)
+        array[: self._len] = self._array[: self._len]
+        self._array = array
+
+    def append(self, value):
+        n = self._len
+        if n == len(self._array):
+            self._reserve(1)
+        self._array[n] = value
+        self._len = n + 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        n_new = len(values)
+        self._reserve(n_new)
+        self._array[self._len : self._len + n_new] = values
+        self._len += n_new
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self._len > 0
+
+    def __getitem__(self, i):
+        return self.array[i]
+
+    def __iter__(self):
+        return iter(self.array.tolist())
+
+    def __array__(self, dtype=None):
+        return self.array if dtype is None else self.array.astype(dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, ArraySeries):
+            other = other.array
+        elif not isinstance(other, np.ndarray):
+            try:
+                other = list(other)
+            except TypeError:
+                return NotImplemented
+        return len(other) == self._len and bool(
+            np.all(self.array == np.asarray(other, dtype=float))
+        )
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    __hash__ = None
+
+    def tolist(self):
+        return self.array.tolist()
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__, self.tolist())
+
+
+class ArrayTimeList(ArraySeries):
+    """
+    NumPy-backed version of TimeList, for long rolling-horizon
+    simulations. Time points are stored in a geometrically growing
+    array, extend is vectorized, and nearest-point lookups use
+    `numpy.searchsorted`.
+    """
+
+    def __init__(self, time=None, tolerance=0.0, capacity=None):
+        self.tolerance = tolerance
+        if time is None:
+            time = []
+        time = self.validate_time(np.asarray(time, dtype=float).ravel())
+        super().__init__(time, capacity=capacity)
+
+    def validate_time(self, time):
+        """
+        Make sure that time points are increasing, and that points are
+        separated by more than twice the tolerance.
+        """
+        if len(time) > 1 and np.any(np.diff(time) <= 2 * self.tolerance):
+            raise ValueError(
+                "Time points must be increasing and separated by more "
+                "than twice the tolerance."
+            )
+        return time
+
+    def is_within_bounds(self, t):
+        """
+        Checks whether point t is in the interval bounded by the first and
+        last time points.
+        """
+        if not self:
+            raise ValueError("List is empty. No bounds exist.")
+        tol = self.tolerance
+        return self._array[0] - tol <= t and t <= self._array[self._len - 1] + tol
+
+    def is_valid_append(self, t):
+        """
+        Checks whether point t is greater than the last existing time point
+        by an amount consistent with the tolerance.
+        """
+        if not self:
+            return True
+        return t - self._array[self._len - 1] > 2 * self.tolerance
+
+    def append(self, t):
+        """
+        Appends a valid time point.
+        """
+        if not self.is_valid_append(t):
+            raise ValueError(
+                "Appended time values must be more than 2*tolerance later "
+                "than current values."
+            )
+        super().append(t)
+
+    def validate_extend(self, tpoints):
+        """
+        Checks whether new time points overlap with current time points
+        at more than a single point. If there is no overlap, the
+        separation between current and new points must be more than
+        twice the tolerance.
+        """
+        if len(tpoints) == 0 or not self:
+            return tpoints
+        tolerance = self.tolerance
+        t_last = self._array[self._len - 1]
+        t_new = tpoints[0]
+        if t_new < t_last - tolerance:
+            raise ValueError(
+                "First new point must not be earlier than last existing point."
+            )
+        elif t_new <= t_last + tolerance:
+            # Allow extending with an interval where the boundaries overlap.
+            return tpoints[1:]
+        elif t_new <= t_last + 2 * tolerance:
+            raise ValueError(
+                "Distinct time points must be separated by more than twice the "
+                "tolerance."
+            )
+        else:
+            return tpoints
+
+    def extend(self, tpoints):
+        """
+        Extends by a valid iterable of time points.
+        """
+        tpoints = np.asarray(
+            tpoints.array if isinstance(tpoints, ArraySeries) else list(tpoints),
+            dtype=float,
+        ).ravel()
+        tpoints = self.validate_time(tpoints)
+        tpoints = self.validate_extend(tpoints)
+        super().extend(tpoints)
+
+    def find_nearest_index(self, target):
+        """
+        Returns the index of the nearest point in self, or None if there
+        is no point within the tolerance.
+        """
+        n = self._len
+        if n == 0:
+            return None
+        time = self._array[:n]
+        i = int(time.searchsorted(target, side="right"))
+        if i == 0:
+            nearest_index = i
+            delta = time[0] - target
+        elif i == n:
+            nearest_index = i - 1
+            delta = target - time[i - 1]
+        else:
+            delta_lo = abs(target - time[i - 1])
+            delta_hi = abs(target - time[i])
+            if delta_hi < delta_lo:
+                nearest_index, delta = i, delta_hi
+            else:
+                nearest_index, delta = i - 1, delta_lo
+
+        if delta > self.tolerance:
+            return None
+        return nearest_index
+
+    def find_nearest_indices(self, targets):
+        """
+        Vectorized version of find_nearest_index. Returns an array of the
+        indices of the nearest points in self, with -1 where there is no
+        point within the tolerance.
+        """
+        targets = np.asarray(targets, dtype=float)
+        n = self._len
+        if n == 0:
+            return np.full(targets.shape, -1, dtype=int)
+        time = self._array[:n]
+        i = time.searchsorted(targets, side="right")
+        lo = np.clip(i - 1, 0, n - 1)
+        hi = np.clip(i, 0, n - 1)
+        delta_lo = np.abs(targets - time[lo])
+        delta_hi = np.abs(targets - time[hi])
+        nearest = np.where(delta_hi < delta_lo, hi, lo)
+        delta = np.minimum(delta_lo, delta_hi)
+        return np.where(delta > self.tolerance, -1, nearest)
+
+    def binary_search(self, t):
+        """
+        Returns whether t is in self (within the tolerance), and the index
+        of the matching point or the index at which t would be inserted.
+        """
+        n = self._len
+        time = self._array
+        tolerance = self.tolerance
+        i = int(np.searchsorted(time[:n], t, side="left"))
+        if i < n and time[i] - t < tolerance:
+            return True, i
+        if i == 0:
+            return False, i
+        if t - time[i - 1] < tolerance:
+            return True, i - 1
+        return False, i
+
+    def window_slice(self, t_start, t_end):
+        """
+        Returns the slice of indices of time points in the closed interval
+        [t_start, t_end], within the tolerance. Indexing the time list or
+        a series with this slice returns views, not copies.
+        """
+        time = self.array
+        tol = self.tolerance
+        i_start = int(np.searchsorted(time, t_start - tol, side="left"))
+        i_end = int(np.searchsorted(time, t_end + tol, side="right"))
+        return slice(i_start, i_end)
+
+
+class ArrayVectorSeries(OrderedDict):
+    """
+    NumPy-backed version of VectorSeries, for long rolling-horizon
+    simulations. Each data series is an ArraySeries and the time points
+    are an ArrayTimeList, so appending is amortized O(1) and extend is
+    vectorized.
+    """
+
+    def __init__(self, data=None, time=None, name=None, tolerance=0.0):
+        """
+        Args:
+            data: OrderedDict mapping cuids to lists of values
+            time: list of time points corresponding to data values
+            name: name of this vector
+        """
+        if data is None:
+            data = OrderedDict()
+        if time is None:
+            time = []
+
+        len_time = len(time)
+        for val_list in data.values():
+            if len(val_list) != len_time:
+                raise ValueError("data lists and time list must have same length")
+
+        self.name = name
+        self.time = ArrayTimeList(time, tolerance=tolerance)
+
+        super().__init__((key, ArraySeries(values)) for key, values in data.items())
+
+    def dim(self):
+        """This is the dimension of the vector that is indexed by time."""
+        return len(self.keys())
+
+    def __len__(self):
+        """This is the length of the time series, each element of which
+        is a vector.
+        """
+        return len(self.time)
+
+    def consistent(self, target):
+        """
+        target is a vector
+        """
+        if len(target) != self.dim():
+            return False
+        if len(self) == 0:
+            return True
+        last = [series[-1] for series in self.values()]
+        return all(new == old for new, old in zip(target, last))
+
+    def consistent_dimension(self, target):
+        return len(target) == self.dim()
+
+    def validate_dimension(self, target):
+        if not self.consistent_dimension(target):
+            raise ValueError(
+                "Tried to validate a vector with inconsistent dimension. "
+                "Expected %s, got %s." % (self.dim(), len(target))
+            )
+        return target
+
+    def append(self, t, data):
+        """
+        data is a vector.
+        """
+        data = self.validate_dimension(data)
+        self.time.append(t)
+        for series, val in zip(self.values(), data):
+            series.append(val)
+
+    def extend(self, tpoints, data):
+        """
+        data is a matrix, with one row per series.
+        """
+        try:
+            # This allows data to be an OrderedDict
+            # or another VectorSeries.
+            data = list(data.values())
+        except AttributeError as ae:
+            if "values" not in str(ae):
+                raise ae
+        data = self.validate_dimension(data)
+        data = [np.asarray(series, dtype=float).ravel() for series in data]
+        tpoints = np.asarray(
+            tpoints.array if isinstance(tpoints, ArraySeries) else list(tpoints),
+            dtype=float,
+        ).ravel()
+        tolerance = self.time.tolerance
+        if len(self) != 0 and len(tpoints) != 0:
+            tlast = self.time[-1]
+            t0 = tpoints[0]
+            if tlast - tolerance <= t0 and t0 <= tlast + tolerance:
+                data0 = [series[0] for series in data]
+                if not self.consistent(data0):
+                    raise ValueError(
+                        "Tried to extend with series that overlapped at time "
+                        "point %s, but the series data was not consistent "
+                        "with pre-existing data." % t0
+                    )
+                tpoints = tpoints[1:]
+                data = [series[1:] for series in data]
+        self.time.extend(tpoints)
+        for series, new_data in zip(self.values(), data):
+            series.extend(new_data)
+
+    def window(self, t_start, t_end):
+        """
+        Returns the time points and an OrderedDict of data series in
+        the closed interval [t_start, t_end]. These are views of the
+        stored arrays, not copies, so they are only valid until the
+        series is next appended to or extended.
+        """
+        window = self.time.window_slice(t_start, t_end)
+        return (
+            self.time.array[window],
+            OrderedDict((key, series.array[window]) for key, series in self.items()),
+        )
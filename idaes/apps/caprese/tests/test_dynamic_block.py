@@ -13,6 +13,8 @@
 """ Tests for the dynamic model subclass of block
 """
 
+import gc
+
 import pyomo.environ as pyo
 import pyomo.dae as dae
 import pyomo.network as pyn
@@ -21,6 +23,8 @@ from pyomo.core.expr.visitor import identify_variables
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
 from pyomo.core.base.block import _BlockData, SubclassOf
 from pyomo.dae.flatten import flatten_dae_components
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 
 from idaes.core import (
     FlowsheetBlock,
@@ -35,6 +39,7 @@ from idaes.core.util.model_statistics import (
 )
 from idaes.core.util.initialization import initialize_by_time_element
 from idaes.core.util.exceptions import ConfigurationError
+from idaes.core.util.performance import PerformanceBaseClass
 from idaes.apps.caprese.tests.test_simple_model import (
     make_model,
     make_small_model,
@@ -954,6 +959,36 @@ class TestDynamicBlock(object):
                 for v in blk.component_objects(ctypes_to_not_shift):
                     assert v[t].value == t
 
+    @pytest.mark.unit
+    def test_shift_plan_cached(self):
+        blk = self.make_block()
+        time = blk.time
+        t0 = time.first()
+        tl = time.last()
+        shift = (tl - t0) / 2
+
+        dest, source = blk._get_shift_plan(shift, DiffVar)
+        n_shifted = len([t for t in time if t + shift <= tl + 1e-8])
+        assert (
+            len(dest)
+            == len(source)
+            == n_shifted * len(list(blk.component_objects(DiffVar)))
+        )
+        for var, source_var in zip(dest, source):
+            var_t = blk.vardata_map[var]
+            assert var_t is blk.vardata_map[source_var]
+
+        # The plan is reused for the same shift and ctypes
+        assert blk._get_shift_plan(shift, DiffVar) is blk._get_shift_plan(
+            shift, DiffVar
+        )
+        assert blk._get_shift_plan(shift, (DiffVar,)) is not blk._get_shift_plan(
+            shift, DiffVar
+        )
+        assert blk._get_shift_plan(shift, DiffVar) is not blk._get_shift_plan(
+            2 * shift, DiffVar
+        )
+
     @pytest.mark.unit
     def test_generate_time_in_sample(self):
         blk = self.make_block()
@@ -1244,3 +1279,90 @@ class TestDynamicBlock(object):
         # over, e.g., vectors.algebraic[:, :] would
         # fail due to inconsistent dimension.
         assert VC.ALGEBRAIC not in db.category_dict
+
+
+def _advance_by_time_by_component(blk, t_shift, ctype, tolerance=1e-8):
+    # Reference implementation that traverses the components at every
+    # time point.
+    time = blk.time
+    for t in time:
+        idx = time.find_nearest_index(t + t_shift, tolerance)
+        if idx is None:
+            continue
+        ts = time.at(idx)
+        for var in blk.component_objects(ctype):
+            var[t].set_value(var[ts].value)
+
+
+@pytest.mark.performance
+class TestAdvanceByTimePerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to advance a dynamic block by the sample time, shifting
+    each component at every time point and with the cached shift plan, for
+    increasing horizons.
+    """
+
+    ctype = (DiffVar, DerivVar, AlgVar, InputVar, FixedVar)
+    sample_time = 0.5
+    n_cycles = 5
+
+    def build_block(self, horizon):
+        from idaes.apps.caprese.examples.cstr_model import (
+            make_model as make_cstr_model,
+        )
+
+        m = make_cstr_model(horizon=horizon, ntfe=10 * horizon, ntcp=2)
+        blk = DynamicBlock(
+            model=m,
+            time=m.fs.time,
+            inputs=[
+                m.fs.mixer.S_inlet.flow_vol[0],
+                m.fs.mixer.E_inlet.flow_vol[0],
+            ],
+            measurements=[
+                m.fs.cstr.outlet.conc_mol[0, "C"],
+                m.fs.cstr.volume[0],
+            ],
+        )
+        blk.construct()
+        blk.set_sample_time(self.sample_time)
+        return blk
+
+    def set_values(self, blk):
+        for var in blk.component_objects(self.ctype):
+            for t in blk.time:
+                var[t].set_value(t)
+
+    def get_values(self, blk):
+        return [
+            var[t].value for var in blk.component_objects(self.ctype) for t in blk.time
+        ]
+
+    @pytest.mark.performance
+    def test_performance(self):
+        for horizon in [3, 6, 12]:
+            blk = self.build_block(horizon)
+            n_points = len(blk.time)
+
+            self.set_values(blk)
+            gc.collect()
+            timer = TicTocTimer()
+            for _ in range(self.n_cycles):
+                _advance_by_time_by_component(blk, self.sample_time, self.ctype)
+            self.recordData(
+                f"horizon {horizon}, by component",
+                timer.toc(f"horizon {horizon}, {n_points} time points: by component"),
+            )
+            values_old = self.get_values(blk)
+
+            self.set_values(blk)
+            gc.collect()
+            timer.tic(None)
+            for _ in range(self.n_cycles):
+                blk.advance_by_time(self.sample_time, ctype=self.ctype)
+            self.recordData(
+                f"horizon {horizon}, shift plan",
+                timer.toc(f"horizon {horizon}, {n_points} time points: shift plan"),
+            )
+
+            assert self.get_values(blk) == values_old
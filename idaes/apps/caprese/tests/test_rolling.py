@@ -13,11 +13,17 @@
 """ Tests for rolling horizon helper classes
 """
 
+import gc
 import pytest
 import sys
+import tracemalloc
 from collections import OrderedDict
+import numpy as np
 import pyomo.environ as pyo
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 from idaes.apps.caprese.rolling import *
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 class TestTimeList(object):
@@ -388,3 +394,196 @@ class TestVectorSeries(object):
             # Assuming that history_2.dim() != 1 ...
             history_2.extend([], [[]])
             assert "inconsistent dimension" in str(err)
+
+
+class TestArrayTimeList(object):
+    @pytest.mark.unit
+    def test_constructor(self):
+        empty_time_list = ArrayTimeList()
+        assert len(empty_time_list) == 0
+        assert not empty_time_list
+
+        tol = 0.49
+        time_list = ArrayTimeList(time=[1, 2, 3], tolerance=tol)
+        assert time_list.tolerance == tol
+        assert time_list == [1, 2, 3]
+        assert list(time_list) == [1.0, 2.0, 3.0]
+
+        with pytest.raises(ValueError, match="Time points must be increasing"):
+            ArrayTimeList(time=[1, 3, 2], tolerance=tol)
+        with pytest.raises(ValueError, match="separated by more than twice"):
+            ArrayTimeList(time=[1, 2, 3], tolerance=0.5)
+
+    @pytest.mark.unit
+    def test_append(self):
+        tol = 0.1
+        root_eps = sys.float_info.epsilon**0.5
+        time_list = ArrayTimeList([1, 2, 3], tolerance=tol)
+        assert time_list.is_within_bounds(3 + tol)
+        assert not time_list.is_within_bounds(3.5)
+
+        with pytest.raises(ValueError, match="Appended time values must be"):
+            time_list.append(3 + tol)
+
+        # Appending past the initial capacity grows the array
+        new_points = [3 + (i + 1) * (2 * tol + root_eps) for i in range(100)]
+        for t in new_points:
+            time_list.append(t)
+        assert time_list == [1, 2, 3] + new_points
+
+    @pytest.mark.unit
+    def test_extend(self):
+        time_list = ArrayTimeList([1, 2, 3], tolerance=0.1)
+
+        time_list.extend([4, 5])
+        assert time_list == [1, 2, 3, 4, 5]
+
+        # Overlapping boundary points are not duplicated
+        time_list.extend(np.array([5, 6, 7]))
+        assert time_list == [1, 2, 3, 4, 5, 6, 7]
+
+        with pytest.raises(ValueError, match="must not be earlier"):
+            time_list.extend([6.5, 8])
+        with pytest.raises(ValueError, match="separated by more than twice"):
+            time_list.extend([7.15, 8])
+        assert time_list.validate_extend([]) == []
+
+    @pytest.mark.unit
+    def test_find_nearest_index(self):
+        time_list = ArrayTimeList([1, 2, 3, 4, 5], tolerance=0.1)
+        reference = TimeList([1, 2, 3, 4, 5], tolerance=0.1)
+
+        for target in [0.5, 0.95, 1.0, 2.05, 2.5, 4.94, 5.05, 5.5]:
+            assert time_list.find_nearest_index(target) == (
+                reference.find_nearest_index(target)
+            )
+        assert ArrayTimeList().find_nearest_index(1.0) is None
+
+        targets = [0.5, 0.95, 2.05, 2.5, 5.05]
+        assert time_list.find_nearest_indices(targets).tolist() == [-1, 0, 1, -1, 4]
+
+        assert time_list.binary_search(2.05) == (True, 1)
+        assert time_list.binary_search(2.5) == (False, 2)
+        assert time_list.binary_search(0.5) == (False, 0)
+
+    @pytest.mark.unit
+    def test_window_slice(self):
+        time_list = ArrayTimeList(range(10), tolerance=0.1)
+        window = time_list.window_slice(2.05, 5)
+        assert window == slice(2, 6)
+        view = time_list[window]
+        assert view.tolist() == [2, 3, 4, 5]
+        # Slices are views of the stored time points
+        assert np.shares_memory(view, time_list.array)
+
+
+class TestArrayVectorSeries(object):
+    def make_series(self, time):
+        m = make_model()
+        data = OrderedDict(
+            [
+                (pyo.ComponentUID(_slice.referent), [_slice[t].value for t in time])
+                for _slice in m.v1_refs
+            ]
+        )
+        return m, ArrayVectorSeries(data, time=time, name="v1", tolerance=0.1)
+
+    @pytest.mark.unit
+    def test_constructor(self):
+        m, history = self.make_series(list(range(11)))
+        assert history.name == "v1"
+        assert type(history.time) is ArrayTimeList
+        assert history.time == m.time
+        assert history.dim() == len(m.space)
+        assert len(history) == len(m.time)
+        for _slice in m.v1_refs:
+            assert pyo.ComponentUID(_slice.referent) in history
+
+        assert len(ArrayVectorSeries()) == 0
+        with pytest.raises(ValueError, match="same length"):
+            ArrayVectorSeries(OrderedDict([("a", [1, 2])]), time=[1])
+
+    @pytest.mark.unit
+    def test_append_and_extend(self):
+        m, history = self.make_series(list(range(5)))
+
+        with pytest.raises(ValueError, match="inconsistent dimension"):
+            history.append(5, [1])
+        history.append(5, [5.0 for _ in m.space])
+
+        _, other = self.make_series(list(range(5, 11)))
+        history.extend(other.time, other)
+        vals = [1.0 * t for t in m.time]
+        for series in history.values():
+            assert series == vals
+        assert history.time == m.time
+
+        new_time = [10, 11, 13]
+        history.extend(new_time, [[1.0 * t for t in new_time] for _ in m.space])
+        for series in history.values():
+            assert series == vals + [11, 13]
+
+        with pytest.raises(ValueError, match="data was not consistent"):
+            history.extend([13, 14], [[26, 28] for _ in m.space])
+
+    @pytest.mark.unit
+    def test_window(self):
+        m, history = self.make_series(list(range(11)))
+        time, data = history.window(3, 6)
+        assert time.tolist() == [3, 4, 5, 6]
+        for key, series in data.items():
+            assert series.tolist() == [3, 4, 5, 6]
+            assert np.shares_memory(series, history[key].array)
+
+
+@pytest.mark.performance
+class TestArrayVectorSeriesPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to append, extend and search a long history with a
+    VectorSeries and an ArrayVectorSeries, and the memory they use.
+    """
+
+    # About 2.3 days of 1 second samples of a 10-dimensional vector
+    n_samples = 200000
+    dim = 10
+
+    @pytest.mark.performance
+    def test_performance(self):
+        n_samples = self.n_samples
+        dim = self.dim
+        memory = {}
+        for series_class in [VectorSeries, ArrayVectorSeries]:
+            name = series_class.__name__
+            gc.collect()
+            tracemalloc.start()
+            history = series_class(
+                OrderedDict((i, []) for i in range(dim)), time=[], tolerance=1e-8
+            )
+            timer = TicTocTimer()
+            for k in range(n_samples // 2):
+                history.append(float(k), [k + 0.1 * i for i in range(dim)])
+            self.recordData(
+                f"{name} append",
+                timer.toc(f"{name}: append {n_samples // 2} samples"),
+            )
+            new_time = [float(n_samples // 2 + k) for k in range(n_samples // 2)]
+            history.extend(
+                new_time, [[t + 0.1 * i for t in new_time] for i in range(dim)]
+            )
+            self.recordData(
+                f"{name} extend",
+                timer.toc(f"{name}: extend by {n_samples // 2} samples"),
+            )
+            for k in range(0, n_samples, 10):
+                history.time.find_nearest_index(k + 0.5e-8)
+            self.recordData(
+                f"{name} find_nearest_index",
+                timer.toc(f"{name}: {n_samples // 10} nearest index lookups"),
+            )
+            del new_time
+            memory[series_class], _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.recordData(f"{name} memory", memory[series_class])
+            assert len(history) == n_samples
+
+        assert memory[ArrayVectorSeries] < memory[VectorSeries]
@@ -10,12 +10,15 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
-import pandas as pd
 import pyomo.environ as pyo
 from pyomo.opt.base.solvers import OptSolver
 import os
 from abc import ABC, abstractmethod
-from idaes.apps.grid_integration.utils import convert_marginal_costs_to_actual_costs
+from idaes.apps.grid_integration.utils import (
+    convert_marginal_costs_to_actual_costs,
+    ModelSolver,
+    ResultsRecorder,
+)
 import datetime
 from pyomo.common.dependencies import attempt_import
 
@@ -256,6 +259,7 @@ class StochasticProgramBidder(AbstractBidder):
         n_scenario,
         solver,
         forecaster,
+        persistent_solver=False,
     ):
 
         """
@@ -274,6 +278,9 @@ class StochasticProgramBidder(AbstractBidder):
 
             forecaster: an initialized LMP forecaster object
 
+            persistent_solver: if True, keep the bidding models in persistent
+                               interfaces of the solver between the solves
+
         Returns:
             None
         """
@@ -293,8 +300,16 @@ class StochasticProgramBidder(AbstractBidder):
         self.day_ahead_model = self.formulate_DA_bidding_problem()
         self.real_time_model = self.formulate_RT_bidding_problem()
 
-        # declare a list to store results
-        self.bids_result_list = []
+        self.day_ahead_model_solver = ModelSolver(
+            self.solver, self.day_ahead_model, persistent=persistent_solver
+        )
+        self.real_time_model_solver = ModelSolver(
+            self.solver, self.real_time_model, persistent=persistent_solver
+        )
+
+        # columnar storage of the bids, replace it with a ResultsRecorder
+        # with a stream_path to stream results to disk
+        self.results_recorder = ResultsRecorder()
 
     def _set_up_bidding_problem(self, horizon):
         """
@@ -503,7 +518,12 @@ class StochasticProgramBidder(AbstractBidder):
         # update the price forecasts
         self._pass_price_forecasts(model, day_ahead_price, real_time_energy_price)
 
-        self.solver.solve(model, tee=True)
+        if model is self.day_ahead_model:
+            self.day_ahead_model_solver.solve(tee=True)
+        elif model is self.real_time_model:
+            self.real_time_model_solver.solve(tee=True)
+        else:
+            self.solver.solve(model, tee=True)
 
         bids = self._assemble_bids(
             model,
@@ -776,9 +796,7 @@ class StochasticProgramBidder(AbstractBidder):
 
         print("")
         print("Saving bidding results to disk...")
-        pd.concat(self.bids_result_list).to_csv(
-            os.path.join(path, "bidder_detail.csv"), index=False
-        )
+        self.results_recorder.write(os.path.join(path, "bidder_detail.csv"))
         self.bidding_model_object.write_results(
             path=os.path.join(path, "bidding_model_detail.csv")
         )
@@ -809,6 +827,7 @@ class SelfScheduler(StochasticProgramBidder):
         solver,
         forecaster,
         fixed_to_schedule=False,
+        persistent_solver=False,
     ):
         """
         Initializes the stochastic self-scheduler object.
@@ -828,6 +847,9 @@ class SelfScheduler(StochasticProgramBidder):
 
             fixed_to_schedule: If True, forece market simulator to give the same schedule.
 
+            persistent_solver: if True, keep the bidding models in persistent
+                               interfaces of the solver between the solves
+
         Returns:
             None
         """
@@ -839,6 +861,7 @@ class SelfScheduler(StochasticProgramBidder):
             n_scenario,
             solver,
             forecaster,
+            persistent_solver=persistent_solver,
         )
         self.fixed_to_schedule = fixed_to_schedule
 
@@ -968,9 +991,9 @@ class SelfScheduler(StochasticProgramBidder):
     def _record_bids(self, bids, date, hour, **kwargs):
 
         """
-        This function records the bids (schedule) we computed for the given date into a
-        DataFrame and temporarily stores the DataFrame in an instance attribute
-        list called bids_result_list.
+        This function records the bids (schedule) we computed for the given date into
+        the results recorder (results_recorder attribute) until they are written
+        to disk.
 
         Arguments:
             bids: the obtained bids (schedule) for this date.
@@ -984,7 +1007,7 @@ class SelfScheduler(StochasticProgramBidder):
 
         """
 
-        df_list = []
+        rows = []
         for t in bids:
             for g in bids[t]:
 
@@ -1001,12 +1024,11 @@ class SelfScheduler(StochasticProgramBidder):
                 for k, v in kwargs.items():
                     result_dict[k] = v
 
-                result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-                df_list.append(result_df.T)
+                rows.append(result_dict)
 
-        # save the result to object property
+        # save the result to the results recorder
         # wait to be written when simulation ends
-        self.bids_result_list.append(pd.concat(df_list))
+        self.results_recorder.append_rows(rows)
 
 
 class Bidder(StochasticProgramBidder):
@@ -1023,6 +1045,7 @@ class Bidder(StochasticProgramBidder):
         n_scenario,
         solver,
         forecaster,
+        persistent_solver=False,
     ):
 
         """
@@ -1041,6 +1064,9 @@ class Bidder(StochasticProgramBidder):
 
             forecaster: an initialized LMP forecaster object
 
+            persistent_solver: if True, keep the bidding models in persistent
+                               interfaces of the solver between the solves
+
         Returns:
             None
         """
@@ -1052,6 +1078,7 @@ class Bidder(StochasticProgramBidder):
             n_scenario,
             solver,
             forecaster,
+            persistent_solver=persistent_solver,
         )
 
     def _add_DA_bidding_constraints(self, model):
@@ -1249,12 +1276,10 @@ class Bidder(StochasticProgramBidder):
     def _record_bids(self, bids, date, hour, **kwargs):
 
         """
-        This method records the bids we computed for the given date into a
-        DataFrame. This DataFrame has the following columns: gen, date, hour,
-        power 1, ..., power n, price 1, ..., price n. And concatenate the
-        DataFrame into a class property 'bids_result_list'. The methods then
-        temporarily stores the DataFrame in an instance attribute list called
-        bids_result_list.
+        This method records the bids we computed for the given date into the
+        results recorder (results_recorder attribute) with the following
+        columns: gen, date, hour, power 1, ..., power n, price 1, ..., price n.
+        The results are written to disk when the simulation ends.
 
         Arguments:
             bids: the obtained bids for this date.
@@ -1268,7 +1293,7 @@ class Bidder(StochasticProgramBidder):
 
         """
 
-        df_list = []
+        rows = []
         for t in bids:
             for gen in bids[t]:
 
@@ -1293,11 +1318,10 @@ class Bidder(StochasticProgramBidder):
 
                     pair_cnt += 1
 
-                result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-                df_list.append(result_df.T)
+                rows.append(result_dict)
 
-        # save the result to object property
+        # save the result to the results recorder
         # wait to be written when simulation ends
-        self.bids_result_list.append(pd.concat(df_list))
+        self.results_recorder.append_rows(rows)
 
         return
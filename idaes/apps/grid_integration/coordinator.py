@@ -12,6 +12,7 @@
 #################################################################################
 from itertools import zip_longest
 
+import numpy as np
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.config import ConfigDict, ConfigValue
 import pyomo.environ as pyo
@@ -50,6 +51,10 @@ class DoubleLoopCoordinator:
         self.tracker = tracker
         self.projection_tracker = projection_tracker
 
+        # mapping between the tracker and projection tracker variables and
+        # params, built when the plugins are registered
+        self._tracking_model_map = None
+
     def register_plugins(self, context, options, plugin_config):
 
         """
@@ -67,6 +72,7 @@ class DoubleLoopCoordinator:
         """
 
         self.plugin_config = plugin_config
+        self._build_tracking_model_map()
 
         context.register_initialization_callback(self.initialize_customized_results)
         context.register_for_hourly_stats(self.push_hourly_stats_to_forecaster)
@@ -353,10 +359,11 @@ class DoubleLoopCoordinator:
 
         return full_projected_trajectory
 
-    def _clone_tracking_model(self):
+    def _build_tracking_model_map(self):
         """
-        Clone the model in tracker and replace that of projection tracker. In this
-        way, tracker and projection tracker have the same states before projection.
+        Pair the variables and mutable params of the tracker model with those
+        of the projection tracker model, so their values can be copied in bulk
+        by _clone_tracking_model.
 
         Arguments:
             None
@@ -365,9 +372,13 @@ class DoubleLoopCoordinator:
             None
         """
 
-        # iterate all the variables and params and clone the values
+        self._tracking_model_map = {}
+        seen = set()
+
         objects_list = [pyo.Var, pyo.Param]
         for obj in objects_list:
+            tracker_data = []
+            proj_tracker_data = []
             for tracker_obj, proj_tracker_obj in zip_longest(
                 self.tracker.model.component_objects(
                     obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
@@ -376,13 +387,62 @@ class DoubleLoopCoordinator:
                     obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
                 ),
             ):
-                if tracker_obj.name != proj_tracker_obj.name:
+                if (
+                    tracker_obj is None
+                    or proj_tracker_obj is None
+                    or tracker_obj.name != proj_tracker_obj.name
+                ):
                     raise ValueError(
                         f"Trying to copy the value of {tracker_obj} to {proj_tracker_obj}, but they do not have the same name and possibly not the corresponding objects. Please make sure tracker and projection tracker do not diverge. "
                     )
+                # immutable params can not be changed after construction
+                if obj is pyo.Param and not tracker_obj.mutable:
+                    continue
                 for idx in tracker_obj.index_set():
-                    if pyo.value(proj_tracker_obj[idx]) != pyo.value(tracker_obj[idx]):
-                        proj_tracker_obj[idx] = round(pyo.value(tracker_obj[idx]), 4)
+                    data = tracker_obj[idx]
+                    # references share their data with other components
+                    if id(data) in seen:
+                        continue
+                    seen.add(id(data))
+                    tracker_data.append(data)
+                    proj_tracker_data.append(proj_tracker_obj[idx])
+            self._tracking_model_map[obj] = (tracker_data, proj_tracker_data)
+
+        return
+
+    def _clone_tracking_model(self):
+        """
+        Clone the model in tracker and replace that of projection tracker. In this
+        way, tracker and projection tracker have the same states before projection.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+
+        if self._tracking_model_map is None:
+            self._build_tracking_model_map()
+
+        for obj, (tracker_data, proj_tracker_data) in self._tracking_model_map.items():
+            # only copy the values that differ, missing values are stored as nan
+            new_values = np.round(
+                np.array([d.value for d in tracker_data], dtype=float), 4
+            )
+            proj_tracker_values = np.array(
+                [d.value for d in proj_tracker_data], dtype=float
+            )
+            changed = (new_values != proj_tracker_values) & ~(
+                np.isnan(new_values) & np.isnan(proj_tracker_values)
+            )
+            for i in np.flatnonzero(changed).tolist():
+                value = None if np.isnan(new_values[i]) else float(new_values[i])
+                if obj is pyo.Var:
+                    # the values were validated in the tracker model
+                    proj_tracker_data[i].set_value(value, skip_validation=True)
+                else:
+                    proj_tracker_data[i].set_value(value)
 
         return
 
@@ -717,3 +717,436 @@ class Backcaster(AbstractPrescientPriceForecaster):
                 self._historical_da_prices[b] = self._historical_da_prices[b][24:]
 
         return
+
+
+class PriceRingBuffer:
+
+    """
+    Fixed size storage of the historical hourly prices of a set of buses. The
+    prices are held in one (number of buses, 24 * max_days) NumPy array, which
+    is used as a ring buffer of days: appending a day overwrites the oldest day
+    once the buffer is full, so no data is copied when the window moves. Buses
+    may have fewer days of prices than others, in which case their prices are
+    the most recent days in the buffer.
+    """
+
+    def __init__(self, buses, max_days):
+        """
+        Initialize the PriceRingBuffer.
+
+        Arguments:
+            buses: iterable of bus names
+
+            max_days: maximum number of days of prices to store
+
+        Returns:
+            None
+        """
+
+        self.buses = list(buses)
+        self.bus_index = {b: i for i, b in enumerate(self.buses)}
+        self.max_days = max_days
+        self._data = np.zeros((len(self.buses), 24 * max_days))
+        # position (in days) of the oldest day in the buffer and number of days stored
+        self._start = 0
+        self.n_days = 0
+        # number of days stored for each bus, the most recent ones
+        self.bus_days = np.zeros(len(self.buses), dtype=int)
+        # incremented whenever the stored prices change
+        self.version = 0
+
+    @classmethod
+    def from_dict(cls, price_dict, max_days):
+        """
+        Create a PriceRingBuffer from a dictionary of lists of hourly prices.
+        If more than max_days days are given, only the last max_days are kept.
+        The buses may have different numbers of days of prices.
+
+        Arguments:
+            price_dict: dictionary of list for historical hourly prices
+
+            max_days: maximum number of days of prices to store
+
+        Returns:
+            PriceRingBuffer
+        """
+
+        buffer = cls(price_dict, max_days)
+        bus_days = np.array([len(price_dict[b]) // 24 for b in buffer.buses])
+        bus_days = np.minimum(bus_days, max_days)
+        n_days = bus_days.max(initial=0)
+        # align the prices of all the buses at the most recent day
+        prices = np.zeros((len(buffer.buses), n_days * 24))
+        for i, b in enumerate(buffer.buses):
+            n_hours = bus_days[i] * 24
+            if n_hours > 0:
+                prices[i, -n_hours:] = price_dict[b][-n_hours:]
+        for day in prices.reshape(len(buffer.buses), n_days, 24).transpose(1, 0, 2):
+            buffer.append_day(day)
+        buffer.bus_days = bus_days
+        return buffer
+
+    def append_day(self, prices):
+        """
+        Store a day of prices, dropping the oldest day if the buffer is full.
+
+        Arguments:
+            prices: array of shape (number of buses, 24) with the hourly prices
+                    of each bus, in the order of self.buses
+
+        Returns:
+            None
+        """
+
+        if self.n_days < self.max_days:
+            day = self.n_days
+            self.n_days += 1
+        else:
+            day = self._start
+            self._start = (self._start + 1) % self.max_days
+        self._data[:, day * 24 : (day + 1) * 24] = prices
+        self.bus_days = np.minimum(self.bus_days + 1, self.max_days)
+        self.version += 1
+
+    def to_dict(self):
+        """
+        Return the stored prices in chronological order as a dictionary of lists.
+
+        Returns:
+            dict: historical hourly prices for each bus
+        """
+
+        hours = self._positions(np.arange(self.n_days * 24))
+        return {
+            b: row[(self.n_days - n) * 24 :].tolist()
+            for b, row, n in zip(self.buses, self._data[:, hours], self.bus_days)
+        }
+
+    def _positions(self, hours):
+        """
+        Convert chronological hour indices to positions in the buffer.
+        """
+
+        return (self._start * 24 + hours) % (self.max_days * 24)
+
+    def backcast(self, hour, horizon, n_samples, buses=None):
+        """
+        Create backcast price scenarios. Sample i starts at the given hour of the
+        (i % n_days + 1)-th most recent day and runs for horizon hours, wrapping
+        around to the oldest day when it passes the end of the stored prices,
+        where n_days is the number of days stored for the bus.
+
+        Arguments:
+            hour: first hour of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+            buses: list of buses to forecast, if None (default) all buses
+
+        Returns:
+            numpy.ndarray: array of shape (number of buses, n_samples, horizon)
+        """
+
+        if buses is None:
+            rows = np.arange(len(self.buses))
+        else:
+            rows = np.array([self.bus_index[b] for b in buses], dtype=int)
+        # (bus, sample, hour) arrays, hours are counted from the oldest day
+        # stored for each bus
+        n_days = self.bus_days[rows][:, None, None]
+        day_idx = n_days - np.arange(n_samples)[None, :, None] % n_days - 1
+        hours = (day_idx * 24 + hour + np.arange(horizon)[None, None, :]) % (
+            n_days * 24
+        )
+        hours += (self.n_days - n_days) * 24
+        return self._data[rows[:, None, None], self._positions(hours)]
+
+
+class RingBufferBackcaster(Backcaster):
+
+    """
+    Backcaster that stores the historical prices in NumPy ring buffers. Forecasts
+    of all the buses are generated together by a single indexing operation into
+    the ring buffer and cached until the historical prices change, so the
+    forecasts for many buses in the same hour only cost one lookup each.
+    """
+
+    def __init__(
+        self, historical_da_prices, historical_rt_prices, max_historical_days=10
+    ):
+        """
+        Initialize the RingBufferBackcaster.
+
+        Arguments:
+            historical_da_prices: dictionary of list for historical hourly day-ahead prices
+
+            historical_rt_prices: dictionary of list for historical hourly real-time prices
+
+            max_historical_days: maximum number of days of price data to store on the instance
+
+        Returns:
+            None
+        """
+
+        self._forecast_cache = {}
+        super().__init__(
+            historical_da_prices, historical_rt_prices, max_historical_days
+        )
+        rt_buses = self._rt_buffer.buses
+        self._current_day_rt_prices = np.zeros((len(rt_buses), 24))
+        self._current_hour = 0
+
+    @property
+    def historical_da_prices(self):
+
+        """
+        Property getter for historical_da_prices.
+
+        Returns:
+            dict: copy of the saved historical day-ahead prices
+        """
+
+        return self._da_buffer.to_dict()
+
+    @historical_da_prices.setter
+    def historical_da_prices(self, value):
+
+        """
+        Property setter for historical_da_prices (validate before setting).
+
+        Args:
+            value: intended value for historical_da_prices
+
+        Returns:
+            None
+        """
+
+        self._validate_input_historical_price(value)
+        self._da_buffer = PriceRingBuffer.from_dict(value, self.max_historical_days)
+        # the new buffer may have the same version as the old one
+        self._forecast_cache.clear()
+
+    @property
+    def historical_rt_prices(self):
+
+        """
+        Property getter for historical_rt_prices.
+
+        Returns:
+            dict: copy of the saved historical real-time prices
+        """
+
+        return self._rt_buffer.to_dict()
+
+    @historical_rt_prices.setter
+    def historical_rt_prices(self, value):
+
+        """
+        Property setter for historical_rt_prices (validate before setting).
+
+        Args:
+            value: intended value for historical_rt_prices
+
+        Returns:
+            None
+        """
+
+        self._validate_input_historical_price(value)
+        self._rt_buffer = PriceRingBuffer.from_dict(value, self.max_historical_days)
+        # the new buffer may have the same version as the old one
+        self._forecast_cache.clear()
+
+    def _market_buffer(self, market):
+
+        """
+        Return the ring buffer holding the prices of a market.
+        """
+
+        return self._da_buffer if market == "day-ahead" else self._rt_buffer
+
+    def forecast_all_buses(self, market, hour, horizon, n_samples):
+
+        """
+        Forecast the prices of all buses with historical prices.
+
+        Arguments:
+            market: the market to forecast, "day-ahead" or "real-time"
+
+            hour: intended hour of the forecasts (day-ahead forecasts always
+                  start at hour 0, as in forecast_day_ahead_prices)
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            dict: price forecasts as a (n_samples, horizon) array for each bus,
+                  the arrays are shared with the forecast cache and should not
+                  be modified
+        """
+
+        if market == "day-ahead":
+            hour = 0
+        buffer = self._market_buffer(market)
+        key = (market, hour, horizon, n_samples)
+        cached = self._forecast_cache.get(key)
+        if cached is None or cached[0] != buffer.version:
+            forecasts = buffer.backcast(hour, horizon, n_samples)
+            cached = (
+                buffer.version,
+                {b: forecasts[i] for i, b in enumerate(buffer.buses)},
+            )
+            self._forecast_cache[key] = cached
+        return cached[1]
+
+    def forecast_real_time_prices(self, date, hour, bus, horizon, n_samples):
+
+        """
+        Forecast real-time market prices.
+
+        Arguments:
+            date: intended date of the forecasts
+
+            hour: intended hour of the forecasts
+
+            bus: intended bus of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            dict: real-time price forecasts
+
+        """
+
+        return self._forecast(
+            historical_price_dict=None,
+            market="real-time",
+            date=date,
+            hour=hour,
+            bus=bus,
+            horizon=horizon,
+            n_samples=n_samples,
+        )
+
+    def forecast_day_ahead_prices(self, date, hour, bus, horizon, n_samples):
+
+        """
+        Forecast day-ahead market prices.
+
+        Arguments:
+            date: intended date of the forecasts
+
+            hour: intended hour of the forecasts
+
+            bus: intended bus of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            dict: day-ahead price forecasts
+
+        """
+
+        return self._forecast(
+            historical_price_dict=None,
+            market="day-ahead",
+            date=date,
+            hour=0,
+            bus=bus,
+            horizon=horizon,
+            n_samples=n_samples,
+        )
+
+    def _forecast(
+        self, historical_price_dict, market, date, hour, bus, horizon, n_samples
+    ):
+        """
+        Forecast energy market prices using historical prices.
+
+        Arguments:
+
+            historical_price_dict: not used, the prices are taken from the
+                                   ring buffer of the market
+
+            market: the market that the price forecast is for, e.g., day-ahead
+
+            date: intended date of the forecasts
+
+            hour: intended hour of the forecasts
+
+            bus: intended bus of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            dict: price forecasts
+
+        """
+
+        if bus not in self._market_buffer(market).bus_index:
+            raise ForecastError(f"No {bus} {market} price available.")
+
+        forecasts = self.forecast_all_buses(market, hour, horizon, n_samples)[bus]
+
+        return dict(enumerate(forecasts.tolist()))
+
+    def fetch_hourly_stats_from_prescient(self, prescient_hourly_stats):
+
+        """
+        This method fetches the hourly real-time prices from Prescient and store
+        them on the price forecaster, once they are published. Once a full day of
+        prices is available, it is added to the ring buffer, which drops the
+        oldest day when it is full.
+
+        Arguments:
+            prescient_hourly_stats: Prescient HourlyStats object.
+
+        Returns:
+            None
+        """
+
+        lmps = prescient_hourly_stats.observed_bus_LMPs
+        self._current_day_rt_prices[:, self._current_hour] = [
+            lmps[b] for b in self._rt_buffer.buses
+        ]
+        self._current_hour += 1
+
+        # if a full day's data is ready, get them ready for future forecasts
+        if self._current_hour == 24:
+            self._rt_buffer.append_day(self._current_day_rt_prices)
+            self._current_hour = 0
+
+        return
+
+    def fetch_day_ahead_stats_from_prescient(self, uc_date, uc_hour, day_ahead_result):
+
+        """
+        This method fetches the hourly day-ahead prices from Prescient and store
+        them on the price forecaster, once they are published. The ring buffer
+        drops the oldest day when it is full.
+
+        Arguments:
+            ruc_date: the date of the day-ahead market we bid into.
+
+            ruc_hour: the hour the RUC is being solved in the day before.
+
+            day_ahead_result: a Prescient RucPlan object.
+
+        Returns:
+            None
+        """
+
+        da_prices = day_ahead_result.ruc_market.day_ahead_prices
+        self._da_buffer.append_day(
+            [[da_prices.get((b, t)) for t in range(24)] for b in self._da_buffer.buses]
+        )
+
+        return
@@ -13,7 +13,7 @@
 import pyomo.environ as pyo
 from pyomo.common.timing import TicTocTimer
 from idaes.core.solvers import get_solver
-from idaes.core.util import from_json, to_json
+from idaes.core.util import StateLoader
 import matplotlib.pyplot as plt
 import logging
 
@@ -44,6 +44,8 @@ class MultiPeriodModel(pyo.ConcreteModel):
         unfix_dof_options: dictionary containing the arguments needed for `unfix_dof_func`
         solver: pyomo solver object
         outlvl: logging level
+        use_template_build: If True, `build_stochastic_multi_period` constructs the
+                            flowsheet once and clones it for every period
 
     Returns:
         (stochastic) multi-period optimization model
@@ -66,6 +68,7 @@ class MultiPeriodModel(pyo.ConcreteModel):
         unfix_dof_options={},
         solver=None,
         outlvl=logging.WARNING,
+        use_template_build=False,
     ):  # , state_variable_func=None):
 
         super().__init__()
@@ -83,6 +86,8 @@ class MultiPeriodModel(pyo.ConcreteModel):
         # populated on 'build_multi_period_model'
         self._first_active_time = None
 
+        self._use_template_build = use_template_build
+
         # Create sets
         if use_stochastic_build:
             self.set_time = pyo.RangeSet(n_time_points)
@@ -133,6 +138,7 @@ class MultiPeriodModel(pyo.ConcreteModel):
         initialization_options={},
         unfix_dof_options={},
         solver=None,
+        use_template=False,
     ):
         """
         Build a multi-period capable model using user-provided functions
@@ -146,6 +152,12 @@ class MultiPeriodModel(pyo.ConcreteModel):
             initialization_options: dict containing the arguments needed for `initialization_func`
             unfix_dof_options: dict containing the arguments needed for `unfix_dof_func`
             solver: pyomo solver object
+            use_template: if True, `create_process_model` is called once without
+                          arguments and the flowsheet is cloned for every time.
+                          The keys of each `model_data_kwargs` dictionary must then
+                          be names of mutable parameters or variables of the
+                          flowsheet, which are set to the given values (a dict of
+                          values sets the elements of indexed components).
         """
         # use default empty dictionaries if no kwargs dict provided
         if model_data_kwargs == None:
@@ -161,11 +173,35 @@ class MultiPeriodModel(pyo.ConcreteModel):
 
         # create user defined steady-state models. Each block is a multi-period capable model.
         m.blocks = pyo.Block(m.TIME)
-        for t in m.TIME:
-            _logger.info(f"...Constructing the flowsheet model for {m.blocks[t].name}")
-            m.blocks[t].process = self.create_process_model(**model_data_kwargs[t])
+        if use_template:
+            t_first = m.TIME.first()
+            template = self.create_process_model()
+            build_time = timer.toc("Constructed the template flowsheet model.")
+            for t in m.TIME.data()[1:]:
+                _logger.info(f"...Cloning the flowsheet model for {m.blocks[t].name}")
+                m.blocks[t].process = template.clone()
+            m.blocks[t_first].process = template
+            for t in m.TIME:
+                self._set_model_data(m.blocks[t].process, model_data_kwargs[t])
+            build_time += timer.toc(
+                f"Cloned the template flowsheet model for "
+                f"{self.n_time_points - 1} time periods and set the period data."
+            )
+            timer.toc(
+                f"Completed the formulation of the multiperiod optimization problem "
+                f"({build_time / self.n_time_points:.3g} s per time period)."
+            )
+
+        else:
+            for t in m.TIME:
+                _logger.info(
+                    f"...Constructing the flowsheet model for {m.blocks[t].name}"
+                )
+                m.blocks[t].process = self.create_process_model(**model_data_kwargs[t])
 
-        timer.toc("Completed the formulation of the multiperiod optimization problem.")
+            timer.toc(
+                "Completed the formulation of the multiperiod optimization problem."
+            )
 
         if solver is None:
             solver = get_solver()
@@ -269,6 +305,30 @@ class MultiPeriodModel(pyo.ConcreteModel):
         """
         return [b.process for b in self.blocks.values() if b.process.active]
 
+    @staticmethod
+    def _set_model_data(blk, model_data):
+        """
+        Set the values of the components of `blk` named by the keys of
+        `model_data`, used to apply the period data to a cloned flowsheet
+        """
+        for name, val in model_data.items():
+            comp = blk.find_component(name)
+            if comp is None:
+                raise Exception(
+                    f"{blk.name} does not have a component named {name}. When "
+                    f"building the multiperiod model from a template, the keys of "
+                    f"model_data_kwargs must be names of mutable parameters or "
+                    f"variables of the flowsheet model."
+                )
+            if isinstance(val, dict):
+                for idx, v in val.items():
+                    comp[idx].set_value(v)
+            elif comp.is_indexed():
+                for c in comp.values():
+                    c.set_value(val)
+            else:
+                comp.set_value(val)
+
     def _create_linking_constraints(self, b1, variable_pairs):
         """
         Create linking constraint on `b1` using `variable_pairs`
@@ -319,15 +379,32 @@ class MultiPeriodModel(pyo.ConcreteModel):
 
         self.set_period = pyo.Set(initialize=set_period)
 
+        # Begin the formulation of the multiperiod optimization problem
+        timer = TicTocTimer()  # Create timer object
+        timer.toc("Beginning the formulation of the multiperiod optimization problem.")
+
+        if self._use_template_build:
+            # Construct the flowsheet once, the period blocks are clones of it
+            template = pyo.ConcreteModel()
+            self.create_process_model(template, **flowsheet_options)
+            build_time = timer.toc("Constructed the template flowsheet model.")
+
         # Define a function to create a multiperiod model for one scenario
         def _build_scenario_model(m):
             m.period = pyo.Block(self.set_period)
 
             for i in m.period:
-                _logger.info(
-                    f"...Constructing the flowsheet model for {m.period[i].name}"
-                )
-                self.create_process_model(m.period[i], **flowsheet_options)
+                if self._use_template_build:
+                    _logger.info(
+                        f"...Cloning the flowsheet model for {m.period[i].name}"
+                    )
+                    m.period[i].transfer_attributes_from(template.clone())
+
+                else:
+                    _logger.info(
+                        f"...Constructing the flowsheet model for {m.period[i].name}"
+                    )
+                    self.create_process_model(m.period[i], **flowsheet_options)
 
             # link blocks together. loop over every time index except the last one
             if self.get_linking_variable_pairs is None:
@@ -399,10 +476,6 @@ class MultiPeriodModel(pyo.ConcreteModel):
                     f"constraints, so the user needs to add them manually."
                 )
 
-        # Begin the formulation of the multiperiod optimization problem
-        timer = TicTocTimer()  # Create timer object
-        timer.toc("Beginning the formulation of the multiperiod optimization problem.")
-
         if self._stochastic_model:
             self.scenario = pyo.Block(self.set_scenarios)
 
@@ -413,7 +486,22 @@ class MultiPeriodModel(pyo.ConcreteModel):
         else:
             _build_scenario_model(self)
 
-        timer.toc("Completed the formulation of the multiperiod optimization problem.")
+        if self._use_template_build:
+            n_periods = len(self.set_period)
+            if self._stochastic_model:
+                n_periods *= len(self.set_scenarios)
+            build_time += timer.toc(
+                f"Constructed {n_periods} period blocks from the template flowsheet model."
+            )
+            timer.toc(
+                f"Completed the formulation of the multiperiod optimization problem "
+                f"({build_time / n_periods:.3g} s per period)."
+            )
+
+        else:
+            timer.toc(
+                "Completed the formulation of the multiperiod optimization problem."
+            )
 
         self.initialize_multi_period_model(
             flowsheet_options, initialization_options, solver, True, timer
@@ -458,25 +546,22 @@ class MultiPeriodModel(pyo.ConcreteModel):
                 f"initialization_func argument."
             )
 
-        # Store the initialized model in `init_model` object
-        init_model = to_json(blk, return_dict=True)
+        # Compile the state of the initialized model once, so that it can be
+        # loaded into each period block without matching component names
+        init_model = StateLoader(blk)
         timer.toc("Created an instance of the flowsheet and initialized it.")
 
         # Initialize the multiperiod optimization model
         if use_stochastic_build:
             if self._stochastic_model:
                 for s in self.set_scenarios:
-                    for p in self.scenario[s].period:
-                        from_json(self.scenario[s].period[p], sd=init_model)
+                    init_model.load_all(self.scenario[s].period.values())
 
             else:
-                for p in self.period:
-                    from_json(self.period[p], sd=init_model)
+                init_model.load_all(self.period.values())
 
         else:
-            blks = self.get_active_process_blocks()
-            for blk in blks:
-                from_json(blk, init_model)
+            init_model.load_all(self.get_active_process_blocks())
 
         timer.toc("Initialized the entire multiperiod optimization model.")
 
@@ -15,12 +15,20 @@
 
 __author__ = "Radhakrishna Tumbalam Gooty"
 
+import gc
 import pytest
 import matplotlib.pyplot as plt
 import pyomo.environ as pyo
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 from idaes.core import FlowsheetBlock
 from idaes.apps.grid_integration.multiperiod.multiperiod import MultiPeriodModel
-from idaes.core.util.model_statistics import degrees_of_freedom
+from idaes.core.util.model_statistics import (
+    degrees_of_freedom,
+    number_variables,
+    number_total_constraints,
+)
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 def build_flowsheet(m=None):
@@ -490,3 +498,148 @@ def test_multi_period_model_manual(build_multi_period_model_manual):
     assert len(m.blocks) == 5
 
     assert degrees_of_freedom(m) == 1
+
+
+def build_flowsheet_with_lmp(m=None):
+    """This function builds a dummy flowsheet with a parameter for the LMP"""
+    m = build_flowsheet(m)
+    m.fs.lmp = pyo.Param(initialize=0, mutable=True)
+    m.fs.cost = pyo.Param([1, 2], initialize=0, mutable=True)
+    m.fs.revenue = pyo.Expression(expr=m.fs.lmp * m.fs.x)
+
+    return m
+
+
+@pytest.mark.unit
+def test_multi_period_model_template():
+    m = MultiPeriodModel(
+        n_time_points=5,
+        process_model_func=build_flowsheet_with_lmp,
+        linking_variable_func=get_linking_variable_pairs,
+        unfix_dof_func=unfix_dof,
+    )
+    m.build_multi_period_model(
+        model_data_kwargs={
+            t: {"fs.lmp": 10 * t, "fs.cost": {1: t, 2: 2 * t}, "fs.x": 0.1}
+            for t in range(5)
+        },
+        use_template=True,
+    )
+
+    assert len(m.blocks) == 5
+    blks = m.get_active_process_blocks()
+    assert len(blks) == 5
+    for t, b in enumerate(blks):
+        assert pyo.value(b.fs.lmp) == 10 * t
+        assert pyo.value(b.fs.cost[1]) == t
+        assert pyo.value(b.fs.cost[2]) == 2 * t
+        assert pyo.value(b.fs.revenue) == pytest.approx(t)
+        # the cloned blocks only reference their own components
+        assert b.fs.con1.body.args[0] is b.fs.x
+    for t in range(4):
+        assert hasattr(m.blocks[t].process, "link_constraints")
+
+    assert degrees_of_freedom(m) == 1
+
+
+@pytest.mark.unit
+def test_multi_period_model_template_missing_component():
+    m = MultiPeriodModel(
+        n_time_points=2,
+        process_model_func=build_flowsheet_with_lmp,
+        linking_variable_func=get_linking_variable_pairs,
+    )
+    with pytest.raises(Exception, match="does not have a component named fs.price"):
+        m.build_multi_period_model(
+            model_data_kwargs={t: {"fs.price": t} for t in range(2)},
+            use_template=True,
+        )
+
+
+@pytest.mark.unit
+def test_multi_day_stochastic_model_template():
+    m = MultiPeriodModel(
+        n_time_points=5,
+        process_model_func=build_flowsheet,
+        linking_variable_func=get_linking_variable_pairs,
+        use_stochastic_build=True,
+        use_template_build=True,
+        set_days=["d1", "d2"],
+        set_scenarios=[1, 2, 3],
+        unfix_dof_func=unfix_dof,
+    )
+
+    for s in m.scenario:
+        for d in ["d1", "d2"]:
+            for t in [1, 2, 3, 4, 5]:
+                b = m.scenario[s].period[t, d]
+                assert b.fs.con1.body.args[0] is b.fs.x
+
+                if t != 5:
+                    assert hasattr(
+                        m.scenario[s].link_constraints[t, d], "link_constraints"
+                    )
+
+    assert degrees_of_freedom(m) == 6  # num_days * num_scenarios
+
+
+def build_heater_flash(m=None):
+    """This function builds a heater and flash flowsheet"""
+    from idaes.models.unit_models import Flash, Heater
+    from idaes.models.properties.modular_properties.base.generic_property import (
+        GenericParameterBlock,
+    )
+    from idaes.models.properties.modular_properties.examples.BT_ideal import (
+        configuration,
+    )
+
+    if m is None:
+        m = pyo.ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.properties = GenericParameterBlock(**configuration)
+    m.fs.heater = Heater(property_package=m.fs.properties)
+    m.fs.flash = Flash(property_package=m.fs.properties)
+    m.fs.lmp = pyo.Param(initialize=0, mutable=True)
+    return m
+
+
+@pytest.mark.performance
+class TestMultiPeriodTemplatePerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to build a multi-period model of a heater and flash
+    flowsheet by calling the process model function for each period and by
+    replicating a template period.
+    """
+
+    n_time_points = 24
+
+    def get_pairs(self, m1, m2):
+        return [(m1.fs.heater.heat_duty[0], m2.fs.heater.heat_duty[0])]
+
+    @pytest.mark.performance
+    def test_performance(self):
+        n = self.n_time_points
+        data = {t: {"fs.lmp": t} for t in range(n)}
+        models = {}
+        for use_template in [False, True]:
+            m = MultiPeriodModel(
+                n_time_points=n,
+                process_model_func=build_heater_flash,
+                linking_variable_func=self.get_pairs,
+            )
+            gc.collect()
+            timer = TicTocTimer()
+            m.build_multi_period_model(
+                model_data_kwargs=data if use_template else None,
+                use_template=use_template,
+            )
+            self.recordData(
+                f"build model, use_template={use_template}",
+                timer.toc(f"Built {n} periods, use_template={use_template}"),
+            )
+            models[use_template] = m
+
+        assert number_variables(models[True]) == number_variables(models[False])
+        assert number_total_constraints(models[True]) == number_total_constraints(
+            models[False]
+        )
@@ -11,9 +11,18 @@
 # license information.
 #################################################################################
 
+import gc
 import pytest
+import numpy as np
 from pyomo.common import unittest as pyo_unittest
-from idaes.apps.grid_integration.forecaster import ForecastError, Backcaster
+from pyomo.common.timing import TicTocTimer
+from idaes.apps.grid_integration.forecaster import (
+    ForecastError,
+    Backcaster,
+    PriceRingBuffer,
+    RingBufferBackcaster,
+)
+from idaes.core.util.performance import PerformanceBaseClass
 import idaes.logger as idaeslog
 
 
@@ -325,3 +334,248 @@ def test_fetch_day_ahead_stats_from_prescient(base_backcaster, historical_da_pri
         first=expected_historical_da_prices,
         second=base_backcaster._historical_da_prices,
     )
+
+
+@pytest.fixture
+def ring_buffer_backcaster(historical_da_prices, historical_rt_prices):
+    return RingBufferBackcaster(historical_da_prices, historical_rt_prices)
+
+
+@pytest.mark.unit
+def test_price_ring_buffer():
+    buffer = PriceRingBuffer(["b1", "b2"], max_days=2)
+    assert buffer.n_days == 0
+    for day in range(3):
+        buffer.append_day(np.array([[day] * 24, [10 * day] * 24]))
+
+    assert buffer.n_days == 2
+    assert buffer.version == 3
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=buffer.to_dict(),
+        second={"b1": [1] * 24 + [2] * 24, "b2": [10] * 24 + [20] * 24},
+    )
+
+    # most recent day first, wrapping around to the oldest day
+    forecasts = buffer.backcast(hour=20, horizon=8, n_samples=3)
+    assert forecasts.shape == (2, 3, 8)
+    np.testing.assert_array_equal(forecasts[0, 0], [2] * 4 + [1] * 4)
+    np.testing.assert_array_equal(forecasts[0, 1], [1] * 4 + [2] * 4)
+    np.testing.assert_array_equal(forecasts[0, 2], [2] * 4 + [1] * 4)
+    np.testing.assert_array_equal(
+        buffer.backcast(hour=20, horizon=8, n_samples=3, buses=["b2"])[0],
+        forecasts[1],
+    )
+
+
+@pytest.mark.unit
+def test_price_ring_buffer_from_dict():
+    buffer = PriceRingBuffer.from_dict(
+        {"b1": [1] * 24 + [2] * 24 + [3] * 24}, max_days=2
+    )
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=buffer.to_dict(), second={"b1": [2] * 24 + [3] * 24}
+    )
+
+
+@pytest.mark.unit
+def test_price_ring_buffer_different_days():
+    prices = {"b1": [1] * 24 + [2] * 24 + [3] * 24, "b2": [20] * 24}
+    buffer = PriceRingBuffer.from_dict(prices, max_days=5)
+    np.testing.assert_array_equal(buffer.bus_days, [3, 1])
+    pyo_unittest.assertStructuredAlmostEqual(first=buffer.to_dict(), second=prices)
+
+    forecasts = buffer.backcast(hour=20, horizon=8, n_samples=2)
+    np.testing.assert_array_equal(forecasts[0, 0], [3] * 4 + [1] * 4)
+    np.testing.assert_array_equal(forecasts[0, 1], [2] * 4 + [3] * 4)
+    np.testing.assert_array_equal(forecasts[1], [[20] * 8] * 2)
+
+    buffer.append_day(np.array([[4] * 24, [40] * 24]))
+    np.testing.assert_array_equal(buffer.bus_days, [4, 2])
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=buffer.to_dict(),
+        second={"b1": prices["b1"] + [4] * 24, "b2": [20] * 24 + [40] * 24},
+    )
+
+
+@pytest.mark.unit
+def test_ring_buffer_backcaster_different_days(historical_rt_prices):
+    historical_da_prices = {
+        "b1": [1] * 24 + [2] * 24 + [3] * 24,
+        "b2": list(range(24)),
+    }
+    base = Backcaster(
+        {b: list(p) for b, p in historical_da_prices.items()}, historical_rt_prices
+    )
+    ring_buffer = RingBufferBackcaster(
+        {b: list(p) for b, p in historical_da_prices.items()}, historical_rt_prices
+    )
+    for bus in historical_da_prices:
+        pyo_unittest.assertStructuredAlmostEqual(
+            first=ring_buffer.forecast_day_ahead_prices(
+                date=None, hour=0, bus=bus, horizon=36, n_samples=4
+            ),
+            second=base.forecast_day_ahead_prices(
+                date=None, hour=0, bus=bus, horizon=36, n_samples=4
+            ),
+        )
+
+
+@pytest.mark.unit
+def test_create_ring_buffer_backcaster(historical_da_prices, historical_rt_prices):
+    backcaster = RingBufferBackcaster(historical_da_prices, historical_rt_prices)
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=backcaster.historical_da_prices, second=historical_da_prices
+    )
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=backcaster.historical_rt_prices, second=historical_rt_prices
+    )
+
+    with pytest.raises(TypeError, match=r".*bus test_bus is not a list object.*"):
+        RingBufferBackcaster({"test_bus": {1, 2, 3}}, historical_rt_prices)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "hour, horizon, n_samples", [(0, 48, 2), (18, 4, 3), (5, 100, 7)]
+)
+def test_ring_buffer_backcaster_forecasts(
+    hour, horizon, n_samples, base_backcaster, ring_buffer_backcaster
+):
+    for forecaster in ["forecast_real_time_prices", "forecast_day_ahead_prices"]:
+        expected_forecasts = getattr(base_backcaster, forecaster)(
+            date="2022-05-11",
+            hour=hour,
+            bus="test_bus",
+            horizon=horizon,
+            n_samples=n_samples,
+        )
+        result_forecasts = getattr(ring_buffer_backcaster, forecaster)(
+            date="2022-05-11",
+            hour=hour,
+            bus="test_bus",
+            horizon=horizon,
+            n_samples=n_samples,
+        )
+        pyo_unittest.assertStructuredAlmostEqual(
+            first=result_forecasts, second=expected_forecasts
+        )
+
+
+@pytest.mark.unit
+def test_ring_buffer_backcaster_nonexistent_bus(ring_buffer_backcaster):
+    with pytest.raises(
+        ForecastError, match=r"No test_bussss real-time price available"
+    ):
+        ring_buffer_backcaster.forecast_real_time_prices(
+            date="2022-05-11", hour=18, bus="test_bussss", horizon=4, n_samples=3
+        )
+
+
+@pytest.mark.unit
+def test_ring_buffer_backcaster_fetch_hourly_stats(ring_buffer_backcaster):
+    forecasts = ring_buffer_backcaster.forecast_all_buses(
+        "real-time", hour=0, horizon=24, n_samples=1
+    )
+    np.testing.assert_array_equal(forecasts["test_bus"], [[30] * 24])
+
+    days = 8
+    target_lmp = []
+    for day in range(days):
+        for t in range(24):
+            prescient_hourly_stats = MockPrescientHourlyStats({"test_bus": day * 10})
+            ring_buffer_backcaster.fetch_hourly_stats_from_prescient(
+                prescient_hourly_stats
+            )
+            target_lmp.append(day * 10)
+
+    expected_historical_rt_prices = [20] * 24 + [30] * 24 + target_lmp
+
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=expected_historical_rt_prices,
+        second=ring_buffer_backcaster.historical_rt_prices["test_bus"],
+    )
+
+    # cached forecasts are updated with the new prices
+    forecasts = ring_buffer_backcaster.forecast_all_buses(
+        "real-time", hour=0, horizon=24, n_samples=1
+    )
+    np.testing.assert_array_equal(forecasts["test_bus"], [[70] * 24])
+
+
+@pytest.mark.unit
+def test_ring_buffer_backcaster_set_historical_prices(ring_buffer_backcaster):
+    for market in ["day-ahead", "real-time"]:
+        forecasts = ring_buffer_backcaster.forecast_all_buses(
+            market, hour=0, horizon=24, n_samples=1
+        )
+        assert forecasts["test_bus"][0, 0] != 7
+
+    # replacing the historical prices invalidates the cached forecasts
+    ring_buffer_backcaster.historical_da_prices = {"test_bus": [7] * 72}
+    ring_buffer_backcaster.historical_rt_prices = {"test_bus": [7] * 72}
+
+    for market in ["day-ahead", "real-time"]:
+        forecasts = ring_buffer_backcaster.forecast_all_buses(
+            market, hour=0, horizon=24, n_samples=1
+        )
+        np.testing.assert_array_equal(forecasts["test_bus"], [[7] * 24])
+
+
+@pytest.mark.unit
+def test_ring_buffer_backcaster_fetch_day_ahead_stats(ring_buffer_backcaster):
+    for i in range(ring_buffer_backcaster.max_historical_days + 1):
+        da_price = {"test_bus": [i] * 24}
+        day_ahead_result = MockPrescientRucPlan(da_price)
+        ring_buffer_backcaster.fetch_day_ahead_stats_from_prescient(
+            None, None, day_ahead_result
+        )
+
+    expected_historical_da_prices = {"test_bus": []}
+    for i in range(1, ring_buffer_backcaster.max_historical_days + 1):
+        expected_historical_da_prices["test_bus"] += [i] * 24
+
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=expected_historical_da_prices,
+        second=ring_buffer_backcaster.historical_da_prices,
+    )
+
+
+@pytest.mark.performance
+class TestRingBufferBackcasterPerformance(PerformanceBaseClass, pyo_unittest.TestCase):
+    """
+    Record the time to forecast the prices of many buses every hour of a day
+    with the Backcaster and the RingBufferBackcaster.
+    """
+
+    n_buses = 300
+
+    @pytest.mark.performance
+    def test_performance(self):
+        rng = np.random.RandomState(42)
+        prices = {
+            f"bus_{i}": list(rng.uniform(0, 50, 24 * 10)) for i in range(self.n_buses)
+        }
+
+        forecasts = {}
+        for forecaster_class in [Backcaster, RingBufferBackcaster]:
+            forecaster = forecaster_class(
+                {b: list(p) for b, p in prices.items()},
+                {b: list(p) for b, p in prices.items()},
+            )
+            gc.collect()
+            timer = TicTocTimer()
+            for hour in range(24):
+                stats = MockPrescientHourlyStats({b: 20.0 for b in prices})
+                forecaster.fetch_hourly_stats_from_prescient(stats)
+                for bus in prices:
+                    forecast = forecaster.forecast_day_ahead_and_real_time_prices(
+                        date=None, hour=hour, bus=bus, horizon=48, n_samples=10
+                    )
+            name = forecaster_class.__name__
+            self.recordData(name, timer.toc(f"{name}: 24 hours, {self.n_buses} buses"))
+            # forecasts of the last bus
+            forecasts[forecaster_class] = forecast
+
+        pyo_unittest.assertStructuredAlmostEqual(
+            first=forecasts[RingBufferBackcaster], second=forecasts[Backcaster]
+        )
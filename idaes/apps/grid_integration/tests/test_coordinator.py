@@ -10,9 +10,12 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
+import gc
 import pytest
+from itertools import zip_longest
 
 import pyomo.environ as pyo
+from pyomo.common.timing import TicTocTimer
 from idaes.apps.grid_integration.bidder import Bidder
 from idaes.apps.grid_integration.tracker import Tracker
 from idaes.apps.grid_integration.coordinator import DoubleLoopCoordinator
@@ -22,6 +25,7 @@ from idaes.apps.grid_integration.tests.util import (
     testing_model_data,
 )
 from pyomo.common import unittest as pyo_unittest
+from idaes.core.util.performance import PerformanceBaseClass
 
 tracking_horizon = 4
 day_ahead_bidding_horizon = 48
@@ -133,3 +137,132 @@ def test_assemble_sced_tracking_market_signals(coordinator_object):
         tracking_horizon=tracking_horizon,
     )
     pyo_unittest.assertStructuredAlmostEqual(first=signal, second=expected_signal)
+
+
+@pytest.mark.unit
+def test_clone_tracking_model(coordinator_object):
+
+    tracker_model = coordinator_object.tracker.model
+    proj_tracker_model = coordinator_object.projection_tracker.model
+
+    # change the states of the tracker
+    for t in tracker_model.fs.P_T:
+        tracker_model.fs.P_T[t].value = 10.123456 + t
+    tracker_model.fs.pre_P_T = 25
+    tracker_model.power_dispatch[0] = 30
+
+    coordinator_object._clone_tracking_model()
+
+    for t in tracker_model.fs.P_T:
+        assert proj_tracker_model.fs.P_T[t].value == pytest.approx(10.1235 + t)
+    assert pyo.value(proj_tracker_model.fs.pre_P_T) == 25
+    assert pyo.value(proj_tracker_model.power_dispatch[0]) == 30
+
+    # the mapping is reused, values changed in the projection tracker are
+    # overwritten
+    proj_tracker_model.fs.P_T[0].value = 0
+    coordinator_object._clone_tracking_model()
+    assert proj_tracker_model.fs.P_T[0].value == pytest.approx(10.1235)
+
+
+@pytest.mark.unit
+def test_clone_tracking_model_diverged(coordinator_object):
+
+    coordinator_object.projection_tracker.model.extra_var = pyo.Var()
+
+    with pytest.raises(ValueError, match="do not have the same name"):
+        coordinator_object._clone_tracking_model()
+
+
+def _clone_tracking_model_by_name(coordinator):
+    # reference implementation that walks and compares both models every call
+    for obj in [pyo.Var, pyo.Param]:
+        for tracker_obj, proj_tracker_obj in zip_longest(
+            coordinator.tracker.model.component_objects(
+                obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
+            ),
+            coordinator.projection_tracker.model.component_objects(
+                obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
+            ),
+        ):
+            assert tracker_obj.name == proj_tracker_obj.name
+            for idx in tracker_obj.index_set():
+                if pyo.value(proj_tracker_obj[idx]) != pyo.value(tracker_obj[idx]):
+                    proj_tracker_obj[idx] = round(pyo.value(tracker_obj[idx]), 4)
+
+
+@pytest.mark.performance
+class TestCloneTrackingModelPerformance(PerformanceBaseClass, pyo_unittest.TestCase):
+    """
+    Record the time to copy the tracker states to the projection tracker over
+    many hours, comparing the models by name every hour and with the
+    precomputed mapping.
+    """
+
+    n_hours = 200
+
+    def build_coordinator(self):
+        from idaes.apps.grid_integration.examples.thermal_generator import (
+            ThermalGenerator,
+        )
+        from idaes.apps.grid_integration.examples.utils import (
+            rts_gmlc_generator_dataframe,
+            rts_gmlc_bus_dataframe,
+        )
+
+        solver = pyo.SolverFactory("cbc")
+        trackers = [
+            Tracker(
+                tracking_model_object=ThermalGenerator(
+                    rts_gmlc_generator_dataframe=rts_gmlc_generator_dataframe,
+                    rts_gmlc_bus_dataframe=rts_gmlc_bus_dataframe,
+                    generator="10_STEAM",
+                ),
+                tracking_horizon=48,
+                n_tracking_hour=1,
+                solver=solver,
+            )
+            for _ in range(2)
+        ]
+        return DoubleLoopCoordinator(
+            bidder=None, tracker=trackers[0], projection_tracker=trackers[1]
+        )
+
+    @pytest.mark.performance
+    def test_performance(self):
+        coordinator = self.build_coordinator()
+        tracker_vars = [
+            v
+            for v in coordinator.tracker.model.component_data_objects(
+                pyo.Var, descend_into=True
+            )
+            if v.is_continuous()
+        ]
+
+        def change_tracker_states(hour):
+            # about a quarter of the continuous tracker states change every hour
+            for i, v in enumerate(tracker_vars):
+                if (i + hour) % 4 == 0:
+                    v.value = hour + i / 7
+
+        for name, clone in [
+            ("compare by name", lambda: _clone_tracking_model_by_name(coordinator)),
+            ("precomputed mapping", coordinator._clone_tracking_model),
+        ]:
+            # only time the copies, not the changes to the tracker states
+            gc.collect()
+            timer = TicTocTimer()
+            timer.stop()
+            for hour in range(self.n_hours):
+                change_tracker_states(hour)
+                timer.start()
+                clone()
+                timer.stop()
+            self.recordData(
+                name, timer.toc(f"{name}: {self.n_hours} hours", delta=False)
+            )
+
+        proj_model = coordinator.projection_tracker.model
+        for v in tracker_vars:
+            proj_v = proj_model.find_component(v.name)
+            assert proj_v.value == pytest.approx(round(v.value, 4))
@@ -0,0 +1,317 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+
+import os
+import gc
+
+import pytest
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
+from pyomo.opt import SolverResults
+from idaes.apps.grid_integration.utils import (
+    convert_marginal_costs_to_actual_costs,
+    ModelSolver,
+    ResultsRecorder,
+)
+from idaes.core.util.performance import PerformanceBaseClass
+import idaes.logger as idaeslog
+
+
+def tracker_rows(hour, horizon=4):
+    return [
+        {
+            "Date": "2021-01-01",
+            "Hour": hour,
+            "Horizon [hr]": t,
+            "Power Dispatch [MW]": 10.0 * t,
+            "Power Output [MW]": 10.0 * t + 0.5,
+        }
+        for t in range(horizon)
+    ]
+
+
+@pytest.mark.unit
+def test_convert_marginal_costs_to_actual_costs():
+    costs = convert_marginal_costs_to_actual_costs([(10, 5), (20, 10), (30, 20)])
+    assert costs == [(10, 50), (20, 150), (30, 350)]
+
+
+@pytest.mark.unit
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="initial_capacity"):
+        ResultsRecorder(initial_capacity=0)
+    with pytest.raises(ValueError, match="stream_every"):
+        ResultsRecorder(stream_every=0)
+    with pytest.raises(ValueError, match="stream_format"):
+        ResultsRecorder(stream_path="results.txt", stream_format="xlsx")
+
+
+@pytest.mark.unit
+def test_record_rows():
+    recorder = ResultsRecorder(initial_capacity=2)
+    for hour in range(3):
+        recorder.append_rows(tracker_rows(hour))
+
+    assert len(recorder) == 12
+    assert recorder.columns == list(tracker_rows(0)[0])
+
+    df = recorder.to_dataframe()
+    expected = pd.DataFrame([r for h in range(3) for r in tracker_rows(h)])
+    pd.testing.assert_frame_equal(df, expected)
+    assert df["Hour"].dtype == np.int64
+    assert df["Power Output [MW]"].dtype == float
+
+
+@pytest.mark.unit
+def test_record_missing_and_new_columns():
+    recorder = ResultsRecorder()
+    recorder.append_rows([{"Generator": "gen", "Power 0 [MW]": 10, "Cost 0 [$]": 5}])
+    recorder.append_rows(
+        [
+            {"Generator": "gen", "Power 0 [MW]": 12.5, "Cost 0 [$]": None},
+            {"Generator": "gen", "Power 0 [MW]": 15.0, "Market": "Day-ahead"},
+        ]
+    )
+
+    df = recorder.to_dataframe()
+    assert list(df.columns) == ["Generator", "Power 0 [MW]", "Cost 0 [$]", "Market"]
+    # int columns are converted when they get floats or missing values
+    assert df["Power 0 [MW]"].tolist() == [10.0, 12.5, 15.0]
+    assert df["Cost 0 [$]"].tolist()[0] == 5
+    assert all(v is None or np.isnan(v) for v in df["Cost 0 [$]"].tolist()[1:])
+    assert df["Market"].tolist() == [None, None, "Day-ahead"]
+
+
+@pytest.mark.unit
+def test_write(tmp_path):
+    recorder = ResultsRecorder()
+    recorder.append_rows(tracker_rows(0))
+    path = os.path.join(tmp_path, "tracker_detail.csv")
+    recorder.write(path)
+
+    df = pd.read_csv(path)
+    pd.testing.assert_frame_equal(df, pd.DataFrame(tracker_rows(0)))
+
+
+@pytest.mark.unit
+def test_stream_csv(tmp_path):
+    path = os.path.join(tmp_path, "tracker_detail.csv")
+    recorder = ResultsRecorder(stream_path=path, stream_every=2)
+    for hour in range(5):
+        recorder.append_rows(tracker_rows(hour))
+
+    # 4 hours have been streamed, the last one is still in memory
+    assert recorder.n_streamed == 16
+    assert len(recorder) == 4
+
+    with pytest.raises(ValueError, match="can not be added"):
+        recorder.append_row({"Date": "2021-01-01", "Market": "Real-time"})
+
+    recorder.write(os.path.join(tmp_path, "unused.csv"))
+    assert not os.path.exists(os.path.join(tmp_path, "unused.csv"))
+    assert recorder.n_streamed == 20
+
+    df = pd.read_csv(path)
+    expected = pd.DataFrame([r for h in range(5) for r in tracker_rows(h)])
+    pd.testing.assert_frame_equal(df, expected)
+
+
+@pytest.mark.unit
+def test_stream_parquet_column_type_changes(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = os.path.join(tmp_path, "tracker_detail.parquet")
+    recorder = ResultsRecorder(stream_path=path, stream_every=1)
+    # int column which later gets float values, and a column with only missing
+    # values which later gets strings
+    recorder.append_rows([{"Hour": 0, "Note": None}])
+    recorder.append_rows([{"Hour": 1.5, "Note": "late"}])
+    recorder.append_rows([{"Hour": None, "Note": None}])
+    recorder.write(os.path.join(tmp_path, "unused.csv"))
+    assert recorder.n_streamed == 3
+
+    df = pd.read_parquet(path)
+    pd.testing.assert_frame_equal(
+        df, pd.DataFrame({"Hour": [0.0, 1.5, np.nan], "Note": [None, "late", None]})
+    )
+
+
+@pytest.mark.unit
+def test_flush_without_stream_path():
+    recorder = ResultsRecorder()
+    with pytest.raises(ValueError, match="no stream_path"):
+        recorder.flush()
+
+
+@pytest.mark.performance
+class TestResultsRecorderPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to collect a month of hourly tracker results as one
+    DataFrame per row and with a ResultsRecorder.
+    """
+
+    n_hours = 24 * 30
+
+    def record_with_dataframes(self):
+        result_list = []
+        for hour in range(self.n_hours):
+            df_list = []
+            for result_dict in tracker_rows(hour, horizon=48):
+                result_df = pd.DataFrame.from_dict(result_dict, orient="index")
+                df_list.append(result_df.T)
+            result_list.append(pd.concat(df_list))
+        return pd.concat(result_list)
+
+    def record_with_recorder(self):
+        recorder = ResultsRecorder()
+        for hour in range(self.n_hours):
+            recorder.append_rows(tracker_rows(hour, horizon=48))
+        return recorder.to_dataframe()
+
+    @pytest.mark.performance
+    def test_performance(self):
+        gc.collect()
+        timer = TicTocTimer()
+        df_old = self.record_with_dataframes()
+        self.recordData(
+            "DataFrame per row", timer.toc(f"DataFrame per row: {self.n_hours} hours")
+        )
+        gc.collect()
+        timer.tic(None)
+        df_new = self.record_with_recorder()
+        self.recordData(
+            "ResultsRecorder", timer.toc(f"ResultsRecorder: {self.n_hours} hours")
+        )
+
+        assert df_old.shape == df_new.shape
+
+
+def build_lp_model():
+    m = pyo.ConcreteModel()
+    m.T = pyo.Set(initialize=range(3))
+    m.price = pyo.Param(m.T, initialize=10, mutable=True)
+    m.demand = pyo.Param(m.T, initialize=5, mutable=True)
+    m.x = pyo.Var(m.T, bounds=(0, 100), initialize=0)
+    m.y = pyo.Var(initialize=0)
+    m.demand_con = pyo.Constraint(m.T, rule=lambda m, t: m.x[t] >= m.demand[t])
+    m.y_con = pyo.Constraint(expr=m.y == sum(m.x[t] for t in m.T))
+    m.obj = pyo.Objective(expr=sum(m.price[t] * m.x[t] for t in m.T))
+    return m
+
+
+@pytest.mark.unit
+def test_model_solver_fallback(caplog):
+    m = build_lp_model()
+    solver = pyo.SolverFactory("cbc")
+
+    model_solver = ModelSolver(solver, m)
+    assert not model_solver.persistent
+    assert model_solver.solver is solver
+
+    if ModelSolver._get_persistent_solver(solver) is None:
+        with caplog.at_level(idaeslog.WARNING):
+            model_solver = ModelSolver(solver, m, persistent=True)
+        assert not model_solver.persistent
+        assert model_solver.solver is solver
+        assert "No persistent interface is available" in caplog.text
+
+
+@pytest.mark.unit
+def test_model_solver_collect_updates():
+    m = build_lp_model()
+    m.obj2 = pyo.Objective(expr=m.y)
+    m.obj2.deactivate()
+    model_solver = ModelSolver(pyo.SolverFactory("cbc"), m)
+    model_solver._record_model_state()
+
+    updates = model_solver._collect_updates()
+    assert updates == ([], None, [], [], [])
+
+    # only the changed params and variables are pushed to the solver
+    m.demand[1] = 7
+    m.demand[2] = 5
+    m.x[0].fix(3)
+    m.y.setub(50)
+    constraints, objective, variables, added, removed = model_solver._collect_updates()
+    assert constraints == [m.demand_con[1]]
+    assert objective is None
+    assert variables == [m.x[0], m.y]
+
+    m.price[0] = 20
+    constraints, objective, variables, added, removed = model_solver._collect_updates()
+    assert constraints == []
+    assert objective is m.obj
+    assert variables == []
+
+    # activating and deactivating constraints and objectives
+    m.demand_con[0].deactivate()
+    m.demand[0] = 6
+    m.obj.deactivate()
+    m.obj2.activate()
+    constraints, objective, variables, added, removed = model_solver._collect_updates()
+    assert constraints == []
+    assert objective is m.obj2
+    assert added == []
+    assert removed == [m.demand_con[0]]
+
+    m.demand_con[0].activate()
+    m.demand[1] = 8
+    constraints, objective, variables, added, removed = model_solver._collect_updates()
+    assert constraints == [m.demand_con[1]]
+    assert objective is None
+    assert added == [m.demand_con[0]]
+    assert removed == []
+
+
+@pytest.mark.unit
+def test_model_solver_reported_time():
+    results = SolverResults()
+    assert ModelSolver._reported_solver_time(results) is None
+    results.solver.time = 1.5
+    assert ModelSolver._reported_solver_time(results) == 1.5
+    assert ModelSolver._reported_solver_time(None) is None
+
+
+@pytest.mark.component
+@pytest.mark.skipif(
+    ModelSolver._get_persistent_solver(pyo.SolverFactory("gurobi")) is None,
+    reason="gurobi_persistent not available",
+)
+def test_model_solver_persistent():
+    m = build_lp_model()
+    model_solver = ModelSolver(pyo.SolverFactory("gurobi"), m, persistent=True)
+    assert model_solver.persistent
+
+    model_solver.solve()
+    assert pyo.value(m.y) == pytest.approx(15)
+
+    m.demand[1] = 7
+    model_solver.solve()
+    assert pyo.value(m.y) == pytest.approx(17)
+    assert len(model_solver.solve_stats) == 2
+
+    m.demand_con[1].deactivate()
+    model_solver.solve()
+    assert pyo.value(m.y) == pytest.approx(10)
+
+    m.demand_con[1].activate()
+    model_solver.solve()
+    assert pyo.value(m.y) == pytest.approx(17)
+
+
+@pytest.mark.unit
+def test_model_solver_is_ipopt():
+    assert ModelSolver._is_ipopt(pyo.SolverFactory("ipopt"))
+    assert not ModelSolver._is_ipopt(pyo.SolverFactory("cbc"))
@@ -10,10 +10,10 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
-import pandas as pd
 import pyomo.environ as pyo
 from pyomo.opt.base.solvers import OptSolver
 import os
+from idaes.apps.grid_integration.utils import ModelSolver, ResultsRecorder
 
 
 class Tracker:
@@ -24,7 +24,12 @@ class Tracker:
     """
 
     def __init__(
-        self, tracking_model_object, tracking_horizon, n_tracking_hour, solver
+        self,
+        tracking_model_object,
+        tracking_horizon,
+        n_tracking_hour,
+        solver,
+        persistent_solver=False,
     ):
 
         """
@@ -39,6 +44,9 @@ class Tracker:
 
             solver: a Pyomo mathematical programming solver object
 
+            persistent_solver: if True, keep the tracking model in a persistent
+                               interface of the solver between the solves
+
         Returns:
             None
         """
@@ -64,10 +72,16 @@ class Tracker:
 
         self.formulate_tracking_problem()
 
+        self.model_solver = ModelSolver(
+            self.solver, self.model, persistent=persistent_solver
+        )
+
         self.daily_stats = None
         self.projection = None
 
-        self.result_list = []
+        # columnar storage of the tracker results, replace it with a
+        # ResultsRecorder with a stream_path to stream results to disk
+        self.results_recorder = ResultsRecorder()
 
     def _check_inputs(self):
 
@@ -300,7 +314,7 @@ class Tracker:
         self._pass_market_dispatch(market_dispatch)
 
         # solve the model
-        self.solver.solve(self.model, tee=True)
+        self.model_solver.solve(tee=True)
 
         self.record_results(date=date, hour=hour)
 
@@ -389,7 +403,7 @@ class Tracker:
 
         """
 
-        df_list = []
+        rows = []
         for t in self.time_set:
 
             result_dict = {}
@@ -410,11 +424,10 @@ class Tracker:
                 pyo.value(self.model.power_overdelivered[t]), 2
             )
 
-            result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-            df_list.append(result_df.T)
+            rows.append(result_dict)
 
-        # append to result list
-        self.result_list.append(pd.concat(df_list))
+        # append to results recorder
+        self.results_recorder.append_rows(rows)
 
     def record_results(self, **kwargs):
 
@@ -449,9 +462,7 @@ class Tracker:
         print("")
         print("Saving tracking results to disk...")
 
-        pd.concat(self.result_list).to_csv(
-            os.path.join(path, "tracker_detail.csv"), index=False
-        )
+        self.results_recorder.write(os.path.join(path, "tracker_detail.csv"))
         self.tracking_model_object.write_results(
             path=os.path.join(path, "tracking_model_detail.csv")
         )
@@ -10,6 +10,22 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
+from numbers import Integral, Real
+import time
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.common.dependencies import attempt_import
+from pyomo.core.expr.visitor import identify_mutable_parameters
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+from idaes.core.solvers.ipopt_stats import ipopt_solve_with_stats
+import idaes.logger as idaeslog
+
+pa, pa_avail = attempt_import("pyarrow")
+
+_logger = idaeslog.getLogger(__name__)
 
 
 def convert_marginal_costs_to_actual_costs(power_marginal_cost_pairs):
@@ -43,3 +59,611 @@ def convert_marginal_costs_to_actual_costs(power_marginal_cost_pairs):
         pre_cost += marginal_cost * delta_p
 
     return actual_costs
+
+
+class ResultsRecorder:
+
+    """
+    Columnar storage for the results recorded by the tracker and bidders during a
+    simulation. Each column is held in a NumPy array (int, float, or object
+    dtype, from the first value recorded) whose capacity is doubled when it is
+    full, so recording a row does not allocate a DataFrame. A DataFrame is only
+    created by to_dataframe() and write().
+
+    Columns are added in the order they first appear; rows which do not have a
+    column get a missing value (NaN or None). An int column which gets a
+    missing or non-integer value is converted to float or object.
+
+    Optionally, the recorded rows can be streamed to a csv or parquet file after
+    every stream_every batches (calls to append_rows, e.g. one per simulation
+    hour), which keeps the memory use bounded in long simulations. The columns
+    can not change after the first rows are streamed. In parquet files, int
+    columns are stored as float and columns with only missing values in the
+    first rows streamed as strings, so that later rows can widen them.
+    """
+
+    def __init__(
+        self,
+        initial_capacity=256,
+        stream_path=None,
+        stream_every=None,
+        stream_format=None,
+    ):
+
+        """
+        Initializes the ResultsRecorder.
+
+        Arguments:
+            initial_capacity: initial number of rows allocated for each column
+
+            stream_path: if given, path of the file the results are streamed to
+
+            stream_every: number of batches after which the recorded rows are
+                          written to stream_path (default 24)
+
+            stream_format: "csv" or "parquet", the default is from the extension of
+                           stream_path ("parquet" for .parquet, otherwise "csv")
+
+        Returns:
+            None
+        """
+
+        if not isinstance(initial_capacity, Integral) or initial_capacity < 1:
+            raise ValueError(
+                f"initial_capacity must be a positive integer, but {initial_capacity} is provided."
+            )
+        if stream_every is None:
+            stream_every = 24
+        if not isinstance(stream_every, Integral) or stream_every < 1:
+            raise ValueError(
+                f"stream_every must be a positive integer, but {stream_every} is provided."
+            )
+        if stream_format is None and stream_path is not None:
+            stream_format = (
+                "parquet" if str(stream_path).endswith(".parquet") else "csv"
+            )
+        if stream_format not in (None, "csv", "parquet"):
+            raise ValueError(
+                f"stream_format must be 'csv' or 'parquet', but {stream_format} is provided."
+            )
+        if stream_format == "parquet" and not pa_avail:
+            raise ImportError("Streaming results to parquet requires pyarrow.")
+
+        self._initial_capacity = initial_capacity
+        self.stream_path = stream_path
+        self.stream_every = stream_every
+        self.stream_format = stream_format
+
+        self._columns = {}
+        self._n_rows = 0
+        self._capacity = initial_capacity
+        self._n_batches = 0
+        self._n_streamed = 0
+        self._parquet_writer = None
+
+    def __len__(self):
+        """
+        Number of rows recorded and not yet streamed.
+        """
+        return self._n_rows
+
+    @property
+    def columns(self):
+        """
+        List of the column names.
+        """
+        return list(self._columns)
+
+    @property
+    def n_streamed(self):
+        """
+        Number of rows written to the stream file.
+        """
+        return self._n_streamed
+
+    @staticmethod
+    def _missing_value(arr):
+        return np.nan if arr.dtype.kind == "f" else None
+
+    def _new_column(self, value):
+
+        """
+        Create the array for a new column from its first value; the rows
+        recorded before get a missing value.
+        """
+
+        if isinstance(value, (bool, np.bool_)):
+            dtype = object
+        elif isinstance(value, Integral) and self._n_rows == 0:
+            dtype = np.int64
+        elif isinstance(value, Real):
+            dtype = float
+        else:
+            dtype = object
+        arr = np.empty(self._capacity, dtype=dtype)
+        if self._n_rows > 0:
+            arr[: self._n_rows] = self._missing_value(arr)
+        return arr
+
+    def _set(self, name, value):
+
+        """
+        Set the value of a column in the current row, converting the column
+        array when the value does not fit its dtype.
+        """
+
+        arr = self._columns[name]
+        kind = arr.dtype.kind
+        if kind == "i":
+            if value is None or isinstance(value, (bool, np.bool_)):
+                arr = self._columns[name] = arr.astype(object)
+            elif not isinstance(value, Integral):
+                if isinstance(value, Real):
+                    arr = self._columns[name] = arr.astype(float)
+                else:
+                    arr = self._columns[name] = arr.astype(object)
+        elif kind == "f":
+            if value is None:
+                value = np.nan
+            elif isinstance(value, (bool, np.bool_)) or not isinstance(value, Real):
+                arr = self._columns[name] = arr.astype(object)
+        arr[self._n_rows] = value
+
+    def _grow(self):
+
+        """
+        Double the capacity of the column arrays.
+        """
+
+        self._capacity *= 2
+        for name, arr in self._columns.items():
+            new = np.empty(self._capacity, dtype=arr.dtype)
+            new[: self._n_rows] = arr[: self._n_rows]
+            self._columns[name] = new
+
+    def append_row(self, row):
+
+        """
+        Record a row.
+
+        Arguments:
+            row: dictionary of column names and values
+
+        Returns:
+            None
+        """
+
+        if self._n_rows == self._capacity:
+            self._grow()
+        for name, value in row.items():
+            if name not in self._columns:
+                if self._n_streamed > 0:
+                    raise ValueError(
+                        f"Column {name} can not be added after results have been streamed to {self.stream_path}."
+                    )
+                self._columns[name] = self._new_column(value)
+            self._set(name, value)
+        if len(row) < len(self._columns):
+            for name, arr in self._columns.items():
+                if name not in row:
+                    if arr.dtype.kind == "i":
+                        arr = self._columns[name] = arr.astype(float)
+                    arr[self._n_rows] = self._missing_value(arr)
+        self._n_rows += 1
+
+    def append_rows(self, rows):
+
+        """
+        Record a batch of rows, e.g., the results of one simulation hour. If the
+        recorder streams results, the rows are written to the stream file after
+        every stream_every batches.
+
+        Arguments:
+            rows: iterable of dictionaries of column names and values
+
+        Returns:
+            None
+        """
+
+        for row in rows:
+            self.append_row(row)
+        self._n_batches += 1
+        if self.stream_path is not None and self._n_batches % self.stream_every == 0:
+            self.flush()
+
+    def to_dataframe(self):
+
+        """
+        Create a DataFrame of the recorded rows (not including rows that have
+        been streamed).
+
+        Returns:
+            pandas.DataFrame: recorded results
+        """
+
+        return pd.DataFrame(
+            {name: arr[: self._n_rows] for name, arr in self._columns.items()},
+            columns=list(self._columns),
+        )
+
+    def flush(self):
+
+        """
+        Write the recorded rows to the stream file and clear them from memory.
+
+        Returns:
+            None
+        """
+
+        if self.stream_path is None:
+            raise ValueError("ResultsRecorder has no stream_path to flush to.")
+        if self._n_rows == 0:
+            return
+        df = self.to_dataframe()
+        if self.stream_format == "parquet":
+            self._write_parquet(df)
+        else:
+            df.to_csv(
+                self.stream_path,
+                mode="w" if self._n_streamed == 0 else "a",
+                header=self._n_streamed == 0,
+                index=False,
+            )
+        self._n_streamed += self._n_rows
+        self._n_rows = 0
+        self._capacity = self._initial_capacity
+        self._columns = {
+            name: np.empty(self._capacity, dtype=arr.dtype)
+            for name, arr in self._columns.items()
+        }
+
+    def _write_parquet(self, df):
+
+        """
+        Write a DataFrame of recorded rows to the parquet stream file. The
+        schema of the file is set from the first rows streamed, and the types
+        of the columns are fixed then: later rows are cast to it.
+        """
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._parquet_writer is None:
+            import pyarrow.parquet as pq
+
+            # later rows may have missing or float values in an int column, or
+            # values in a column which only had missing values so far
+            fields = []
+            for field in table.schema:
+                if pa.types.is_integer(field.type):
+                    field = field.with_type(pa.float64())
+                elif pa.types.is_null(field.type):
+                    field = field.with_type(pa.string())
+                fields.append(field)
+            schema = pa.schema(fields)
+            self._parquet_writer = pq.ParquetWriter(self.stream_path, schema)
+        schema = self._parquet_writer.schema
+        try:
+            table = table.cast(schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            raise ValueError(
+                f"The recorded results can not be streamed to {self.stream_path} with the column types of the first rows streamed: {schema}."
+            )
+        self._parquet_writer.write_table(table)
+
+    def write(self, path):
+
+        """
+        Write the recorded results to a csv file. If the recorder streams
+        results, the remaining rows are flushed and the stream file is closed
+        instead, so the results are in stream_path.
+
+        Arguments:
+            path: path of the csv file
+
+        Returns:
+            None
+        """
+
+        if self.stream_path is None:
+            self.to_dataframe().to_csv(path, index=False)
+            return
+
+        self.flush()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        print(f"Results have been streamed to {self.stream_path}.")
+
+
+class ModelSolver:
+
+    """
+    Solve the same model repeatedly, e.g., the tracking or bidding model every
+    simulation hour, and record the time spent in the solver interface
+    separately from the time reported by the solver.
+
+    With persistent=True, the model is loaded into a persistent solver
+    interface (e.g., gurobi_persistent) once. Before each following solve, only
+    the constraints and objective that contain mutable params whose values
+    changed, the constraints that were activated or deactivated, a change of
+    the active objective and the variables whose bounds or fixed status changed
+    are updated in the solver (components added to the model after the first
+    solve are not), and the solve is warm-started from the current variable
+    values (i.e., the previous solution) if the solver supports it. If there is
+    no persistent interface for the solver, or it is not available, the model
+    is solved with the given solver as usual.
+    """
+
+    def __init__(self, solver, model, persistent=False):
+
+        """
+        Initializes the ModelSolver.
+
+        Arguments:
+            solver: a Pyomo mathematical programming solver object
+
+            model: the Pyomo model to solve
+
+            persistent: if True, use a persistent solver interface for the model
+
+        Returns:
+            None
+        """
+
+        self.model = model
+        self.solver = solver
+        self.persistent = False
+        if persistent:
+            persistent_solver = self._get_persistent_solver(solver)
+            if persistent_solver is None:
+                _logger.warning(
+                    f"No persistent interface is available for solver {solver.name}, "
+                    f"{model.name} will be solved without a persistent solver."
+                )
+            else:
+                self.solver = persistent_solver
+                self.persistent = True
+
+        # time in the solver interface and time reported by the solver
+        self.solve_stats = []
+
+        self._instance_set = False
+
+    @staticmethod
+    def _get_persistent_solver(solver):
+
+        """
+        Create a persistent solver object for one model from the given solver,
+        which keeps the solver options. Returns None if there is no available
+        persistent interface for the solver.
+        """
+
+        if isinstance(solver, PersistentSolver):
+            name = solver.name
+        else:
+            name = f"{solver.name}_persistent"
+        try:
+            persistent_solver = pyo.SolverFactory(name)
+        except Exception:
+            return None
+        if not isinstance(persistent_solver, PersistentSolver):
+            return None
+        if not persistent_solver.available(exception_flag=False):
+            return None
+        persistent_solver.options.update(solver.options)
+
+        return persistent_solver
+
+    def _set_instance(self):
+
+        """
+        Load the model into the persistent solver.
+        """
+
+        self.solver.set_instance(self.model)
+        self._record_model_state()
+        self._instance_set = True
+
+    def _record_model_state(self):
+
+        """
+        Record the mutable params, the constraints and objectives they appear
+        in, the active constraints and objective, and the variable states, so
+        their changes can be found before the next solve.
+        """
+
+        # all constraints and objectives, so the params of those activated
+        # later are also tracked
+        param_constraints = ComponentMap()
+        param_objectives = ComponentMap()
+        for con in self.model.component_data_objects(
+            pyo.Constraint, active=None, descend_into=True
+        ):
+            for p in identify_mutable_parameters(con.expr):
+                param_constraints.setdefault(p, []).append(con)
+        for obj in self.model.component_data_objects(
+            pyo.Objective, active=None, descend_into=True
+        ):
+            for p in identify_mutable_parameters(obj.expr):
+                param_objectives.setdefault(p, []).append(obj)
+
+        self._params = list(
+            ComponentSet(param_constraints) | ComponentSet(param_objectives)
+        )
+        self._param_constraints = [param_constraints.get(p, []) for p in self._params]
+        self._param_objectives = [param_objectives.get(p, []) for p in self._params]
+        self._param_values = self._get_param_values()
+
+        self._active_constraints = self._get_active_constraints()
+        self._objective = self._get_active_objective()
+
+        self._vars = list(self.model.component_data_objects(pyo.Var, descend_into=True))
+        self._var_states = self._get_var_states()
+
+    def _get_param_values(self):
+        return np.array([p.value for p in self._params], dtype=float)
+
+    def _get_active_constraints(self):
+        return ComponentSet(
+            self.model.component_data_objects(
+                pyo.Constraint, active=True, descend_into=True
+            )
+        )
+
+    def _get_active_objective(self):
+        objective = None
+        for obj in self.model.component_data_objects(
+            pyo.Objective, active=True, descend_into=True
+        ):
+            objective = obj
+        return objective
+
+    def _get_var_states(self):
+        return [
+            (v.lb, v.ub, v.fixed, v.value if v.fixed else None, v.domain)
+            for v in self._vars
+        ]
+
+    def _collect_updates(self):
+
+        """
+        Find the changes to the model since it was loaded into the solver.
+        Constraints and objectives added to the model after it was loaded are
+        not tracked, only changes to the ones that existed then.
+
+        Returns:
+            tuple: constraints to update, objective to set (None if unchanged),
+            variables to update, constraints to add, constraints to remove
+        """
+
+        values = self._get_param_values()
+        changed = (values != self._param_values) & ~(
+            np.isnan(values) & np.isnan(self._param_values)
+        )
+        self._param_values = values
+
+        active_constraints = self._get_active_constraints()
+        added = [c for c in active_constraints if c not in self._active_constraints]
+        removed = [c for c in self._active_constraints if c not in active_constraints]
+        objective = self._get_active_objective()
+        new_objective = objective is not self._objective
+
+        constraints = ComponentSet()
+        for i in np.flatnonzero(changed).tolist():
+            constraints.update(
+                c for c in self._param_constraints[i] if c in self._active_constraints
+            )
+            if objective is not None and any(
+                obj is objective for obj in self._param_objectives[i]
+            ):
+                new_objective = True
+        self._active_constraints = active_constraints
+        self._objective = objective
+
+        var_states = self._get_var_states()
+        variables = [
+            v
+            for v, old, new in zip(self._vars, self._var_states, var_states)
+            if old != new
+        ]
+        self._var_states = var_states
+
+        return (
+            [c for c in constraints if c in active_constraints],
+            objective if new_objective else None,
+            variables,
+            added,
+            removed,
+        )
+
+    def _update_instance(self):
+
+        """
+        Push the changes to the model into the persistent solver.
+        """
+
+        constraints, objective, variables, added, removed = self._collect_updates()
+        for v in variables:
+            self.solver.update_var(v)
+        for con in removed:
+            self.solver.remove_constraint(con)
+        for con in constraints:
+            self.solver.remove_constraint(con)
+            self.solver.add_constraint(con)
+        for con in added:
+            self.solver.add_constraint(con)
+        if objective is not None:
+            self.solver.set_objective(objective)
+
+    def solve(self, **kwargs):
+
+        """
+        Solve the model.
+
+        Arguments:
+            kwargs: key word arguments passed to the solve method of the solver
+
+        Returns:
+            results: solver results
+        """
+
+        ipopt_stats = None
+        t_start = time.perf_counter()
+        if self.persistent:
+            if not self._instance_set:
+                self._set_instance()
+            else:
+                self._update_instance()
+            kwargs.setdefault("warmstart", self.solver.warm_start_capable())
+            results = self.solver.solve(**kwargs)
+        elif self._is_ipopt(self.solver):
+            # get the iteration count and solver time from ipopt
+            ipopt_stats = ipopt_solve_with_stats(
+                self.model, self.solver, max_iter=None, max_cpu_time=None, **kwargs
+            )
+            results = ipopt_stats.results
+        else:
+            results = self.solver.solve(self.model, **kwargs)
+        t_total = time.perf_counter() - t_start
+
+        if ipopt_stats is not None:
+            solver_time = ipopt_stats.time
+            iterations = ipopt_stats.iterations
+        else:
+            solver_time = self._reported_solver_time(results)
+            iterations = None
+        self.solve_stats.append(
+            {
+                "Interface Time [s]": t_total - (solver_time or 0.0),
+                "Solver Time [s]": solver_time,
+                "Iterations": iterations,
+            }
+        )
+
+        return results
+
+    @staticmethod
+    def _is_ipopt(solver):
+
+        """
+        Check if the solver is ipopt (the executable or the cyipopt interface).
+        """
+
+        return getattr(solver, "name", None) in ("ipopt", "cyipopt")
+
+    @staticmethod
+    def _reported_solver_time(results):
+
+        """
+        Get the solve time reported by the solver, None if it is not reported.
+        """
+
+        try:
+            solver_results = results.solver
+        except AttributeError:
+            return None
+        for attr in ["wallclock_time", "wall_time", "time"]:
+            value = getattr(solver_results, attr, None)
+            if isinstance(value, Real) and not np.isnan(value):
+                return float(value)
+
+        return None
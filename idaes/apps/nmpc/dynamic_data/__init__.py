@@ -13,5 +13,7 @@
 from .interval_data import (
     assert_disjoint_intervals,
     load_inputs_into_model,
+    load_compact_inputs_into_model,
     interval_data_from_time_series,
+    compact_interval_data_from_time_series,
 )
@@ -10,6 +10,9 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
+import numpy as np
+
+from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 
 
 def assert_disjoint_intervals(intervals):
@@ -39,6 +42,58 @@ def assert_disjoint_intervals(intervals):
                 )
 
 
+def _find_nearest_indices(time_points, targets, tolerance):
+    """
+    Vectorized version of ContinuousSet.find_nearest_index. Returns the
+    zero-based indices of the points in the sorted array time_points
+    nearest to each target, with ties going to the left point, and -1
+    where the nearest point is farther than tolerance.
+    """
+    n_t = len(time_points)
+    targets = np.asarray(targets, dtype=float)
+    if n_t == 0:
+        return np.full(len(targets), -1, dtype=int)
+    i = np.searchsorted(time_points, targets, side="right")
+    left = np.clip(i - 1, 0, n_t - 1)
+    right = np.clip(i, 0, n_t - 1)
+    delta_left = np.abs(targets - time_points[left])
+    delta_right = np.abs(targets - time_points[right])
+    nearest = np.where(delta_right < delta_left, right, left)
+    delta = np.minimum(delta_left, delta_right)
+    if tolerance is not None:
+        nearest[delta > tolerance] = -1
+    return nearest
+
+
+def _load_interval_values(var, time_list, time_points, lo, hi, values, time_tol):
+    """
+    Set the values of var on the time points in each interval (lo[i], hi[i]],
+    or at lo[i] if both endpoints are the same time point. The endpoints of
+    all intervals are mapped to time indices at once, and the values are
+    set in a single pass in the order of the intervals.
+    """
+    idx0 = _find_nearest_indices(time_points, lo, time_tol)
+    idx1 = _find_nearest_indices(time_points, hi, time_tol)
+    # Skip intervals with an endpoint that is not a valid time index
+    # within tolerance.
+    valid = np.flatnonzero((idx0 >= 0) & (idx1 >= 0))
+    idx0 = idx0[valid]
+    idx1 = idx1[valid]
+    start = np.where(idx0 != idx1, idx0 + 1, idx0)
+    length = np.maximum(idx1 + 1 - start, 0)
+    interval = np.repeat(valid, length)
+    referent = var.referent if var.is_reference() else None
+    if len(interval) and isinstance(referent, IndexedComponent_slice):
+        # Looking up the elements of a reference one at a time is slow,
+        # so we look them all up with a single pass through its slice.
+        var = dict(referent.wildcard_items())
+    # Time indices of every point in the concatenated intervals
+    offset = np.cumsum(length) - length
+    position = np.arange(len(interval)) - np.repeat(offset - start, length)
+    for i, idx in zip(interval.tolist(), position.tolist()):
+        var[time_list[idx]].set_value(values[i])
+
+
 def load_inputs_into_model(model, time, input_data, time_tol=0):
     """
     This function loads piecewise constant values into variables (or
@@ -61,6 +116,8 @@ def load_inputs_into_model(model, time, input_data, time_tol=0):
         must be within the ContinuousSet exactly.
 
     """
+    time_list = list(time)
+    time_points = np.array(time_list, dtype=float)
     for cuid, inputs in input_data.items():
         var = model.find_component(cuid)
         if var is None:
@@ -71,18 +128,60 @@ def load_inputs_into_model(model, time, input_data, time_tol=0):
 
         intervals = list(sorted(inputs.keys()))
         assert_disjoint_intervals(intervals)
-        for i, interval in enumerate(intervals):
-            idx0 = time.find_nearest_index(interval[0], tolerance=time_tol)
-            idx1 = time.find_nearest_index(interval[1], tolerance=time_tol)
-            if idx0 is None or idx1 is None:
-                # One of the interval boundaries is not a valid time index
-                # within tolerance. Skip this interval and move on.
-                continue
-            input_val = inputs[interval]
-            idx_iter = range(idx0 + 1, idx1 + 1) if idx0 != idx1 else (idx0,)
-            for idx in idx_iter:
-                t = time.at(idx)
-                var[t].set_value(input_val)
+        lo = [interval[0] for interval in intervals]
+        hi = [interval[1] for interval in intervals]
+        values = [inputs[interval] for interval in intervals]
+        _load_interval_values(var, time_list, time_points, lo, hi, values, time_tol)
+
+
+def load_compact_inputs_into_model(model, time, compact_data, time_tol=0):
+    """
+    This function loads piecewise constant values, in the compact form
+    returned by compact_interval_data_from_time_series, into variables
+    (or mutable parameters) of a model.
+
+    Arguments
+    ---------
+    model: _BlockData
+        Pyomo block containing the variables and parameters whose values
+        will be set
+    time: ContinuousSet
+        Pyomo ContinuousSet corresponding to the piecewise constant intervals
+    compact_data: tuple
+        First entry is an array of N+1 nondecreasing breakpoints, second
+        entry is a dict mapping variable names each to an array of N
+        values, the ith of which is taken on the interval between
+        breakpoints i and i+1.
+    time_tol: float
+        Optional. Tolerance within which the ContinuousSet will be searched
+        for interval endpoints. The default is zero, i.e. the endpoints
+        must be within the ContinuousSet exactly.
+
+    """
+    breakpoints, value_dict = compact_data
+    breakpoints = np.asarray(breakpoints, dtype=float)
+    if np.any(np.diff(breakpoints) < 0):
+        raise RuntimeError("Breakpoints of the intervals must be nondecreasing")
+    lo = breakpoints[:-1]
+    hi = breakpoints[1:]
+    n_intervals = len(lo)
+
+    time_list = list(time)
+    time_points = np.array(time_list, dtype=float)
+    for cuid, values in value_dict.items():
+        var = model.find_component(cuid)
+        if var is None:
+            raise RuntimeError(
+                "Could not find a variable on model %s with ComponentUID %s"
+                % (model.name, cuid)
+            )
+        if len(values) != n_intervals:
+            raise ValueError(
+                "Expected %s values for %s, one per interval, got %s"
+                % (n_intervals, cuid, len(values))
+            )
+        values = np.asarray(values).tolist()
+        _load_interval_values(var, time_list, time_points, lo, hi, values, time_tol)
 
 
 def interval_data_from_time_series(data, use_left_endpoint=False):
@@ -130,3 +229,51 @@ def interval_data_from_time_series(data, use_left_endpoint=False):
             ]
             interval_data[name] = dict(zip(intervals, interval_values))
         return interval_data
+
+
+def compact_interval_data_from_time_series(data, use_left_endpoint=False):
+    """
+    This function converts time series data to piecewise constant
+    interval data in a compact form: an array of breakpoints and, for
+    each name, an array of the values on the intervals between
+    consecutive breakpoints. This is an alternative to the dicts of
+    tuple-keyed dicts returned by interval_data_from_time_series, and
+    can be loaded into a model with load_compact_inputs_into_model.
+
+    In:
+        ([t0, ...], {str(cuid): [value0, ...], },)
+    Out:
+        (array([t0, t1, ...]), {str(cuid): array([value0 or value1, ...]),})
+
+    Arguments
+    ---------
+    data: tuple
+        First entry is a list of time points, second entry is a dict
+        mapping names each to a list of values at the corresponding time
+        point
+    use_left_endpoint: bool
+        Optional. Indicates whether each interval should take the value
+        of its left endpoint. Default is False, i.e. each interval takes
+        the value of its right endpoint.
+
+    Returns
+    -------
+    tuple
+        Array of breakpoints and a dict mapping names to arrays of the
+        values over each interval
+
+    """
+    time, value_dict = data
+    breakpoints = np.asarray(time, dtype=float)
+    if len(breakpoints) == 1:
+        # A single time point is the interval (t0, t0)
+        t0 = breakpoints[0]
+        return (
+            np.array([t0, t0]),
+            {name: np.asarray(values[:1]) for name, values in value_dict.items()},
+        )
+    interval_values = {}
+    for name, values in value_dict.items():
+        values = np.asarray(values)
+        interval_values[name] = values[:-1] if use_left_endpoint else values[1:]
+    return breakpoints, interval_values
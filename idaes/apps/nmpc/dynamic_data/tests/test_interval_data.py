@@ -10,6 +10,8 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
+import gc
+
 import pyomo.common.unittest as unittest
 import pytest
 
@@ -18,8 +20,13 @@ import pyomo.dae as dae
 from idaes.apps.nmpc.dynamic_data import (
     assert_disjoint_intervals,
     load_inputs_into_model,
+    load_compact_inputs_into_model,
     interval_data_from_time_series,
+    compact_interval_data_from_time_series,
 )
+from pyomo.common.timing import TicTocTimer
+import numpy as np
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 @pytest.mark.unit
@@ -103,6 +110,83 @@ class TestLoadInputs(unittest.TestCase):
             load_inputs_into_model(m, m.time, inputs)
 
 
+@pytest.mark.unit
+class TestLoadCompactInputs(unittest.TestCase):
+    def make_model(self):
+        m = pyo.ConcreteModel()
+        m.time = dae.ContinuousSet(initialize=[0, 1, 2, 3, 4, 5, 6])
+        m.v = pyo.Var(m.time, initialize=0)
+        return m
+
+    def test_load_inputs_some_time(self):
+        m = self.make_model()
+        inputs = ([2, 4], {"v": [1.0]})
+        load_compact_inputs_into_model(m, m.time, inputs)
+
+        for t in m.time:
+            if t == 3 or t == 4:
+                self.assertEqual(m.v[t].value, 1.0)
+            else:
+                self.assertEqual(m.v[t].value, 0.0)
+
+    def test_load_inputs_all_time(self):
+        m = self.make_model()
+        inputs = (np.array([0, 3, 6, 9]), {"v": np.array([1.0, 2.0, 3.0])})
+        load_compact_inputs_into_model(m, m.time, inputs)
+        for t in m.time:
+            if t == 0:
+                self.assertEqual(m.v[t].value, 0.0)
+            elif t <= 3:
+                self.assertEqual(m.v[t].value, 1.0)
+            else:
+                self.assertEqual(m.v[t].value, 2.0)
+
+    def test_load_inputs_tolerance(self):
+        m = self.make_model()
+        inputs = ([0.01, 2.99, 6.0], {"v": [1.0, 2.0]})
+        load_compact_inputs_into_model(m, m.time, inputs)
+        self.assertEqual([m.v[t].value for t in m.time], [0, 0, 0, 0, 0, 0, 0])
+
+        load_compact_inputs_into_model(m, m.time, inputs, time_tol=0.05)
+        self.assertEqual([m.v[t].value for t in m.time], [0, 1, 1, 1, 2, 2, 2])
+
+    def test_load_inputs_singleton(self):
+        m = self.make_model()
+        inputs = compact_interval_data_from_time_series(([2.0], {"v": [5.0]}))
+        load_compact_inputs_into_model(m, m.time, inputs)
+        self.assertEqual([m.v[t].value for t in m.time], [0, 0, 5, 0, 0, 0, 0])
+
+    def test_load_inputs_exception(self):
+        m = self.make_model()
+        with self.assertRaisesRegex(RuntimeError, "Could not find"):
+            load_compact_inputs_into_model(m, m.time, ([0, 3], {"_v": [1.0]}))
+        with self.assertRaisesRegex(RuntimeError, "nondecreasing"):
+            load_compact_inputs_into_model(m, m.time, ([3, 0], {"v": [1.0]}))
+        with self.assertRaisesRegex(ValueError, "one per interval"):
+            load_compact_inputs_into_model(m, m.time, ([0, 3], {"v": [1.0, 2.0]}))
+
+    def test_same_as_interval_data(self):
+        series = ([0.0, 1.5, 2.0, 4.0, 6.0], {"v": [1.0, 2.0, 3.0, 4.0, 5.0]})
+        for use_left_endpoint in [False, True]:
+            m1 = self.make_model()
+            m2 = self.make_model()
+            load_inputs_into_model(
+                m1,
+                m1.time,
+                interval_data_from_time_series(series, use_left_endpoint),
+                time_tol=0.6,
+            )
+            load_compact_inputs_into_model(
+                m2,
+                m2.time,
+                compact_interval_data_from_time_series(series, use_left_endpoint),
+                time_tol=0.6,
+            )
+            self.assertEqual(
+                [m1.v[t].value for t in m1.time], [m2.v[t].value for t in m2.time]
+            )
+
+
 @pytest.mark.unit
 class TestIntervalFromTimeSeries(unittest.TestCase):
     def test_singleton(self):
@@ -159,3 +243,92 @@ class TestIntervalFromTimeSeries(unittest.TestCase):
                 name: {(1, 2): 4.0, (2, 3): 5.0},
             },
         )
+
+    def test_compact_interval_from_series(self):
+        name = "name"
+        series = ([1, 2, 3], {name: [4.0, 5.0, 6.0]})
+        breakpoints, values = compact_interval_data_from_time_series(series)
+        self.assertEqual(breakpoints.tolist(), [1, 2, 3])
+        self.assertEqual(values[name].tolist(), [5.0, 6.0])
+
+        breakpoints, values = compact_interval_data_from_time_series(
+            series, use_left_endpoint=True
+        )
+        self.assertEqual(values[name].tolist(), [4.0, 5.0])
+
+        breakpoints, values = compact_interval_data_from_time_series(([], {name: []}))
+        self.assertEqual(len(breakpoints), 0)
+        self.assertEqual(len(values[name]), 0)
+
+
+def _load_inputs_by_interval(model, time, input_data, time_tol=0):
+    # Reference implementation that searches the time set for both
+    # endpoints of every interval.
+    for cuid, inputs in input_data.items():
+        var = model.find_component(cuid)
+        for interval in sorted(inputs.keys()):
+            idx0 = time.find_nearest_index(interval[0], tolerance=time_tol)
+            idx1 = time.find_nearest_index(interval[1], tolerance=time_tol)
+            if idx0 is None or idx1 is None:
+                continue
+            idx_iter = range(idx0 + 1, idx1 + 1) if idx0 != idx1 else (idx0,)
+            for idx in idx_iter:
+                var[time.at(idx)].set_value(inputs[interval])
+
+
+@pytest.mark.performance
+class TestLoadInputsPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to load piecewise constant inputs into a model one
+    interval at a time and with the vectorized loaders.
+    """
+
+    # Two hour profiles with one minute intervals, on a 1 second grid
+    n_intervals = 2 * 60
+
+    def build_model(self):
+        m = pyo.ConcreteModel()
+        m.time = dae.ContinuousSet(initialize=np.arange(0, self.n_intervals * 60 + 1))
+        m.inputs = pyo.Set(initialize=range(5))
+        m.v = pyo.Var(m.inputs, m.time, initialize=0)
+        return m
+
+    @pytest.mark.performance
+    def test_performance(self):
+        n_intervals = self.n_intervals
+        m = self.build_model()
+        series = (
+            [60.0 * i for i in range(n_intervals + 1)],
+            {
+                f"v[{j},*]": [float(i + j) for i in range(n_intervals + 1)]
+                for j in m.inputs
+            },
+        )
+        interval_data = interval_data_from_time_series(series)
+        compact_data = compact_interval_data_from_time_series(series)
+
+        gc.collect()
+        timer = TicTocTimer()
+        _load_inputs_by_interval(m, m.time, interval_data)
+        self.recordData(
+            "by interval", timer.toc(f"{n_intervals} intervals by interval")
+        )
+        expected = [m.v[j, t].value for j in m.inputs for t in m.time]
+        m.v.set_values({idx: 0 for idx in m.v})
+
+        gc.collect()
+        timer.tic(None)
+        load_inputs_into_model(m, m.time, interval_data)
+        self.recordData(
+            "interval data", timer.toc(f"{n_intervals} intervals, interval data")
+        )
+        assert [m.v[j, t].value for j in m.inputs for t in m.time] == expected
+        m.v.set_values({idx: 0 for idx in m.v})
+
+        gc.collect()
+        timer.tic(None)
+        load_compact_inputs_into_model(m, m.time, compact_data)
+        self.recordData(
+            "compact data", timer.toc(f"{n_intervals} intervals, compact data")
+        )
+        assert [m.v[j, t].value for j in m.inputs for t in m.time] == expected
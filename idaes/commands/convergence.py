@@ -141,8 +141,36 @@ def convergence_sample(
     type=str,
     help="Run only a single sample with given name",
 )
+@click.option(
+    "--schedule",
+    default="static",
+    type=click.Choice(["static", "dynamic"]),
+    help="Split samples evenly across MPI processes up front (static) or hand "
+    "them out to idle workers one at a time (dynamic)",
+)
+@click.option(
+    "-n",
+    "--number-workers",
+    default=None,
+    type=int,
+    help="Number of local worker processes for the dynamic schedule without MPI",
+)
+@click.option(
+    "--reuse-model",
+    is_flag=True,
+    default=False,
+    help="Build one model per process and reset it between samples",
+)
 def convergence_eval(
-    sample_file, dmf, report_file, json_file, convergence_module, single_sample
+    sample_file,
+    dmf,
+    report_file,
+    json_file,
+    convergence_module,
+    single_sample,
+    schedule,
+    number_workers,
+    reuse_model,
 ):
     import idaes.models.convergence
     import idaes.models_extra.convergence
@@ -157,7 +185,10 @@ def convergence_eval(
             return -1
     if single_sample is None:
         (inputs, samples, results) = cnv.run_convergence_evaluation_from_sample_file(
-            sample_file=sample_file
+            sample_file=sample_file,
+            schedule=schedule,
+            n_workers=number_workers,
+            reuse_model=reuse_model,
         )
         if results is not None:
             cnv.save_convergence_statistics(
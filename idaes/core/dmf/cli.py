@@ -18,6 +18,7 @@ Uses "Click" to handle command-line parsing and dispatch.
 # stdlib
 import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 import json
@@ -382,8 +383,8 @@ def _show_optional_workspace_items(d, items, indent_spc, item_fn, t=None):
                         print(item_fn(i2, v2, before=indent2))
 
 
-@click.command(help="Register a new object in the DMF workspace")
-@click.argument("url", type=URLType(), metavar="FILE")
+@click.command(help="Register new objects in the DMF workspace")
+@click.argument("urls", type=URLType(), metavar="FILE...", nargs=-1, required=True)
 @click.option("--info", help="Show info on created resource", flag_value="yes")
 @click.option(
     "--copy/--no-copy",
@@ -442,9 +443,17 @@ def _show_optional_workspace_items(d, items, indent_spc, item_fn, t=None):
     help="Set semantic version for this resource (default=0.0.0)",
     default=None,
 )
+@click.option(
+    "--threads",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of threads used to hash and copy the files, "
+    "when registering more than one file",
+)
 def register(
     resource_type,
-    url,
+    urls,
     info,
     copy,
     strict,
@@ -455,20 +464,32 @@ def register(
     prev,
     is_subject,
     version,
+    threads,
 ):
-    _log.debug(f"Register object type='{resource_type}' url/path='{url.path}'")
-    # process url
-    if url.scheme in ("file", ""):
-        path = url.path
-    else:
-        click.echo("Currently, URL must be a file")
-        sys.exit(Code.NOT_SUPPORTED.value)
-    # create the resource
-    _log.debug("create resource")
-    try:
-        rsrc = resource.Resource.from_file(
+    # process urls
+    paths = []
+    for url in urls:
+        _log.debug(f"Register object type='{resource_type}' url/path='{url.path}'")
+        if url.scheme in ("file", ""):
+            paths.append(url.path)
+        else:
+            click.echo("Currently, URL must be a file")
+            sys.exit(Code.NOT_SUPPORTED.value)
+
+    # create the resources
+    def from_file(path):
+        return resource.Resource.from_file(
             path, as_type=resource_type, strict=strict, do_copy=copy
         )
+
+    _log.debug(f"create {len(paths)} resource(s)")
+    try:
+        if len(paths) == 1:
+            rsrc_list = [from_file(paths[0])]
+        else:
+            # hashing the files dominates, so use threads
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                rsrc_list = list(pool.map(from_file, paths))
     except resource.Resource.InferResourceTypeError as err:
         click.echo(f"Failed to infer resource: {err}")
         sys.exit(Code.IMPORT_RESOURCE.value)
@@ -486,19 +507,22 @@ def register(
         sys.exit(Code.DMF.value)
     # check uniqueness
     if unique:
-        df = rsrc.v["datafiles"][0]  # file info for this upload
-        query = {"datafiles": [{"sha1": df["sha1"]}]}
-        query_result, dup_ids = dmf.find(query), []
-        for dup in query_result:
-            dup_df = dup.v["datafiles"][0]
-            if dup_df["path"] in df["path"]:
-                dup_ids.append(dup.id)
-        n_dup = len(dup_ids)
-        if n_dup > 0:
-            click.echo(
-                f"This file is already in {n_dup} resource(s): " f"{' '.join(dup_ids)}"
-            )
-            sys.exit(Code.DMF_OPER.value)
+        for rsrc in rsrc_list:
+            df = rsrc.v["datafiles"][0]  # file info for this upload
+            query = {"datafiles": [{"sha1": df["sha1"]}]}
+            query_result, dup_ids = dmf.find(query), []
+            for dup in query_result:
+                dup_df = dup.v["datafiles"][0]
+                if dup_df["path"] in df["path"]:
+                    dup_ids.append(dup.id)
+            n_dup = len(dup_ids)
+            if n_dup > 0:
+                where = "This file" if len(rsrc_list) == 1 else f"File '{df['path']}'"
+                click.echo(
+                    f"{where} is already in {n_dup} resource(s): "
+                    f"{' '.join(dup_ids)}"
+                )
+                sys.exit(Code.DMF_OPER.value)
     # process relations
     _log.debug("add relations")
     rel_to_add = {  # translate into standard relation names
@@ -518,11 +542,12 @@ def register(
             if rel_subj is None:
                 click.echo(f"Relation {rel_name} target not found: {rel_id}")
                 sys.exit(Code.DMF_OPER.value)
-            if is_subject == "yes":
-                resource.create_relation(rsrc, rel_name, rel_subj)
-            else:
-                resource.create_relation(rel_subj, rel_name, rsrc)
-            _log.debug(f"added relation {rsrc.id} <-- {rel_name} -- {rel_id}")
+            for rsrc in rsrc_list:
+                if is_subject == "yes":
+                    resource.create_relation(rsrc, rel_name, rel_subj)
+                else:
+                    resource.create_relation(rel_subj, rel_name, rsrc)
+                _log.debug(f"added relation {rsrc.id} <-- {rel_name} -- {rel_id}")
     _log.debug("update resource relations")
     for rel_rsrc in target_resources.values():
         dmf.update(rel_rsrc)
@@ -534,22 +559,27 @@ def register(
             click.echo(f"Invalid version `{version}`")
             sys.exit(Code.INPUT_VALUE.value)
         else:
-            rsrc.v["version_info"]["version"] = vlist
-    # add the resource
-    _log.debug("add resource begin")
+            for rsrc in rsrc_list:
+                rsrc.v["version_info"]["version"] = vlist
+    # add the resources
+    _log.debug("add resources begin")
     try:
-        new_id = dmf.add(rsrc)
+        if len(rsrc_list) == 1:
+            new_ids = [dmf.add(rsrc_list[0])]
+        else:
+            new_ids = dmf.add_many(rsrc_list, max_workers=threads)
     except errors.DuplicateResourceError as err:
         click.echo(f"Failed to add resource: {err}")
         sys.exit(Code.DMF_OPER.value)
-    _log.debug(f"added resource: {new_id}")
-    if info == "yes":
-        pfxlen = len(new_id)
-        si = _ShowInfo("term", pfxlen)
-        for rsrc in dmf.find_by_id(new_id):
-            si.show(rsrc)
-    else:
-        click.echo(new_id)
+    _log.debug(f"added resources: {' '.join(new_ids)}")
+    for new_id in new_ids:
+        if info == "yes":
+            pfxlen = len(new_id)
+            si = _ShowInfo("term", pfxlen)
+            for rsrc in dmf.find_by_id(new_id):
+                si.show(rsrc)
+        else:
+            click.echo(new_id)
 
 
 @click.command(help="List resources in the workspace")
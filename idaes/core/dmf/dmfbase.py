@@ -14,6 +14,8 @@
 Data Management Framework
 """
 # stdlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import IOBase
 import logging
@@ -33,7 +35,7 @@ import yaml
 
 # local
 from . import errors
-from .resource import Resource
+from .resource import Resource, hash_file
 from . import resourcedb
 from . import workspace
 from .util import yaml_load, as_path
@@ -46,6 +48,10 @@ _log = logging.getLogger(__name__)
 # Used to discover the package 'data' directory
 IDAES_DIST_NAME = "idaes-pse"
 
+# A datafile to copy into the workspace: source and destination paths,
+# datafile entry of the resource, and whether to remove the source
+_DatafileCopy = namedtuple("_DatafileCopy", ["src", "dest", "datafile", "is_tmp"])
+
 
 class DMFConfig(object):
     """Global DMF configuration.
@@ -535,7 +541,49 @@ class DMF(workspace.Workspace, HasTraits):
         self._resources[resource.id] = resource
         return resource
 
-    def _copy_files(self, rsrc):
+    def add_many(self, resources, max_workers=None):
+        """Add a list of resources and their associated files.
+
+        This is the bulk version of :meth:`add`, for e.g. registering a
+        directory with thousands of data files. The datafiles of all the
+        resources are hashed (if they have no "sha1" value yet) and copied
+        with a pool of threads. Files with identical contents are only
+        copied once: the other copies are hard links to the first one
+        (or, where links are not supported, copies of it). Then all the
+        resource records are added to the database in a single write.
+
+        Args:
+            resources (list[Resource]): The resources
+            max_workers (int): Number of threads used to hash and copy
+                the files. If None, use the default of
+                :class:`concurrent.futures.ThreadPoolExecutor`.
+        Returns:
+            (list[str]) Resource IDs, in the same order as the resources
+        Raises:
+            DMFError, DuplicateResourceError
+        """
+        resources = list(resources)
+        # Note: this updates paths in the Resources, so should come first
+        copies = []
+        for rsrc in resources:
+            if "datafiles" in rsrc.v:
+                self._copy_files(rsrc, copies=copies)
+        self._copy_datafiles(copies, max_workers=max_workers)
+        # Add resources
+        try:
+            self._db.put_many(resources)
+        except errors.DuplicateResourceError as err:
+            _log.error("Cannot add resources: {}".format(err))
+            raise
+        # if that worked, remember in session store
+        for rsrc in resources:
+            self._resources[rsrc.id] = rsrc
+        return [rsrc.id for rsrc in resources]
+
+    def _copy_files(self, rsrc, copies=None):
+        # If `copies` is a list, the files are not copied here. Instead a
+        # _DatafileCopy is appended to the list for each file to copy,
+        # and the caller must pass the list to _copy_datafiles().
         # determine whether *any* of the files are being copied
         # since, if not, we don't need the 'datafiles_dir'
         any_copy = rsrc.do_copy
@@ -586,37 +634,18 @@ class DMF(workspace.Workspace, HasTraits):
                 filepath = datafile["path"]
                 _, filename = os.path.split(filepath)
                 copydir = os.path.join(ddir, filename)
-                _log.debug(
-                    'Copying datafile "{}" to directory "{}"'.format(filepath, copydir)
-                )
-                try:
-                    shutil.copy2(filepath, copydir)
-                except (IOError, OSError) as err:
-                    msg = (
-                        'Cannot copy datafile from "{}" to DMF '
-                        'directory "{}": {}'.format(filepath, copydir, err)
-                    )
-                    _log.error(msg)
-                    raise errors.DMFError(msg)
                 # The `is_tmp` flag means to remove the original resource file
                 # after the copy is done.
                 if "is_tmp" in datafile:
                     is_tmp = datafile["is_tmp"]
+                    del datafile["is_tmp"]  # remove this directive
                 else:
                     is_tmp = rsrc.is_tmp
-                if is_tmp:
-                    _log.debug(
-                        "Temporary datafile flag is on, removing "
-                        'original datafile "{}"'.format(filepath)
-                    )
-                    try:
-                        os.unlink(filepath)
-                    except OSError as err:
-                        _log.error(
-                            'Removing temporary datafile "{}": {}'.format(filepath, err)
-                        )
-                    if "is_tmp" in datafile:  # remove this directive
-                        del datafile["is_tmp"]
+                copy = _DatafileCopy(filepath, copydir, datafile, is_tmp)
+                if copies is None:
+                    self._copy_datafiles([copy])
+                else:
+                    copies.append(copy)
                 datafile["path"] = filename
                 datafile["is_copy"] = True
                 if "do_copy" in datafile:  # remove this directive
@@ -631,6 +660,83 @@ class DMF(workspace.Workspace, HasTraits):
         else:
             rsrc.v["datafiles_dir"] = str(ddir) if ddir else ""
 
+    @classmethod
+    def _copy_datafiles(cls, copies, max_workers=None):
+        """Copy datafiles into the DMF workspace, removing the originals
+        of temporary files.
+
+        Args:
+            copies (list[_DatafileCopy]): The files to copy
+            max_workers (int): Number of threads. Only used for more than
+                one file.
+        Raises:
+            DMFError: If a file cannot be copied
+        """
+        if len(copies) == 1:
+            cls._copy_datafile_group(copies)
+            return
+        if not copies:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # hash the files without a hash, to find identical contents
+            unhashed = [c for c in copies if not c.datafile.get("sha1", None)]
+            hashes = pool.map(cls._hash_datafile, [c.src for c in unhashed])
+            for c, file_hash in zip(unhashed, list(hashes)):
+                c.datafile["sha1"] = file_hash
+            # copy each distinct file once
+            groups = {}
+            for c in copies:
+                groups.setdefault(c.datafile["sha1"], []).append(c)
+            # list() to raise the first error, if any
+            list(pool.map(cls._copy_datafile_group, groups.values()))
+
+    @staticmethod
+    def _hash_datafile(path):
+        try:
+            return hash_file(path)
+        except (IOError, OSError) as err:
+            msg = 'Cannot read datafile "{}": {}'.format(path, err)
+            _log.error(msg)
+            raise errors.DMFError(msg)
+
+    @staticmethod
+    def _copy_datafile_group(copies):
+        """Copy the first of a group of files with identical contents, and
+        link (or, if that fails, copy) the others to it.
+        """
+        first = copies[0]
+        for c in copies:
+            _log.debug('Copying datafile "{}" to "{}"'.format(c.src, c.dest))
+            try:
+                if c is first:
+                    shutil.copy2(c.src, c.dest)
+                else:
+                    try:
+                        os.link(first.dest, c.dest)
+                    except OSError:
+                        shutil.copy2(first.dest, c.dest)
+            except (IOError, OSError) as err:
+                msg = (
+                    'Cannot copy datafile from "{}" to DMF '
+                    'directory "{}": {}'.format(c.src, c.dest, err)
+                )
+                _log.error(msg)
+                raise errors.DMFError(msg)
+        removed = set()
+        for c in copies:
+            if c.is_tmp and c.src not in removed:
+                removed.add(c.src)
+                _log.debug(
+                    "Temporary datafile flag is on, removing "
+                    'original datafile "{}"'.format(c.src)
+                )
+                try:
+                    os.unlink(c.src)
+                except OSError as err:
+                    _log.error(
+                        'Removing temporary datafile "{}": {}'.format(c.src, err)
+                    )
+
     def count(self):
         return len(self._db)
 
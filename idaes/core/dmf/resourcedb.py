@@ -14,9 +14,15 @@
 Resource database.
 """
 # system
+from bisect import insort
+import copy
 from datetime import datetime
+import hashlib
+import json
 import logging
+import os
 import re
+import time
 
 # third party
 from tinydb import TinyDB, Query
@@ -30,9 +36,155 @@ __author__ = "Dan Gunter <dkgunter@lbl.gov>"
 
 _log = logging.getLogger(__name__)
 
+# Database files modified within this many nanoseconds of the last index
+# update are checked by content
+_RACY_NS = 1_000_000_000
+
+
+class _ResourceIndex(object):
+    """In-memory secondary index of the resources in a ResourceDB table.
+
+    Holds a copy of every stored resource by its internal (document)
+    identifier, along with lookup tables from the resource identifier,
+    type, tags, names (aliases) and datafile hashes to internal
+    identifiers, and the
+    relations between resources as adjacency lists for each direction.
+    Entries are kept in internal identifier order, which is the order
+    of a full scan of the table, so results do not depend on whether
+    the index is used.
+    """
+
+    #: Fields with a lookup table from each value to internal identifiers
+    FIELDS = (Resource.TYPE_FIELD, "tags", "aliases", "datafiles.sha1")
+
+    def __init__(self, table):
+        self.docs = {}
+        self.ids = {}
+        self.values = {f: {} for f in self.FIELDS}
+        # outgoing (True) or incoming (False) -> resource id -> sorted list
+        # of (internal id, position in relations, subject, predicate, object)
+        self.edges = {True: {}, False: {}}
+        for doc in table.all():
+            self.add(doc.doc_id, dict(doc))
+
+    @classmethod
+    def _field_values(cls, doc, field):
+        if field == "datafiles.sha1":
+            datafiles = doc.get("datafiles", None) or []
+            value = [df.get("sha1", None) for df in datafiles if isinstance(df, dict)]
+        else:
+            value = doc.get(field, None)
+        if value is None:
+            return []
+        values = value if isinstance(value, list) else [value]
+        return [v for v in values if isinstance(v, (str, int, float))]
+
+    @staticmethod
+    def _edges(doc):
+        uuid = doc.get(Resource.ID_FIELD, None)
+        for pos, rrel in enumerate(doc.get("relations", None) or []):
+            rel = triple_from_resource_relations(uuid, rrel)
+            # As in a scan, the edge from the subject is stored by the
+            # object (the end of the edge) and vice versa
+            if rel.subject != uuid:
+                yield True, rel.subject, pos, rel
+            if rel.object != uuid:
+                yield False, rel.object, pos, rel
+
+    def add(self, doc_id, doc):
+        """Add a stored resource to the index."""
+        self.docs[doc_id] = doc
+        self.ids[doc.get(Resource.ID_FIELD, None)] = doc_id
+        for f in self.FIELDS:
+            for v in self._field_values(doc, f):
+                self.values[f].setdefault(v, set()).add(doc_id)
+        for outgoing, key, pos, rel in self._edges(doc):
+            insort(self.edges[outgoing].setdefault(key, []), (doc_id, pos) + rel)
+
+    def remove(self, doc_id):
+        """Remove a stored resource from the index."""
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        id_ = doc.get(Resource.ID_FIELD, None)
+        if self.ids.get(id_, None) == doc_id:
+            del self.ids[id_]
+        for f in self.FIELDS:
+            for v in self._field_values(doc, f):
+                self.values[f][v].discard(doc_id)
+                if not self.values[f][v]:
+                    del self.values[f][v]
+        for outgoing, key, pos, rel in self._edges(doc):
+            edge_list = [e for e in self.edges[outgoing][key] if e[0] != doc_id]
+            if edge_list:
+                self.edges[outgoing][key] = edge_list
+            else:
+                del self.edges[outgoing][key]
+
+    def candidates(self, filter_dict):
+        """Get the internal identifiers of resources that may match a filter.
+
+        Only the equality conditions on the identifier and type, the list
+        conditions on the tags and names, and a condition on the hash of
+        a single datafile (``{"datafiles": [{"sha1": value}]}``), are
+        looked up in the index.
+        The result is a superset of the matching resources, to which the
+        full filter still has to be applied.
+
+        Returns:
+            Sorted list of internal identifiers, or None if no condition
+            of the filter could be looked up
+        """
+        result = None
+        for k, v in filter_dict.items():
+            qry_all = False
+            if isinstance(v, list) and k.endswith("!"):
+                k, qry_all = k[:-1], True
+            if k == Resource.ID_FIELD and self._is_plain_value(v):
+                found = {self.ids[v]} if v in self.ids else set()
+            elif k == Resource.TYPE_FIELD and self._is_plain_value(v):
+                found = self.values[k].get(v, set())
+            elif (
+                k in ("tags", "aliases")
+                and isinstance(v, list)
+                and len(v) > 0
+                and all(self._is_plain_value(x) for x in v)
+            ):
+                sets = [self.values[k].get(x, set()) for x in v]
+                if qry_all:
+                    found = set.intersection(*sets)
+                else:
+                    found = set.union(*sets)
+            elif (
+                k == "datafiles"
+                and isinstance(v, list)
+                and len(v) == 1
+                and isinstance(v[0], dict)
+                and list(v[0].keys()) == ["sha1"]
+                and self._is_plain_value(v[0]["sha1"])
+            ):
+                found = self.values["datafiles.sha1"].get(v[0]["sha1"], set())
+            else:
+                continue
+            result = set(found) if result is None else result & found
+        return None if result is None else sorted(result)
+
+    @staticmethod
+    def _is_plain_value(v):
+        # values without special (regex, "@" or comparison) meaning in a filter
+        return isinstance(v, str) and not v.startswith(("~", "@"))
+
 
 class ResourceDB(object):
-    """A database interface to all the resources within a given DMF workspace."""
+    """A database interface to all the resources within a given DMF workspace.
+
+    Queries are answered from an in-memory index of the resources (see
+    :class:`_ResourceIndex`), which is built from the database file the
+    first time it is needed, so existing workspaces can be used as-is.
+    Writes through this object update both the file and the index. If the
+    file is modified by anything else, e.g. another process, the index is
+    rebuilt before the next query.
+    """
 
     def __init__(self, dbfile=None, connection=None):
         """Initialize from DMF and given configuration field.
@@ -49,6 +201,11 @@ class ResourceDB(object):
         """
         self._db = None
         self._gr = None
+        self._path = None
+        self._index = None
+        self._index_stamp = None
+        self._index_time = None
+        self._index_digest = None
 
         if connection is not None:
             self._db = connection
@@ -59,9 +216,65 @@ class ResourceDB(object):
                 raise errors.FileError('Cannot open resource DB "{}"'.format(dbfile))
             # turn off caching, otherwise update() does not work properly
             self._db = db.table("resources", cache_size=0)
+            self._path = dbfile
 
     def __len__(self):
-        return len(self._db)
+        return len(self._get_index().docs)
+
+    def _file_stamp(self):
+        # modification signature of the database file
+        if self._path is None:
+            return None
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _file_digest(self):
+        try:
+            with open(self._path, "rb") as f:
+                return hashlib.sha1(f.read()).digest()
+        except OSError:
+            return None
+
+    def _index_is_current(self):
+        stamp = self._file_stamp()
+        if self._index is None or stamp != self._index_stamp:
+            return False
+        if stamp is None:
+            return True
+        # The file modification time has a coarse resolution, so the file
+        # may have been modified again, with the same signature, right after
+        # the index was updated. In that case also compare the contents.
+        if stamp[0] >= self._index_time - _RACY_NS:
+            return self._file_digest() == self._index_digest
+        return True
+
+    def _get_index(self):
+        """Get the index, (re)building it if the database file has changed."""
+        if not self._index_is_current():
+            _log.debug("build resource index")
+            self._index = _ResourceIndex(self._db)
+            self._written()
+        return self._index
+
+    def _written(self):
+        # record that the index is up to date with the file
+        self._index_time = time.time_ns()
+        self._index_stamp = self._file_stamp()
+        self._index_digest = self._file_digest() if self._path else None
+
+    @staticmethod
+    def _stored_value(value):
+        # copy of a value as it is stored in (and read back from) the JSON file
+        return json.loads(json.dumps(value))
+
+    @staticmethod
+    def _as_resource(doc_id, doc):
+        rsrc = Resource(value=copy.deepcopy(doc))
+        rsrc.v["doc_id"] = doc_id
+        return rsrc
 
     def find(self, filter_dict, id_only=False, flags=0):
         """Find and return records based on the provided filter.
@@ -77,31 +290,25 @@ class ResourceDB(object):
             generator of int|Resource, depending on the value of `id_only`
         """
 
-        def as_resource(_r):
-            _log.debug(f"as_resource: id_={_r['id_']}")
-            rsrc = Resource(value=_r)
-            rsrc.v["doc_id"] = _r.doc_id
-            return rsrc
-
+        index = self._get_index()
         # with no filter, do a find-all
         if not filter_dict:
-            for r in self._db.all():
-                if id_only:
-                    yield r.doc_id
-                else:
-                    yield as_resource(r)
-            return
-        filter_expr = self._create_filter_expr(filter_dict, flags)
-
-        # return results for query
-        _log.debug("Find resources matching: {}".format(filter_expr))
-        results = self._db.search(filter_expr)
-        for r in results:
+            doc_ids = list(index.docs)
+        else:
+            filter_expr = self._create_filter_expr(filter_dict, flags)
+            _log.debug("Find resources matching: {}".format(filter_expr))
+            # check the filter only against the resources found in the index
+            candidates = index.candidates(filter_dict)
+            if candidates is None:
+                candidates = index.docs
+            doc_ids = [i for i in candidates if filter_expr(index.docs[i])]
+        docs = [index.docs[i] for i in doc_ids]
+        for doc_id, doc in zip(doc_ids, docs):
             if id_only:
-                yield r.doc_id
+                yield doc_id
             else:
-                _log.debug(f"got resource: {r}")
-                yield as_resource(r)
+                _log.debug(f"got resource: {doc}")
+                yield self._as_resource(doc_id, doc)
 
     @classmethod
     def _create_filter_expr(cls, filter_dict, flags=0):
@@ -250,45 +457,35 @@ class ResourceDB(object):
         """
         if maxdepth <= 0:
             maxdepth = 9223372036854775807
-        # Get an iterator over all the resources, optionally
-        # filtered by an expression, as for find().
+        index = self._get_index()
+        # Optionally restrict the relations to resources matching a filter,
+        # as for find().
+        allowed = None
         if filter_dict:
-            filter_expr = self._create_filter_expr(filter_dict)
-            resource_list = self._db.search(filter_expr)
-        else:
-            resource_list = self._db.all()
-        # build adjacency list representing connections between resources
-        relation_map = {}
-        for rsrc in resource_list:
-            # print(f"@@ process resource: {rsrc[Resource.ID_FIELD]}")
-            # print(f"@@ resource relations: {rsrc['relations']}")
-            for rrel in rsrc["relations"]:
-                uuid = rsrc[Resource.ID_FIELD]
-                rel = triple_from_resource_relations(uuid, rrel)
-                # skip start of edge, get metadata, etc. at end of edge
-                if (outgoing and rel.subject == uuid) or (
-                    not outgoing and rel.object == uuid
-                ):
-                    # print(f"@@ do nothing for: {uuid}")
+            allowed = set(self.find(filter_dict, id_only=True))
+        edges = index.edges[outgoing]
+
+        def relations_from(key):
+            # relations from (or to, if not outgoing) the resource, with the
+            # metadata of the resource at the other end
+            result = []
+            for edge in edges.get(key, ()):
+                doc_id = edge[0]
+                if allowed is not None and doc_id not in allowed:
                     continue
-                # add entry in map
-                key = rel.subject if outgoing else rel.object
-                # print(f"@@ add to relation map, key={key}")
-                meta_info = {k: rsrc[k] for k in meta}
-                value = (rel.subject, rel.predicate, rel.object, meta_info)
-                value_list = relation_map.get(key, None)
-                if value_list is None:
-                    relation_map[key] = [value]
-                else:
-                    value_list.append(value)
-        _log.debug(f"built relation map: {relation_map}")
+                doc = index.docs[doc_id]
+                meta_info = copy.deepcopy({k: doc[k] for k in meta})
+                result.append(edge[2:] + (meta_info,))
+            return result
+
+        first_relations = relations_from(id_)
         # stop if there are no connections
-        if id_ not in relation_map:
+        if not first_relations:
             return
         # Do a depth-first search through the edges, yield-ing
         # the relations as we go
         q, depth, visited = [], 0, set()
-        q.extend(relation_map[id_])
+        q.extend(first_relations)
         visited.add(id_)
         while len(q) > 0 and depth < maxdepth:
             depth += 1
@@ -304,9 +501,11 @@ class ResourceDB(object):
                     # If there are relations, and we haven't already been to
                     # this node, add them at the end of the queue; we will
                     # visit them at the next depth increment.
-                    if next_id in relation_map and next_id not in visited:
-                        q.extend(relation_map[next_id])
-                        visited.add(next_id)
+                    if next_id not in visited:
+                        next_relations = relations_from(next_id)
+                        if next_relations:
+                            q.extend(next_relations)
+                            visited.add(next_id)
             q = q[n:]  # pop off all the nodes we just visited
 
     def get(self, identifier):
@@ -319,15 +518,10 @@ class ResourceDB(object):
             (Resource) A resource or None
         """
 
-        def as_resource(_r):
-            rsrc = Resource(value=_r)
-            rsrc.v["doc_id"] = _r.doc_id
-            return rsrc
-
-        item = self._db.get(doc_id=identifier)
+        item = self._get_index().docs.get(identifier, None)
         if item is None:
             return None
-        return as_resource(item)
+        return self._as_resource(identifier, item)
 
     def put(self, resource):
         """Put this resource into the database.
@@ -343,12 +537,45 @@ class ResourceDB(object):
                 in the database with the same "id".
         """
         _log.debug(f"put resource id={resource.id}")
+        index = self._get_index()
         # check for same id
-        qry = Query()
-        if self._db.contains(qry.id_ == resource.id):
+        if resource.id in index.ids:
             raise errors.DuplicateResourceError("put", resource.id)
         # add resource
-        self._db.insert(resource.v)
+        doc_id = self._db.insert(resource.v)
+        index.add(doc_id, self._stored_value(resource.v))
+        self._written()
+
+    def put_many(self, resources):
+        """Put a list of resources into the database in one write.
+
+        This is much faster than calling :meth:`put` for each resource,
+        since the database file is read and written only once. Either all
+        the resources are added, or (on error) none of them.
+
+        Args:
+            resources (list[Resource]): The resources to add
+
+        Returns:
+            None
+
+        Raises:
+            errors.DuplicateResourceError: If there is already a resource
+                in the database, or earlier in the list, with the same "id".
+        """
+        _log.debug(f"put {len(resources)} resources")
+        index = self._get_index()
+        ids = set()
+        for resource in resources:
+            if resource.id in index.ids or resource.id in ids:
+                raise errors.DuplicateResourceError("put", resource.id)
+            ids.add(resource.id)
+        if not resources:
+            return
+        doc_ids = self._db.insert_multiple([r.v for r in resources])
+        for doc_id, resource in zip(doc_ids, resources):
+            index.add(doc_id, self._stored_value(resource.v))
+        self._written()
 
     def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
         """Delete one or more resources with given identifiers.
@@ -364,20 +591,25 @@ class ResourceDB(object):
         Returns:
             (list[str]) Identifiers
         """
+        index = self._get_index()
         if internal_ids:
             doc_ids = idlist if idlist else [id_]
-            self._db.remove(doc_ids=doc_ids)
         else:
             ID = Resource.ID_FIELD
-            if filter_dict:
-                cond = self._create_filter_expr(filter_dict)
-            elif id_:
-                cond = self._create_filter_expr({ID: id_})
-            elif idlist:
-                cond = self._create_filter_expr({ID: [idlist]})
-            else:
+            if not filter_dict:
+                if id_:
+                    filter_dict = {ID: id_}
+                elif idlist:
+                    filter_dict = {ID: [idlist]}
+                else:
+                    return
+            doc_ids = list(self.find(filter_dict, id_only=True))
+            if not doc_ids:
                 return
-            self._db.remove(cond=cond)
+        removed = self._db.remove(doc_ids=doc_ids)
+        for doc_id in removed:
+            index.remove(doc_id)
+        self._written()
 
     def update(self, id_, new_dict):
         """Update the identified resource with new values.
@@ -410,4 +642,11 @@ class ResourceDB(object):
             elif old.v[k] != v:
                 changed[k] = v
         _log.debug(f"update resource {id_} with new values: {changed}")
-        self._db.update(changed, self._create_filter_expr(id_cond))
+        index = self._get_index()
+        doc_id = old.v["doc_id"]
+        self._db.update(changed, doc_ids=[doc_id])
+        doc = copy.deepcopy(index.docs[doc_id])
+        doc.update(self._stored_value(changed))
+        index.remove(doc_id)
+        index.add(doc_id, doc)
+        self._written()
@@ -15,6 +15,7 @@ Test the `idaes.core.dmf.cli` module.
 """
 # stdlib
 import logging
+import os
 from urllib.parse import urlparse
 import sys
 
@@ -25,6 +26,7 @@ import pytest
 
 # package
 from idaes.core.dmf import cli
+from idaes.core.dmf.dmfbase import DMF, DMFConfig
 
 __author__ = "Dan Gunter"
 
@@ -86,3 +88,41 @@ def test_url():
     result = ut.convert(u, None, None)
     assert result == urlparse(u)
     assert ut.convert(urlparse(u), None, None) == urlparse(u)
+
+
+@pytest.fixture
+def workspace_dmf(tmp_path, monkeypatch):
+    # use a temporary configuration, which points to a new workspace
+    config = tmp_path / ".dmf"
+    monkeypatch.setattr(DMFConfig, "_filename", str(config))
+    dmf = DMF(path=str(tmp_path / "ws"), create=True, save_path=False)
+    config.write_text(f"{DMFConfig.WORKSPACE}: {dmf.root}\n")
+    return dmf
+
+
+@pytest.mark.unit
+def test_register_many(runner, workspace_dmf, tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file{i}.csv"
+        path.write_text(f"index,value\n1,{i % 2}\n")
+        paths.append(str(path))
+    result = runner.invoke(cli.register, paths[:1] + ["--version", "1.0"])
+    assert result.exit_code == 0, result.output
+    first_id = result.output.strip()
+    # the first file is already registered
+    result = runner.invoke(cli.register, paths)
+    assert result.exit_code == cli.Code.DMF_OPER.value
+    assert "is already in 1 resource(s): " + first_id in result.output
+    result = runner.invoke(cli.register, paths[1:] + ["--prev", first_id, "-j", "2"])
+    assert result.exit_code == 0, result.output
+    new_ids = result.output.split()
+    assert len(new_ids) == 4
+
+    dmf = DMF()
+    assert dmf.count() == 5
+    for new_id, path in zip(new_ids, paths[1:]):
+        rsrc = dmf.fetch_one(new_id)
+        assert rsrc.v["datafiles"][0]["path"] == os.path.basename(path)
+        assert rsrc.v["relations"][0]["identifier"] == first_id
+    assert len(dmf.fetch_one(first_id).v["relations"]) == 4
@@ -16,6 +16,7 @@ Tests for idaes.core.dmf.dmfbase module
 Skip tests that do chmod() except on Linux, as Windows at least leaves
 the resulting directories in an un-removable state.
 """
+import gc
 import json
 import logging
 import os
@@ -25,11 +26,14 @@ from typing import Union
 
 # third-party
 import pytest
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 
 # package
 from idaes.core.dmf import resource
 from idaes.core.dmf import errors
 from idaes.core.dmf.dmfbase import DMFConfig, DMF
+from idaes.core.util.performance import PerformanceBaseClass
 from .util import init_logging, NamedTemporaryFile
 
 __author__ = "Dan Gunter <dkgunter@lbl.gov>"
@@ -349,6 +353,108 @@ def test_dmf_add_tmp_no_unlink():
     pytest.raises(Exception, dmf.add, r)
 
 
+def make_datafiles(path, num, distinct=None):
+    """Create `num` files in `path`, with `distinct` different contents."""
+    path.mkdir()
+    distinct = distinct or num
+    files = []
+    for i in range(num):
+        f = path / f"file{i}.csv"
+        f.write_text(f"index,value\n{i % distinct},{(i % distinct) * 1.5}\n" * 100)
+        files.append(f)
+    return files
+
+
+@pytest.mark.unit
+def test_dmf_add_many():
+    tmp_dir = Path(scratch_dir) / "dmf_add_many"
+    dmf = DMF(path=tmp_dir, create=True)
+    files = make_datafiles(tmp_dir / "input", 12, distinct=3)
+    resources = [resource.Resource.from_file(f) for f in files[:10]]
+    # datafiles without a hash, one of them temporary
+    r = resource.Resource(value={"desc": "test resource"})
+    r.do_copy = True
+    r.v["datafiles"].append({"path": str(files[10])})
+    r.v["datafiles"].append({"path": str(files[11]), "is_tmp": True})
+    resources.append(r)
+
+    ids = dmf.add_many(resources, max_workers=4)
+
+    assert ids == [r.id for r in resources]
+    assert dmf.count() == 11
+    assert not files[11].exists()
+    stored = [dmf.fetch_one(id_) for id_ in ids]
+    paths = {}
+    for rsrc, f in zip(stored[:10], files):
+        df = rsrc.v["datafiles"][0]
+        assert df["is_copy"]
+        assert df["path"] == f.name
+        path = Path(dmf.root, dmf.datafile_dir, rsrc.v["datafiles_dir"], df["path"])
+        assert path.read_text() == f.read_text()
+        paths.setdefault(df["sha1"], []).append(path)
+    assert len(paths) == 3
+    datafiles = stored[10].v["datafiles"]
+    assert [df["sha1"] for df in datafiles] == [
+        resource.hash_file(files[i % 3]) for i in (10, 11)
+    ]
+    assert all("is_tmp" not in df for df in datafiles)
+    # identical contents are stored once, if the filesystem has hard links
+    for same_paths in paths.values():
+        for path in same_paths[1:]:
+            if os.stat(path).st_nlink > 1:
+                assert os.path.samefile(path, same_paths[0])
+
+
+@pytest.mark.unit
+def test_dmf_add_many_duplicate():
+    tmp_dir = Path(scratch_dir) / "dmf_add_many_duplicate"
+    dmf = DMF(path=tmp_dir, create=True)
+    r = resource.Resource(value={"desc": "test resource"})
+    dmf.add(r)
+    others = [resource.Resource(value={"desc": f"other {i}"}) for i in range(3)]
+    pytest.raises(errors.DuplicateResourceError, dmf.add_many, others + [r])
+    assert dmf.count() == 1
+    assert dmf.add_many([]) == []
+
+
+@pytest.mark.unit
+def test_dmf_add_many_filesystem_err():
+    tmp_dir = Path(scratch_dir) / "dmf_add_many_filesystem_err"
+    dmf = DMF(path=tmp_dir, create=True)
+    files = make_datafiles(tmp_dir / "input", 2)
+    resources = [resource.Resource.from_file(f) for f in files]
+    files[1].unlink()
+    pytest.raises(errors.DMFError, dmf.add_many, resources)
+    assert dmf.count() == 0
+
+
+@pytest.mark.performance
+class TestDMFAddManyPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to add many file resources to a DMF one at a time and with
+    DMF.add_many.
+    """
+
+    @pytest.mark.performance
+    def test_performance(self):
+        tmp_dir = Path(scratch_dir) / "dmf_add_many_benchmark"
+        files = make_datafiles(tmp_dir, 500, distinct=50)
+
+        gc.collect()
+        timer = TicTocTimer()
+        dmf = DMF(path=tmp_dir / "one_by_one", create=True)
+        for f in files:
+            dmf.add(resource.Resource.from_file(f))
+        self.recordData("DMF.add", timer.toc(f"DMF.add: {len(files)} files"))
+        gc.collect()
+        timer.tic(None)
+        dmf_many = DMF(path=tmp_dir / "bulk", create=True)
+        dmf_many.add_many([resource.Resource.from_file(f) for f in files])
+        self.recordData("DMF.add_many", timer.toc(f"DMF.add_many: {len(files)} files"))
+
+        assert dmf.count() == dmf_many.count() == len(files)
+
+
 @pytest.mark.unit
 def test_dmf_update():
     tmp_dir = Path(scratch_dir) / "dmf_update"
@@ -0,0 +1,282 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Tests for the indexed queries of idaes.core.dmf.resourcedb
+"""
+# stdlib
+import gc
+import os
+import tempfile
+
+# third-party
+import pytest
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
+from tinydb import TinyDB
+
+# local
+from idaes.core.dmf import errors
+from idaes.core.dmf.resource import Resource, ResourceTypes, Predicates
+from idaes.core.dmf.resource import create_relation
+from idaes.core.dmf.resourcedb import ResourceDB
+from idaes.core.util.performance import PerformanceBaseClass
+
+__author__ = "Dan Gunter"
+
+
+def scan(path, filter_dict):
+    """Internal ids of the resources matching a filter, by a full scan."""
+    db = TinyDB(path)
+    try:
+        table = db.table("resources", cache_size=0)
+        if not filter_dict:
+            return [r.doc_id for r in table.all()]
+        expr = ResourceDB._create_filter_expr(filter_dict)
+        return [r.doc_id for r in table.search(expr)]
+    finally:
+        db.close()
+
+
+def make_resources(n):
+    types = [ResourceTypes.data, ResourceTypes.experiment, ResourceTypes.code]
+    resources = []
+    for i in range(n):
+        r = Resource(type_=types[i % 3], name=f"r{i}")
+        r.v["tags"] = [f"tag{i % 4}", f"group{i % 5}"]
+        r.v["data"] = {"index": i}
+        r.v["datafiles"] = [{"path": f"r{i}.csv", "sha1": f"{i % 6:040x}"}]
+        resources.append(r)
+    # a chain of derived resources, and uses from every 10th to the first
+    for i in range(1, n):
+        create_relation(resources[i - 1], Predicates.derived, resources[i])
+        if i % 10 == 0:
+            create_relation(resources[i], Predicates.uses, resources[0])
+    return resources
+
+
+@pytest.fixture
+def rdb(tmp_path):
+    path = str(tmp_path / "resourcedb.json")
+    rdb = ResourceDB(path)
+    for r in make_resources(30):
+        rdb.put(r)
+    return rdb, path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filter_dict",
+    [
+        {},
+        {"type": ResourceTypes.data},
+        {"tags": ["tag1"]},
+        {"tags": ["tag1", "group2"]},
+        {"tags!": ["tag1", "group2"]},
+        {"aliases": ["r7"]},
+        {"aliases": ["r7"], "type": ResourceTypes.experiment},
+        {"aliases": ["r7"], "type": ResourceTypes.data},
+        {"type": ResourceTypes.code, "data.index": {"$gt": 10}},
+        {"aliases": ["~r1.*"]},
+        {"datafiles": [{"sha1": f"{2:040x}"}]},
+        {"datafiles": [{"sha1": f"{2:040x}"}], "tags": ["tag1"]},
+        {"datafiles": [{"sha1": "none"}]},
+        {"datafiles": [{"sha1": f"{2:040x}", "path": "r8.csv"}]},
+        {"desc": ""},
+        {"nonexistent": True},
+    ],
+)
+def test_find_matches_scan(rdb, filter_dict):
+    rdb, path = rdb
+    assert list(rdb.find(filter_dict, id_only=True)) == scan(path, filter_dict)
+
+
+@pytest.mark.unit
+def test_find_by_id(rdb):
+    rdb, path = rdb
+    ids = [r.id for r in rdb.find({})]
+    for i, id_ in enumerate(ids):
+        found = list(rdb.find({Resource.ID_FIELD: id_}))
+        assert [r.id for r in found] == [id_]
+        assert found[0].v["doc_id"] == i + 1
+        assert found[0].v["aliases"] == [f"r{i}"]
+    prefix = "~" + ids[3][:6] + "[a-z0-9]*"
+    assert list(rdb.find({Resource.ID_FIELD: prefix}, id_only=True)) == scan(
+        path, {Resource.ID_FIELD: prefix}
+    )
+    assert rdb.find_one({Resource.ID_FIELD: "nope"}) is None
+    assert rdb.get(5).v["aliases"] == ["r4"]
+    assert rdb.get(100) is None
+
+
+@pytest.mark.unit
+def test_returned_resources_are_copies(rdb):
+    rdb, _ = rdb
+    r = rdb.find_one({"aliases": ["r1"]})
+    r.v["tags"].append("changed")
+    assert rdb.find_one({"aliases": ["r1"]}).v["tags"] == ["tag1", "group1"]
+    assert list(rdb.find({"tags": ["changed"]})) == []
+
+
+@pytest.mark.unit
+def test_writes_update_index(rdb):
+    rdb, path = rdb
+    assert len(rdb) == 30
+    new = Resource(type_=ResourceTypes.data, name="new")
+    new.v["tags"] = ["tag1"]
+    rdb.put(new)
+    with pytest.raises(errors.DuplicateResourceError):
+        rdb.put(new)
+    assert len(rdb) == 31
+    assert list(rdb.find({"tags": ["tag1"]}, id_only=True)) == scan(
+        path, {"tags": ["tag1"]}
+    )
+
+    # update the tags and name
+    old = rdb.find_one({"aliases": ["r2"]})
+    old.v["tags"] = ["updated"]
+    old.v["aliases"] = ["r2-renamed"]
+    rdb.update(old.id, old.v)
+    assert rdb.find_one({"aliases": ["r2"]}) is None
+    assert rdb.find_one({"tags": ["updated"]}).id == old.id
+    assert list(rdb.find({"tags": ["tag2"]}, id_only=True)) == scan(
+        path, {"tags": ["tag2"]}
+    )
+
+    # delete by resource id and internal id
+    rdb.delete(id_=old.id)
+    rdb.delete(id_=1, internal_ids=True)
+    assert len(rdb) == 29
+    assert rdb.find_one({Resource.ID_FIELD: old.id}) is None
+    for filter_dict in ({}, {"tags": ["tag2"]}, {"type": ResourceTypes.data}):
+        assert list(rdb.find(filter_dict, id_only=True)) == scan(path, filter_dict)
+
+
+@pytest.mark.unit
+def test_put_many(rdb):
+    rdb, path = rdb
+    new = make_resources(5)
+    rdb.put_many(new)
+    assert len(rdb) == 35
+    assert [r.id for r in rdb.find({})][30:] == [r.id for r in new]
+    for filter_dict in ({}, {"tags": ["tag1"]}, {"datafiles": [{"sha1": f"{2:040x}"}]}):
+        assert list(rdb.find(filter_dict, id_only=True)) == scan(path, filter_dict)
+
+    # nothing is added if any of the resources is a duplicate
+    more = make_resources(3)
+    with pytest.raises(errors.DuplicateResourceError):
+        rdb.put_many(more + [new[0]])
+    with pytest.raises(errors.DuplicateResourceError):
+        rdb.put_many(more + [more[1]])
+    assert len(rdb) == 35
+    assert len(scan(path, {})) == 35
+    rdb.put_many([])
+    assert len(rdb) == 35
+
+
+@pytest.mark.unit
+def test_external_writes(rdb):
+    rdb, path = rdb
+    assert len(rdb) == 30
+    # another database object, e.g. in another process, writes to the file
+    other = ResourceDB(path)
+    other.put(Resource(type_=ResourceTypes.data, name="external"))
+    assert rdb.find_one({"aliases": ["external"]}) is not None
+    r = other.find_one({"aliases": ["r3"]})
+    r.v["desc"] = "changed"
+    other.update(r.id, r.v)
+    assert rdb.find_one({"aliases": ["r3"]}).v["desc"] == "changed"
+    other.delete(id_=r.id)
+    assert rdb.find_one({"aliases": ["r3"]}) is None
+    assert len(rdb) == 30
+
+
+@pytest.mark.unit
+def test_find_related(rdb):
+    rdb, _ = rdb
+    first = rdb.find_one({"aliases": ["r0"]})
+    meta = [Resource.ID_FIELD, "aliases"]
+
+    related = list(rdb.find_related(first.id, meta=meta, maxdepth=3))
+    assert [(d, m["aliases"]) for d, _, m in related] == [
+        (1, ["r1"]),
+        (2, ["r2"]),
+        (3, ["r3"]),
+    ]
+    assert related[0][1].predicate == Predicates.derived
+
+    # resources that use the first one
+    related = list(rdb.find_related(first.id, meta=meta, outgoing=False, maxdepth=1))
+    assert [m["aliases"] for _, _, m in related] == [["r10"], ["r20"]]
+
+    # whole chain, restricted to resources with a tag
+    related = list(
+        rdb.find_related(first.id, meta=meta, filter_dict={"tags": ["group2"]})
+    )
+    assert [m["aliases"] for _, _, m in related] == []
+    related = list(
+        rdb.find_related(
+            first.id, meta=meta, filter_dict={"type": ResourceTypes.experiment}
+        )
+    )
+    assert [m["aliases"] for _, _, m in related] == [["r1"]]
+    # the derived chain, and the uses relations back to the first resource
+    assert len(list(rdb.find_related(first.id, meta=meta))) == 29 + 2
+
+
+@pytest.mark.performance
+class TestFindPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time for resource queries by a full scan of the database file
+    and with the in-memory index, and for building the index.
+    """
+
+    n = 2000
+
+    @pytest.mark.performance
+    def test_performance(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "resourcedb.json")
+            rdb = ResourceDB(path)
+            resources = make_resources(self.n)
+            rdb._db.insert_multiple([r.v for r in resources])
+            filters = [{Resource.ID_FIELD: r.id} for r in resources[:: self.n // 20]]
+            filters.append({"tags": ["tag1"]})
+
+            gc.collect()
+            timer = TicTocTimer()
+            expected = [scan(path, f) for f in filters]
+            self.recordData(
+                "queries by scan",
+                timer.toc(f"{len(filters)} queries by scan, {self.n} resources"),
+            )
+            gc.collect()
+            timer.tic(None)
+            list(rdb.find({"aliases": ["r0"]}))
+            self.recordData("build index", timer.toc("build index"))
+            gc.collect()
+            timer.tic(None)
+            found = [list(rdb.find(f, id_only=True)) for f in filters]
+            self.recordData(
+                "indexed queries",
+                timer.toc(f"{len(filters)} indexed queries, {self.n} resources"),
+            )
+            gc.collect()
+            timer.tic(None)
+            related = list(
+                rdb.find_related(resources[0].id, meta=["aliases"], maxdepth=100)
+            )
+            self.recordData(
+                "find_related", timer.toc(f"find_related, {len(related)} relations")
+            )
+
+            assert found == expected
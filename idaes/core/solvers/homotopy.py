@@ -20,8 +20,8 @@ import logging
 
 from pyomo.environ import Block, SolverFactory, TerminationCondition
 from pyomo.core.base.var import _VarData
-from pyomo.contrib.parmest.utils.ipopt_solver_wrapper import ipopt_solve_with_stats
 
+from idaes.core.solvers.ipopt_stats import ipopt_solve_with_stats
 from idaes.core.util.model_serializer import to_json, from_json
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.exceptions import ConfigurationError
@@ -213,14 +213,14 @@ def homotopy(
     solver_obj = SolverFactory("ipopt")
 
     # Perform initial solve of model to confirm feasible initial solution
-    results, solved, sol_iter, sol_time, sol_reg = ipopt_solve_with_stats(
+    stats = ipopt_solve_with_stats(
         model, solver_obj, max_solver_iterations, max_solver_time
     )
 
-    if not solved:
+    if not stats.solved:
         _log.exception("Homotopy Failed - initial solution infeasible.")
         return TerminationCondition.infeasible, 0, 0
-    elif sol_reg != "-":
+    elif stats.regularization is not None:
         _log.warning("Homotopy - initial solution converged with regularization.")
         return TerminationCondition.other, 0, 0
     else:
@@ -260,12 +260,12 @@ def homotopy(
             variables[i].fix(targets[i] * n_1 + v_init[i] * (1 - n_1))
 
         # Solve model at new state
-        results, solved, sol_iter, sol_time, sol_reg = ipopt_solve_with_stats(
+        stats = ipopt_solve_with_stats(
             model, solver_obj, max_solver_iterations, max_solver_time
         )
 
         # Check solver output for convergence
-        if solved:
+        if stats.solved:
             # Step succeeded - accept current state
             current_state = to_json(model, return_dict=True)
 
@@ -273,7 +273,7 @@ def homotopy(
             n_0 = n_1
 
             # Check solver iterations and calculate next step size
-            s_proposed = s * (1 + step_accel * (iter_target / sol_iter - 1))
+            s_proposed = s * (1 + step_accel * (iter_target / stats.iterations - 1))
 
             if s_proposed > max_step:
                 s = max_step
@@ -304,7 +304,7 @@ def homotopy(
             )
             return TerminationCondition.maxEvaluations, n_0, iter_count
 
-    if sol_reg == "-":
+    if stats.regularization is None:
         _log.info(
             "Homotopy successful - converged at target values in {} "
             "iterations.".format(iter_count)
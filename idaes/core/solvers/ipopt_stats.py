@@ -0,0 +1,266 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Structured statistics for Ipopt solves: iteration count, solver time, and a
+trace of the iterations including the regularization and restoration phase
+iterations.
+
+With the cyipopt interface (``SolverFactory("cyipopt")``), the statistics are
+collected in-process with an intermediate callback. With the Ipopt executable,
+the solver output is captured in memory and parsed, so no output file is
+written and nothing is printed to the console unless requested.
+"""
+
+from collections import namedtuple
+from io import StringIO
+import math
+import re
+import sys
+
+from pyomo.common.tee import capture_output
+from pyomo.opt import TerminationCondition
+
+
+IpoptIteration = namedtuple(
+    "IpoptIteration",
+    [
+        "iteration",
+        "restoration",
+        "objective",
+        "inf_pr",
+        "inf_du",
+        "lg_mu",
+        "d_norm",
+        "lg_rg",
+        "alpha_du",
+        "alpha_pr",
+        "ls_trials",
+    ],
+)
+IpoptIteration.__doc__ = """
+One row of the Ipopt iteration table. lg_rg is None for iterations without
+regularization, and restoration is True for restoration phase iterations.
+"""
+
+
+class IpoptStats(object):
+    """
+    Statistics of one Ipopt solve.
+
+    Attributes:
+        results: Pyomo SolverResults returned by the solver
+        solved: True if the solver terminated with an optimal solution
+        iterations: number of iterations
+        time: solver time in seconds (CPU time in Ipopt and in function
+            evaluations for the Ipopt executable, wall clock time for cyipopt)
+        trace: list of IpoptIteration, one per iteration
+    """
+
+    def __init__(self, results=None):
+        self.results = results
+        self.solved = False
+        self.iterations = 0
+        self.time = 0.0
+        self.trace = []
+
+    @property
+    def regularization(self):
+        """
+        lg(rg) of the last iteration, None if it was not regularized
+        """
+        if not self.trace:
+            return None
+        return self.trace[-1].lg_rg
+
+    @property
+    def n_regularized(self):
+        """
+        Number of iterations with regularization
+        """
+        return sum(1 for it in self.trace if it.lg_rg is not None)
+
+    @property
+    def n_restoration(self):
+        """
+        Number of restoration phase iterations
+        """
+        return sum(1 for it in self.trace if it.restoration)
+
+    def to_dict(self):
+        """
+        Summary of the statistics as a dictionary (without the trace)
+        """
+        return {
+            "solved": self.solved,
+            "iterations": self.iterations,
+            "time": self.time,
+            "regularization": self.regularization,
+            "n_regularized": self.n_regularized,
+            "n_restoration": self.n_restoration,
+        }
+
+
+# Number at the start of a table entry, alpha_pr is followed by a character
+# indicating the type of step
+_number = re.compile(r"[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?|[-+]?(inf|nan)")
+
+
+def _float_or_none(token):
+    if token == "-":
+        return None
+    match = _number.match(token)
+    if match is None:
+        raise ValueError(f"{token} is not a number")
+    return float(match.group(0))
+
+
+def _parse_iteration(tokens):
+    """
+    Parse a row of the iteration table, None if tokens are not a table row.
+    """
+    if len(tokens) < 10:
+        return None
+    it = tokens[0]
+    restoration = it.endswith("r")
+    if restoration:
+        it = it[:-1]
+    if not it.isdigit():
+        return None
+    try:
+        values = [_float_or_none(t) for t in tokens[1:9]]
+        ls_trials = int(tokens[9])
+    except ValueError:
+        return None
+    return IpoptIteration(int(it), restoration, *values, ls_trials)
+
+
+def parse_ipopt_output(text, stats=None):
+    """
+    Read the iteration table, iteration count and solver time from the output
+    of the Ipopt executable (with the default print_level of 5).
+
+    Args:
+        text: Ipopt output
+        stats: IpoptStats to update, if None create a new one
+
+    Returns:
+        IpoptStats
+    """
+    if stats is None:
+        stats = IpoptStats()
+    time = 0.0
+    for line in text.splitlines():
+        if line.startswith("Number of Iterations....:"):
+            stats.iterations = int(line.split()[3])
+        elif line.startswith("Total CPU secs in IPOPT (w/o function evaluations)"):
+            time += float(line.split("=")[1])
+        elif line.startswith("Total CPU secs in NLP function evaluations"):
+            time += float(line.split("=")[1])
+        elif line.startswith("Total seconds in IPOPT"):
+            # Ipopt 3.14 and later report the total time
+            time += float(line.split("=")[1])
+        else:
+            row = _parse_iteration(line.split())
+            if row is not None:
+                stats.trace.append(row)
+    stats.time = time
+    return stats
+
+
+def _is_cyipopt(solver):
+    return hasattr(getattr(solver, "config", None), "intermediate_callback")
+
+
+def ipopt_solve_with_stats(
+    model, solver, max_iter=500, max_cpu_time=120, tee=False, **kwargs
+):
+    """
+    Solve a model with Ipopt and collect the solver statistics.
+
+    Args:
+        model: Pyomo model to solve
+        solver: Pyomo Ipopt solver object, either the Ipopt executable or the
+            cyipopt interface, with whichever options are preferred
+        max_iter: maximum number of Ipopt iterations, if None use the solver
+            options
+        max_cpu_time: maximum CPU time (in seconds), if None use the solver
+            options
+        tee: if True, also print the solver output
+        kwargs: other keyword arguments passed to the solve method of the
+            solver
+
+    Returns:
+        IpoptStats
+    """
+    options = dict(kwargs.pop("options", None) or {})
+    if max_iter is not None:
+        options["max_iter"] = max_iter
+    if max_cpu_time is not None:
+        options["max_cpu_time"] = max_cpu_time
+    if _is_cyipopt(solver):
+        trace = []
+
+        def intermediate_callback(
+            nlp,
+            alg_mod,
+            iter_count,
+            obj_value,
+            inf_pr,
+            inf_du,
+            mu,
+            d_norm,
+            regularization_size,
+            alpha_du,
+            alpha_pr,
+            ls_trials,
+        ):
+            trace.append(
+                IpoptIteration(
+                    iter_count,
+                    alg_mod == 1,
+                    obj_value,
+                    inf_pr,
+                    inf_du,
+                    math.log10(mu) if mu > 0 else None,
+                    d_norm,
+                    math.log10(regularization_size)
+                    if regularization_size > 0
+                    else None,
+                    alpha_du,
+                    alpha_pr,
+                    ls_trials,
+                )
+            )
+            return True
+
+        results = solver.solve(
+            model,
+            options=options,
+            tee=tee,
+            intermediate_callback=intermediate_callback,
+            **kwargs,
+        )
+        stats = IpoptStats(results)
+        stats.trace = trace
+        stats.iterations = trace[-1].iteration if trace else 0
+        stats.time = getattr(results.solver, "wallclock_time", None) or 0.0
+    else:
+        output = StringIO()
+        with capture_output(output):
+            results = solver.solve(model, options=options, tee=True, **kwargs)
+        if tee:
+            sys.stdout.write(output.getvalue())
+        stats = parse_ipopt_output(output.getvalue(), IpoptStats(results))
+
+    stats.solved = results.solver.termination_condition == TerminationCondition.optimal
+    return stats
@@ -0,0 +1,147 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Tests for collecting Ipopt statistics.
+"""
+import pytest
+import pyomo.environ as pyo
+
+from idaes.core.solvers.ipopt_stats import (
+    ipopt_solve_with_stats,
+    parse_ipopt_output,
+    IpoptStats,
+)
+
+ipopt_available = pyo.SolverFactory("ipopt").available(exception_flag=False)
+
+ipopt_output = """
+Ipopt 3.13.2: max_iter=500
+max_cpu_time=120
+
+This is Ipopt version 3.13.2, running with linear solver ma27.
+
+Number of nonzeros in equality constraint Jacobian...:        2
+Number of nonzeros in inequality constraint Jacobian.:        0
+Number of nonzeros in Lagrangian Hessian.............:        1
+
+Total number of variables............................:        2
+Total number of equality constraints.................:        1
+
+iter    objective    inf_pr   inf_du lg(mu)  ||d||  lg(rg) alpha_du alpha_pr  ls
+   0  0.0000000e+00 9.90e+01 0.00e+00  -1.0 0.00e+00    -  0.00e+00 0.00e+00   0
+   1  0.0000000e+00 2.45e+01 0.00e+00  -1.7 4.95e+00   4.0 1.00e+00 1.00e+00h  1
+   2r 0.0000000e+00 5.53e+00 9.99e+02   0.8 0.00e+00    -  0.00e+00 4.41e-07R  2
+   3r 0.0000000e+00 1.08e+00 1.04e+02  -5.2 1.55e+01  -2.0 9.90e-01 1.00e+00f  1
+   4  0.0000000e+00 1.53e-11 0.00e+00  -1.7 5.32e-01    -  1.00e+00 1.00e+00h  1
+
+Number of Iterations....: 4
+
+                                   (scaled)                 (unscaled)
+Objective...............:   0.0000000000000000e+00    0.0000000000000000e+00
+Constraint violation....:   1.5276668818842154e-11    1.5276668818842154e-11
+
+Total CPU secs in IPOPT (w/o function evaluations)   =      0.002
+Total CPU secs in NLP function evaluations           =      0.001
+
+EXIT: Optimal Solution Found.
+"""
+
+
+@pytest.mark.unit
+def test_parse_ipopt_output():
+    stats = parse_ipopt_output(ipopt_output)
+    assert stats.iterations == 4
+    assert stats.time == pytest.approx(0.003)
+    assert [it.iteration for it in stats.trace] == [0, 1, 2, 3, 4]
+    assert [it.restoration for it in stats.trace] == [
+        False,
+        False,
+        True,
+        True,
+        False,
+    ]
+
+    it = stats.trace[1]
+    assert it.objective == 0
+    assert it.inf_pr == pytest.approx(24.5)
+    assert it.lg_mu == pytest.approx(-1.7)
+    assert it.d_norm == pytest.approx(4.95)
+    assert it.lg_rg == pytest.approx(4.0)
+    assert it.alpha_pr == pytest.approx(1.0)
+    assert it.ls_trials == 1
+    assert stats.trace[2].alpha_pr == pytest.approx(4.41e-07)
+
+    assert stats.regularization is None
+    assert stats.n_regularized == 2
+    assert stats.n_restoration == 2
+    assert stats.to_dict() == {
+        "solved": False,
+        "iterations": 4,
+        "time": pytest.approx(0.003),
+        "regularization": None,
+        "n_regularized": 2,
+        "n_restoration": 2,
+    }
+
+
+@pytest.mark.unit
+def test_parse_ipopt_output_total_seconds():
+    # Ipopt 3.14 reports the total time instead of the IPOPT and NLP times
+    text = ipopt_output.replace(
+        "Total CPU secs in IPOPT (w/o function evaluations)   =      0.002\n"
+        "Total CPU secs in NLP function evaluations           =      0.001\n",
+        "Total seconds in IPOPT                               = 0.005\n",
+    )
+    stats = parse_ipopt_output(text)
+    assert stats.time == pytest.approx(0.005)
+    assert stats.iterations == 4
+
+
+@pytest.mark.unit
+def test_parse_ipopt_output_regularized():
+    text = ipopt_output.replace(
+        "   4  0.0000000e+00 1.53e-11 0.00e+00  -1.7 5.32e-01    -  1.00e+00",
+        "   4  0.0000000e+00 1.53e-11 0.00e+00  -1.7 5.32e-01   2.5  1.00e+00",
+    )
+    stats = parse_ipopt_output(text, IpoptStats())
+    assert stats.regularization == pytest.approx(2.5)
+    assert stats.n_regularized == 3
+
+
+@pytest.mark.unit
+def test_parse_empty_output():
+    stats = parse_ipopt_output("")
+    assert stats.iterations == 0
+    assert stats.time == 0
+    assert stats.trace == []
+    assert stats.regularization is None
+
+
+@pytest.mark.component
+@pytest.mark.skipif(not ipopt_available, reason="Ipopt solver not available")
+def test_ipopt_solve_with_stats(capsys):
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var(initialize=-1.2)
+    m.y = pyo.Var(initialize=1.0)
+    m.obj = pyo.Objective(expr=(1 - m.x) ** 2 + 100 * (m.y - m.x**2) ** 2)
+
+    stats = ipopt_solve_with_stats(m, pyo.SolverFactory("ipopt"))
+    assert capsys.readouterr().out == ""
+    assert stats.solved
+    assert stats.iterations > 0
+    assert len(stats.trace) == stats.iterations + 1
+    assert stats.trace[-1].iteration == stats.iterations
+    assert (
+        stats.results.solver.termination_condition == pyo.TerminationCondition.optimal
+    )
+    assert pyo.value(m.x) == pytest.approx(1.0, rel=1e-5)
@@ -39,6 +39,8 @@ alamo = Executable("alamo")
 
 # Define mapping of Pyomo function names for expression evaluation
 GLOBAL_FUNCS = {"sin": sin, "cos": cos, "log": log, "exp": exp}
+# Define mapping of NumPy ufuncs for vectorized expression evaluation
+NUMPY_FUNCS = {"sin": np.sin, "cos": np.cos, "log": np.log, "exp": np.exp}
 
 
 # The values associated with these must match those expected in the .alm file
@@ -1184,23 +1186,76 @@ class AlamoSurrogate(SurrogateBase):
         super().__init__(input_labels, output_labels, input_bounds)
         self._surrogate_expressions = surrogate_expressions
         self._fcn = None
+        self._vec_fcn = None
+        self._vec_unsupported = set()
 
-    def evaluate_surrogate(self, inputs):
+    def evaluate_surrogate(self, inputs, vectorized=True):
         """
         Method to method to evaluate the ALAMO surrogate model at a set of user
         provided values.
 
+        By default, each surrogate expression is compiled once into a NumPy
+        function and evaluated over whole input columns at once. Expressions
+        which cannot be evaluated this way (e.g. they use a function which has
+        no NumPy equivalent) fall back to row-by-row evaluation using Pyomo.
+
         Args:
            dataframe: pandas DataFrame
               The dataframe of input values to be used in the evaluation. The dataframe
               needs to contain a column corresponding to each of the input labels. Additional
               columns are fine, but are not used.
+           vectorized: bool
+              Whether to use the vectorized NumPy evaluation path (default=True).
+              If False, each row is evaluated separately using Pyomo. If the
+              vectorized evaluation of an output hits a floating point error
+              (e.g. a point outside the domain of a function), that output is
+              evaluated row-wise, so errors are raised as without vectorization.
 
         Returns:
             output: pandas Dataframe
               Returns a dataframe of the the output values evaluated at the provided inputs.
               The index of the output dataframe should match the index of the provided inputs.
         """
+        outputs = np.zeros(shape=(inputs.shape[0], len(self._output_labels)))
+
+        if vectorized:
+            # Extract each input as a contiguous column
+            columns = [inputs[i].to_numpy(dtype=np.float64) for i in self._input_labels]
+
+            rowwise = []
+            for o, o_name in enumerate(self._output_labels):
+                if o_name in self._vec_unsupported:
+                    rowwise.append(o)
+                    continue
+                try:
+                    with np.errstate(all="raise", under="ignore"):
+                        outputs[:, o] = self._get_vectorized_function(o_name)(*columns)
+                except FloatingPointError:
+                    # Let the row-wise evaluation raise the error for the
+                    # offending point, or handle it as Pyomo does
+                    rowwise.append(o)
+                except (NameError, TypeError, AttributeError) as err:
+                    _log.debug(
+                        f"Could not evaluate surrogate for output {o_name} using "
+                        f"NumPy ({err}); falling back to row-wise evaluation."
+                    )
+                    self._vec_unsupported.add(o_name)
+                    rowwise.append(o)
+        else:
+            rowwise = list(range(len(self._output_labels)))
+
+        if rowwise:
+            self._evaluate_rowwise(inputs, outputs, rowwise)
+
+        return pd.DataFrame(
+            data=outputs, index=inputs.index, columns=self._output_labels
+        )
+
+    def _evaluate_rowwise(self, inputs, outputs, output_indices):
+        """
+        Evaluate the given outputs one row at a time using Pyomo functions,
+        writing the results into the outputs array in place.
+        """
         # Create a set of lambda functions for evaluating the surrogate.
         if self._fcn is None:
             fcn = dict()
@@ -1214,16 +1269,27 @@ class AlamoSurrogate(SurrogateBase):
 
         # Use numpy to do the calculations as it is faster
         inputdata = inputs[self._input_labels].to_numpy()
-        outputs = np.zeros(shape=(inputs.shape[0], len(self._output_labels)))
 
         for i in range(inputdata.shape[0]):
-            for o in range(len(self._output_labels)):
+            for o in output_indices:
                 o_name = self._output_labels[o]
                 outputs[i, o] = value(self._fcn[o_name](*inputdata[i, :]))
 
-        return pd.DataFrame(
-            data=outputs, index=inputs.index, columns=self._output_labels
-        )
+    def _get_vectorized_function(self, output_label):
+        """
+        Get the compiled NumPy function for an output, compiling all the
+        surrogate expressions on first use.
+        """
+        if self._vec_fcn is None:
+            fcn = dict()
+            for o in self._output_labels:
+                fcn[o] = eval(
+                    f"lambda {', '.join(self._input_labels)}: "
+                    f"{self._surrogate_expressions[o].split('==')[1]}",
+                    dict(NUMPY_FUNCS),
+                )
+            self._vec_fcn = fcn
+        return self._vec_fcn[output_label]
 
     def populate_block(self, block, additional_options=None):
         """
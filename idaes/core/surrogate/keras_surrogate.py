@@ -38,6 +38,9 @@ if omlt_available:
 from idaes.core.surrogate.base.surrogate_base import SurrogateBase
 from idaes.core.surrogate.sampling.scaling import OffsetScaler
 
+# Default number of rows passed to the Keras model at once by evaluate_surrogate_batches
+DEFAULT_BATCH_SIZE = 10000
+
 
 class KerasSurrogate(SurrogateBase):
     def __init__(
@@ -121,6 +124,27 @@ class KerasSurrogate(SurrogateBase):
         self._output_scaler = output_scaler
         self._keras_model = keras_model
 
+        # offsets and factors of the scalers as arrays ordered like the labels,
+        # computed once and reused by populate_block and the evaluation methods
+        self._offset_inputs = np.zeros(self.n_inputs())
+        self._factor_inputs = np.ones(self.n_inputs())
+        self._offset_outputs = np.zeros(self.n_outputs())
+        self._factor_outputs = np.ones(self.n_outputs())
+        if self._input_scaler:
+            self._offset_inputs = self._input_scaler.offset_series()[
+                self.input_labels()
+            ].to_numpy(dtype=np.float64)
+            self._factor_inputs = self._input_scaler.factor_series()[
+                self.input_labels()
+            ].to_numpy(dtype=np.float64)
+        if self._output_scaler:
+            self._offset_outputs = self._output_scaler.offset_series()[
+                self.output_labels()
+            ].to_numpy(dtype=np.float64)
+            self._factor_outputs = self._output_scaler.factor_series()[
+                self.output_labels()
+            ].to_numpy(dtype=np.float64)
+
     class Formulation(Enum):
         FULL_SPACE = 1
         REDUCED_SPACE = 2
@@ -143,31 +167,12 @@ class KerasSurrogate(SurrogateBase):
         formulation = additional_options.pop(
             "formulation", KerasSurrogate.Formulation.FULL_SPACE
         )
-        offset_inputs = np.zeros(self.n_inputs())
-        factor_inputs = np.ones(self.n_inputs())
-        offset_outputs = np.zeros(self.n_outputs())
-        factor_outputs = np.ones(self.n_outputs())
-        if self._input_scaler:
-            offset_inputs = self._input_scaler.offset_series()[
-                self.input_labels()
-            ].to_numpy()
-            factor_inputs = self._input_scaler.factor_series()[
-                self.input_labels()
-            ].to_numpy()
-        if self._output_scaler:
-            offset_outputs = self._output_scaler.offset_series()[
-                self.output_labels()
-            ].to_numpy()
-            factor_outputs = self._output_scaler.factor_series()[
-                self.output_labels()
-            ].to_numpy()
-
         # build the OMLT scaler object
         omlt_scaling = OffsetScaling(
-            offset_inputs=offset_inputs,
-            factor_inputs=factor_inputs,
-            offset_outputs=offset_outputs,
-            factor_outputs=factor_outputs,
+            offset_inputs=self._offset_inputs,
+            factor_inputs=self._factor_inputs,
+            offset_outputs=self._offset_outputs,
+            factor_outputs=self._factor_outputs,
         )
 
         # omlt takes input bounds as a list
@@ -201,23 +206,82 @@ class KerasSurrogate(SurrogateBase):
         Method to evaluate Keras model at a set of input values.
 
         Args:
-            inputs: numpy array of input values. First dimension of array
-                must match the number of input variables.
+            inputs: pandas DataFrame of input values, with a column for each
+                of the input labels.
 
         Returns:
-            outputs: numpy array of values for all outputs evaluated at input
-                points.
+            outputs: pandas DataFrame of values for all outputs evaluated at input
+                points, with the same index as inputs.
         """
-        x = inputs
-        if self._input_scaler is not None:
-            x = self._input_scaler.scale(x)
-        y = self._keras_model.predict(x.to_numpy())
+        y = self._keras_model.predict(self._scale_inputs(self._input_array(inputs)))
+        return self._output_dataframe(y, inputs.index)
 
-        # y is a numpy array, make it a dataframe
-        y = pd.DataFrame(data=y, columns=self.output_labels(), index=inputs.index)
-        if self._output_scaler is not None:
-            y = self._output_scaler.unscale(y)
-        return y
+    def evaluate_surrogate_batches(self, inputs, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Generator evaluating the Keras model at a set of input values one batch
+        of rows at a time, so that only one batch of scaled inputs and outputs
+        is held in memory.
+
+        Args:
+            inputs: the input values, given as one of:
+                - a pandas DataFrame with a column for each of the input labels,
+                - a 2D numpy array (e.g. a numpy.memmap) with a column for each of
+                  the input labels, in the same order,
+                - an iterable of pandas DataFrames (e.g. as returned by
+                  pandas.read_csv with chunksize).
+            batch_size: maximum number of rows passed to the Keras model at once.
+                Larger DataFrames or arrays are split into batches of this size.
+
+        Yields:
+            outputs: pandas DataFrame of values for all outputs evaluated at the
+                input points of the batch. The index matches that of the input
+                DataFrame, or is the row number for arrays.
+        """
+        if batch_size is None or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, not {batch_size}")
+
+        if isinstance(inputs, np.ndarray):
+            if inputs.ndim != 2 or inputs.shape[1] != self.n_inputs():
+                raise ValueError(
+                    "KerasSurrogate.evaluate_surrogate_batches was passed an array"
+                    " of shape {} but expected {} columns, one for each of the"
+                    " input labels.".format(inputs.shape, self.n_inputs())
+                )
+            for start in range(0, inputs.shape[0], batch_size):
+                x = np.asarray(inputs[start : start + batch_size], dtype=np.float64)
+                yield self._output_dataframe(
+                    self._predict_batch(x), pd.RangeIndex(start, start + x.shape[0])
+                )
+            return
+
+        if isinstance(inputs, pd.DataFrame):
+            inputs = [inputs]
+        for chunk in inputs:
+            x_chunk = self._input_array(chunk)
+            for start in range(0, x_chunk.shape[0], batch_size):
+                x = x_chunk[start : start + batch_size]
+                yield self._output_dataframe(
+                    self._predict_batch(x), chunk.index[start : start + batch_size]
+                )
+
+    def _input_array(self, inputs):
+        """Return the input columns of a DataFrame as an array ordered like the input labels"""
+        return inputs[self.input_labels()].to_numpy(dtype=np.float64)
+
+    def _scale_inputs(self, x):
+        return (x - self._offset_inputs) / self._factor_inputs
+
+    def _predict_batch(self, x):
+        """Evaluate the Keras model on a single batch of (unscaled) input rows"""
+        return np.asarray(
+            self._keras_model.predict_on_batch(self._scale_inputs(x)),
+            dtype=np.float64,
+        )
+
+    def _output_dataframe(self, y, index):
+        """Unscale the model outputs and return them as a DataFrame"""
+        y = y * self._factor_outputs + self._offset_outputs
+        return pd.DataFrame(data=y, columns=self.output_labels(), index=index)
 
     def save_to_folder(self, keras_folder_name):
         """
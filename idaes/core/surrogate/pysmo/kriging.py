@@ -23,6 +23,7 @@ import numpy as np
 import pandas as pd
 import pickle
 from pyomo.core import Param, exp
+from scipy.linalg import cho_factor, cho_solve
 from scipy.optimize import basinhopping
 import scipy.optimize as opt
 
@@ -82,6 +83,7 @@ class KrigingModel:
         regularization=True,
         fname=None,
         overwrite=False,
+        analytic_gradients=False,
     ):
         """
         Initialization of **KrigingModel** class.
@@ -99,6 +101,9 @@ class KrigingModel:
 
                                                             - When regularization is turned off, the model generates an interpolating kriging model.
 
+            analytic_gradients(bool)                :  Whether the gradients of the likelihood used by the gradient-based solvers are evaluated analytically
+                                                       from the Cholesky factorization of the co-variance matrix, rather than by central differencing. Default is False.
+
         Returns:
             self object with the input information and settings.
 
@@ -109,6 +114,8 @@ class KrigingModel:
 
             Exception:  - regularization is not boolean
 
+            Exception:  - analytic_gradients is not boolean
+
         **Example:**
 
         .. code-block:: python
@@ -185,6 +192,11 @@ class KrigingModel:
         else:
             raise Exception("Choice of regularization must be boolean.")
 
+        if isinstance(analytic_gradients, bool):
+            self.analytic_gradients = analytic_gradients
+        else:
+            raise Exception("analytic_gradients must be boolean.")
+
         # Results
         self.optimal_weights = None
         self.optimal_p = None
@@ -198,6 +210,44 @@ class KrigingModel:
         self.training_R2 = None
         self.training_rmse = None
 
+    @staticmethod
+    def distance_matrix_generator(x_a, x_b, theta, p, block_size=1024):
+        """
+        The distance_matrix_generator method computes the weighted distances between every pair of points in two data sets,
+
+        d(i, k) = sum_j theta_j * abs(x_a[i, j] - x_b[k, j]) ** p
+
+        The distances are computed with array operations over whole columns. Rows of x_a are processed in blocks
+        of block_size so that temporary arrays never exceed block_size * x_b.shape[0] entries.
+
+        Args:
+            x_a                     : scaled features data for the rows of the distance matrix
+            x_b                     : scaled features data for the columns of the distance matrix
+            theta                   : Kriging weights
+            p                       : Kriging exponent, fixed at 2 for smoothness.
+
+        Keyword Args:
+            block_size              : maximum number of rows of x_a processed at once. Default is 1024.
+
+        Returns:
+            distance_matrix         : Matrix of weighted distances, of shape (x_a.shape[0], x_b.shape[0])
+
+        """
+        theta = np.asarray(theta, dtype=float).reshape(-1)
+        n_a = x_a.shape[0]
+        distance_matrix = np.zeros((n_a, x_b.shape[0]))
+        for start in range(0, n_a, block_size):
+            stop = min(start + block_size, n_a)
+            block = distance_matrix[start:stop, :]
+            diff = np.empty_like(block)
+            for j in range(0, x_a.shape[1]):
+                np.subtract(x_a[start:stop, j : j + 1], x_b[:, j], out=diff)
+                np.abs(diff, out=diff)
+                np.power(diff, p, out=diff)
+                diff *= theta[j]
+                block += diff
+        return distance_matrix
+
     @staticmethod
     def covariance_matrix_generator(x, theta, reg_param, p):
         """
@@ -213,15 +263,12 @@ class KrigingModel:
             cov_matrix              : Regularized co-variance matrix
 
         """
-        distance_matrix = np.zeros((x.shape[0], x.shape[0]))
-        for i in range(0, x.shape[0]):
-            distance_matrix[i, :] = (
-                np.matmul(((np.abs(x[i, :] - x)) ** p), theta)
-            ).transpose()
-        cov_matrix = np.exp(-1 * distance_matrix)
-        cov_matrix = cov_matrix + reg_param * np.eye(
-            cov_matrix.shape[0]
-        )  # Regularization parameter addition, see Forrester book
+        cov_matrix = KrigingModel.distance_matrix_generator(x, x, theta, p)
+        np.negative(cov_matrix, out=cov_matrix)
+        np.exp(cov_matrix, out=cov_matrix)
+        cov_matrix[
+            np.diag_indices_from(cov_matrix)
+        ] += reg_param  # Regularization parameter addition, see Forrester book
         return cov_matrix
 
     @staticmethod
@@ -242,6 +289,60 @@ class KrigingModel:
             inverse_x = np.linalg.pinv(x)
         return inverse_x
 
+    @staticmethod
+    def covariance_cholesky_generator(x):
+        """
+        The covariance_cholesky_generator method computes the Cholesky factorization of the regularized co-variance matrix for a Kriging model.
+        The factorization can be reused for all the solves needed to evaluate the Kriging mean, variance and likelihood.
+
+        Args:
+            x                       : Regularized co-variance matrix
+
+        Returns:
+            cov_factor              : Cholesky factorization of x, as returned by scipy.linalg.cho_factor
+
+        Raises:
+            LinAlgError:  - the co-variance matrix is not positive definite
+
+        """
+        return cho_factor(x, lower=True, check_finite=False)
+
+    @staticmethod
+    def kriging_statistics(cov_factor, y):
+        """
+        The kriging_statistics method calculates the MLE estimates of the Kriging mean and variance, along with the log-determinant
+        of the co-variance matrix, from a single Cholesky factorization of the co-variance matrix.
+
+        Args:
+            cov_factor                      : Cholesky factorization of the co-variance matrix, from covariance_cholesky_generator
+            y (NumPy Array)                 : Output values of the training data
+
+        Returns:
+            tuple                           : MLE estimate of the Kriging mean, deviation of y from the mean (y-mean), MLE estimate
+                                              of the Kriging variance and log-determinant of the co-variance matrix
+
+        Reference:
+            [1] Forrester et al.'s book "Engineering Design via Surrogate Modelling: A Practical Guide",
+                https://onlinelibrary.wiley.com/doi/pdf/10.1002/9780470770801
+
+        """
+        ns = y.shape[0]
+        ones_vec = np.ones((ns, 1))
+        # Solve for both the ones vector and y with one back-substitution
+        solved = cho_solve(
+            cov_factor, np.concatenate((ones_vec, y), axis=1), check_finite=False
+        )
+        cov_inv_ones, cov_inv_y = solved[:, 0:1], solved[:, 1:2]
+        kriging_mean = np.matmul(ones_vec.transpose(), cov_inv_y) / np.matmul(
+            ones_vec.transpose(), cov_inv_ones
+        )
+        y_mu = KrigingModel.y_mu_calculation(y, kriging_mean)
+        # Inverse of the covariance matrix times y_mu, by linearity of the solves above
+        cov_inv_y_mu = cov_inv_y - kriging_mean * cov_inv_ones
+        sigma_sq = np.matmul(y_mu.transpose(), cov_inv_y_mu) / ns
+        lndetcov = 2 * np.sum(np.log(np.abs(np.diag(cov_factor[0]))))
+        return kriging_mean, y_mu, sigma_sq, lndetcov
+
     @staticmethod
     def kriging_mean(cov_inv, y):
         """
@@ -326,14 +427,9 @@ class KrigingModel:
         ns = y.shape[0]
         cov_mat = self.covariance_matrix_generator(x, theta, reg_param, p)
         try:  # Check Cholesky factorization
-            L = np.linalg.cholesky(cov_mat)
-            lndetcov = 2 * np.sum(
-                np.log(np.abs(np.diag(L)))
-            )  # Approximation to 2nd term from Forrester book, making use of the Ch. factorization
-            cov_inv = self.covariance_inverse_generator(cov_mat)
-            km = self.kriging_mean(cov_inv, y)
-            y_mu = self.y_mu_calculation(y, km)
-            ssd = self.kriging_sd(cov_inv, y_mu, ns)
+            cov_factor = self.covariance_cholesky_generator(cov_mat)
+            # lndetcov approximates the 2nd term from Forrester book, making use of the Ch. factorization
+            km, y_mu, ssd, lndetcov = self.kriging_statistics(cov_factor, y)
             # log_like = (0.5 * ns * np.log(ssd)) + (0.5 * np.log(np.abs(np.linalg.det(cov_mat))))
             log_like = (0.5 * ns * np.log(ssd)) + (0.5 * lndetcov)
             conc_log_like = log_like[0, 0]
@@ -379,18 +475,98 @@ class KrigingModel:
             ] = 0
         return grad_vec
 
-    def parameter_optimization(self, p):
+    def objective_and_gradient(self, var_vector, x, y, p):
+        """
+        The objective_and_gradient method calculates the concentrated likelihood function and its analytic gradient with respect to the
+        Kriging parameters, reusing a single Cholesky factorization of the co-variance matrix R.
+
+        With W = inv(R) - alpha * alpha^T / sigma^2, where alpha = inv(R) * (y - mean), the gradients are
+
+        grad(log10(theta_j)) = -0.5 * ln(10) * theta_j * sum(W * C * D_j)
+
+        grad(reg_param) = 0.5 * trace(W)
+
+        where C is the unregularized co-variance matrix and D_j the matrix of distances along feature j raised to the power p.
+
+        Args:
+            var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
+            x(NumPy Array)                 : Scaled version of input features/variables
+            y(NumPy Array)                 : Output variable y (unscaled)
+            p(float)                       : Kriging model exponent (fixed to 2) to ensure model smoothness
+
+        Returns:
+            tuple                          : Concentrated likelihood value and array of the gradients of the variables in var_vector.
+                                             When the co-variance matrix is non-positive definite, the penalty value (10000) and a zero gradient are returned.
+
+        """
+        var_vector = np.asarray(var_vector, dtype=float).reshape(-1)
+        theta = 10 ** var_vector[:-1]  # Assumes log(theta) provided
+        reg_param = var_vector[-1]
+        ns = y.shape[0]
+        grad_vec = np.zeros(
+            len(var_vector),
+        )
+        corr_mat = np.exp(-1 * self.distance_matrix_generator(x, x, theta, p))
+        cov_mat = corr_mat + reg_param * np.eye(ns)
+        try:  # Check Cholesky factorization
+            cov_factor = self.covariance_cholesky_generator(cov_mat)
+            km, y_mu, ssd, lndetcov = self.kriging_statistics(cov_factor, y)
+            log_like = (0.5 * ns * np.log(ssd)) + (0.5 * lndetcov)
+            conc_log_like = log_like[0, 0]
+        except:  # When Cholesky fails - non-positive definite covariance matrix
+            return 1e4, grad_vec
+
+        cov_inv = cho_solve(cov_factor, np.eye(ns), check_finite=False)
+        alpha = np.matmul(cov_inv, y_mu)
+        w_mat = cov_inv - np.matmul(alpha, alpha.transpose()) / ssd[0, 0]
+        w_corr = w_mat * corr_mat
+        for j in range(0, x.shape[1]):
+            d_j = self.distance_matrix_generator(
+                x[:, j : j + 1], x[:, j : j + 1], [1], p
+            )
+            grad_vec[j] = -0.5 * np.log(10) * theta[j] * np.sum(w_corr * d_j)
+        if self.regularization is True:
+            grad_vec[-1] = 0.5 * np.trace(w_mat)
+        return conc_log_like, grad_vec
+
+    def analytic_gradient(self, var_vector, x, y, p):
+        """
+        The analytic_gradient method calculates the analytic gradient of the concentrated likelihood function for the Kriging hyperparameters.
+        See ``objective_and_gradient`` for details.
+
+        Args:
+            var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
+            x(NumPy Array)                 : Scaled version of input features/variables
+            y(NumPy Array)                 : Output variable y (unscaled)
+            p(float)                       : Kriging model exponent (fixed to 2) to ensure model smoothness
+
+        Returns:
+            grad_vec(NumPy Array)          : Array of the gradients of the variables in var_vector
+
+        """
+        return self.objective_and_gradient(var_vector, x, y, p)[1]
+
+    def parameter_optimization(self, p, analytic_gradients=None):
         """
         Parameter (theta) optimization using BFGS or Basinhopping algorithm. This is the core of the Kriging Class.
         Algorithm used will depend on whether the numerical_gradients was set to True or False.
+
+        Gradients of the likelihood are evaluated analytically when analytic_gradients is True, and by central differencing otherwise.
+        If analytic_gradients is None, the value set during initialization is used.
         """
+        if analytic_gradients is None:
+            analytic_gradients = self.analytic_gradients
+        if analytic_gradients:
+            # Likelihood and gradient are evaluated together from one factorization
+            objective, jac = self.objective_and_gradient, True
+        else:
+            objective, jac = self.objective_function, self.numerical_gradient
         initial_value_list = np.random.randn(
             self.num_vars - 1,
         )
         initial_value_list = initial_value_list.tolist()
         initial_value_list.append(1e-4)
         initial_value = np.array(initial_value_list)
-        initial_value = initial_value.reshape(initial_value.shape[0], 1)
         # Create bounds for variables. All logthetas btw (-4, 4), reg param between (1e-9, 0.1)
         bounds = []
         for i in range(0, len(initial_value_list)):
@@ -408,20 +584,20 @@ class KrigingModel:
             other_args = (self.x_data_scaled, self.y_data, p)
             # opt_results = opt.minimize(self.objective_function, initial_value, args=other_args, method='L-BFGS-B', jac=self.numerical_gradient, bounds=bounds, options={'gtol': 1e-7}) #, 'disp': True})
             opt_results1 = opt.minimize(
-                self.objective_function,
+                objective,
                 initial_value,
                 args=other_args,
                 method="tnc",
-                jac=self.numerical_gradient,
+                jac=jac,
                 bounds=bounds,
                 options={"gtol": 1e-7},
             )
             opt_results2 = opt.minimize(
-                self.objective_function,
+                objective,
                 initial_value,
                 args=other_args,
                 method="L-BFGS-B",
-                jac=self.numerical_gradient,
+                jac=jac,
                 bounds=bounds,
                 options={"gtol": 1e-7},
             )  # , 'disp': True})
@@ -435,10 +611,12 @@ class KrigingModel:
                 "args": (self.x_data_scaled, self.y_data, p),
                 "bounds": bounds,
             }
+            if analytic_gradients:
+                other_args["jac"] = jac
             # other_args = {"args": (self.x_data, self.y_data, p)}
             mybounds = MyBounds()  # Bounds on regularization parameter
             opt_results = basinhopping(
-                self.objective_function,
+                objective if analytic_gradients else self.objective_function,
                 initial_value_list,
                 minimizer_kwargs=other_args,
                 niter=250,
@@ -480,10 +658,16 @@ class KrigingModel:
         cov_mat = self.covariance_matrix_generator(
             self.x_data_scaled, theta, reg_param, p
         )
-        cov_inv = self.covariance_inverse_generator(cov_mat)
-        mean = self.kriging_mean(cov_inv, self.y_data)
-        y_mu = self.y_mu_calculation(self.y_data, mean)
-        variance = self.kriging_sd(cov_inv, y_mu, ns)
+        try:
+            cov_factor = self.covariance_cholesky_generator(cov_mat)
+            mean, y_mu, variance, _ = self.kriging_statistics(cov_factor, self.y_data)
+            cov_inv = cho_solve(cov_factor, np.eye(ns), check_finite=False)
+        except np.linalg.LinAlgError:
+            # Covariance matrix is not positive definite, fall back to (pseudo-)inverse
+            cov_inv = self.covariance_inverse_generator(cov_mat)
+            mean = self.kriging_mean(cov_inv, self.y_data)
+            y_mu = self.y_mu_calculation(self.y_data, mean)
+            variance = self.kriging_sd(cov_inv, y_mu, ns)
         print(
             "\nFinal results\n================\nTheta:",
             theta,
@@ -516,13 +700,10 @@ class KrigingModel:
             y_prediction    : Predicted values of y
 
         """
-        y_prediction = np.zeros((x.shape[0], 1))
-        for i in range(0, x.shape[0]):
-            cmt = (np.matmul(((np.abs(x[i, :] - x)) ** p), theta)).transpose()
-            cov_matrix_tests = np.exp(-1 * cmt)
-            y_prediction[i, 0] = mean + np.matmul(
-                np.matmul(cov_matrix_tests.transpose(), cov_inv), y_mu
-            )
+        cov_matrix_tests = np.exp(
+            -1 * KrigingModel.distance_matrix_generator(x, x, theta, p)
+        )
+        y_prediction = mean + np.matmul(cov_matrix_tests, np.matmul(cov_inv, y_mu))
         ss_error = (1 / y_data.shape[0]) * (np.sum((y_data - y_prediction) ** 2))
         rmse_error = np.sqrt(ss_error)
         return ss_error, rmse_error, y_prediction
@@ -563,20 +744,16 @@ class KrigingModel:
         x_pred = x_pred_scaled.reshape(x_pred.shape)
         if x_pred.ndim == 1:
             x_pred = x_pred.reshape(1, len(x_pred))
-        y_pred = np.zeros((x_pred.shape[0], 1))
-        for i in range(0, x_pred.shape[0]):
-            cmt = (
-                np.matmul(
-                    ((np.abs(x_pred[i, :] - self.x_data_scaled)) ** self.optimal_p),
-                    self.optimal_weights,
-                )
-            ).transpose()
-            cov_matrix_tests = np.exp(-1 * cmt)
-            y_pred[i, 0] = self.optimal_mean + np.matmul(
-                np.matmul(cov_matrix_tests.transpose(), self.covariance_matrix_inverse),
-                self.optimal_y_mu,
-            )
-        return y_pred
+        # Weighted distances between every prediction and training point
+        cmt = self.distance_matrix_generator(
+            x_pred, self.x_data_scaled, self.optimal_weights, self.optimal_p
+        )
+        cov_matrix_tests = np.exp(-1 * cmt)
+        y_pred = self.optimal_mean + np.matmul(
+            cov_matrix_tests,
+            np.matmul(self.covariance_matrix_inverse, self.optimal_y_mu),
+        )
+        return y_pred.reshape(x_pred.shape[0], 1)
 
     def training(self):
         """
@@ -1648,20 +1648,28 @@ class PolynomialRegression:
              Numpy Array    : Output variable predictions based on the polynomial fit.
 
         """
-        nf = x_data.shape[1]
-        x_list = [i for i in range(0, nf)]
-        import pyomo.environ as aml
-
-        m = aml.ConcreteModel()
-        i = aml.Set(initialize=x_list)
-        m.xx = aml.Var(i)
-        m.o2 = aml.Objective(expr=self.generate_expression([m.xx[i] for i in x_list]))
-        y_eq = np.zeros((x_data.shape[0], 1))
-        for j in range(0, x_data.shape[0]):
-            for i in x_list:
-                m.xx[i] = x_data[j, i]
-            y_eq[j, 0] = aml.value(m.o2([m.xx[i] for i in x_list]))
-        return y_eq
+        x_data = np.asarray(x_data, dtype=float)
+        if x_data.ndim == 1:
+            x_data = x_data.reshape(1, len(x_data))
+        # Evaluate the polynomial terms for all points at once
+        terms = self.polygeneration(
+            self.final_polynomial_order, self.multinomials, x_data
+        )
+        # Evaluate the user-defined terms over whole input columns
+        if len(self.additional_term_expressions) > 0:
+            cMap = ComponentMap()
+            for i, v in enumerate(self.extra_terms_feature_vector):
+                cMap[v] = x_data[:, i]
+            npe = NumpyEvaluator(cMap)
+            additional_data = np.column_stack(
+                [
+                    np.broadcast_to(npe.walk_expression(term), (x_data.shape[0],))
+                    for term in self.additional_term_expressions
+                ]
+            )
+            terms = np.concatenate((terms, additional_data), axis=1)
+        y_eq = np.matmul(terms, np.asarray(self.optimal_weights_array, dtype=float))
+        return y_eq.reshape(x_data.shape[0], 1)
 
     def pickle_save(self, solutions):
         """
@@ -15,6 +15,7 @@
 # Imports from the python standard library
 from __future__ import division, print_function
 from builtins import int, str
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import os.path
 import pprint
@@ -186,6 +187,7 @@ class RadialBasisFunctions:
         regularization=None,
         fname=None,
         overwrite=False,
+        crossvalidation_workers=None,
     ):
         """
 
@@ -218,6 +220,8 @@ class RadialBasisFunctions:
 
             regularization(bool): This option determines whether or not the regularization parameter :math:`\lambda` is considered during RBF fitting. Default setting is True.
 
+            crossvalidation_workers(int): Number of threads used to evaluate the shape parameter candidates of the leave-one-out cross-validation grid search concurrently. Default is 1.
+
 
         Returns:
             **self** object with the input information
@@ -231,6 +235,8 @@ class RadialBasisFunctions:
                 * **solution_method** is not 'algebraic', 'pyomo' or 'bfgs'.
             Exception:
                 - :math:`\lambda` is not boolean.
+            Exception:
+                * **crossvalidation_workers** is not a positive integer.
 
         **Example:**
 
@@ -349,6 +355,14 @@ class RadialBasisFunctions:
             self.regularization = regularization
         print("Regularization done: ", self.regularization)
 
+        if crossvalidation_workers is None:
+            crossvalidation_workers = 1
+        elif not isinstance(crossvalidation_workers, int) or (
+            crossvalidation_workers < 1
+        ):
+            raise Exception("crossvalidation_workers must be a positive integer.")
+        self.crossvalidation_workers = crossvalidation_workers
+
         # Results
         self.weights = None
         self.sigma = None
@@ -544,7 +558,20 @@ class RadialBasisFunctions:
         x_mod = np.nan_to_num(x_mod)
         return x_mod
 
-    def basis_generation(self, r):
+    def centre_distances(self):
+        """
+        The function centre_distances calculates the Euclidean distance from each of the points to each of the RBF centres by calling the r2_distance function.
+
+        Returns:
+            distances(NumPy Array): Array of distances, size (number of points x number of centres)
+
+        """
+        distances = np.zeros((self.x_data.shape[0], self.centres.shape[0]))
+        for i in range(0, self.centres.shape[0]):
+            distances[:, i] = self.r2_distance(self.centres[i, :])
+        return distances
+
+    def basis_generation(self, r, distances=None):
         """
         The function basis_generation converts the input data to the requisite basis specified by the user.
         This is done in two steps:
@@ -555,15 +582,16 @@ class RadialBasisFunctions:
         Args:
             self(NumPy Array): contains, among other things, the input data
             r(float)        : The shape parameter required for the Gaussian, Multiquadric and Inverse multiquadric transformations.
+            distances(NumPy Array): Optional, distances from the points to the centres as returned by ``centre_distances``. Re-using them skips step 1.
 
         Returns:
             x_transformed(NumPy Array): Array of transformed data based on user-defined transformation function
 
         """
 
-        basis_functions = np.zeros((self.x_data.shape[0], self.centres.shape[0]))
-        for i in range(0, self.centres.shape[0]):
-            basis_functions[:, i] = self.r2_distance(self.centres[i, :])
+        if distances is None:
+            distances = self.centre_distances()
+        basis_functions = distances
 
         # Initialization of x_transformed
         x_transformed = np.zeros((basis_functions.shape[0], basis_functions.shape[1]))
@@ -883,11 +911,77 @@ class RadialBasisFunctions:
         loo_error_estimate = np.linalg.norm(error_vector)
         return condition_number_pure, condition_number_regularized, loo_error_estimate
 
+    def loo_error_estimation_with_eigendecomposition(
+        self, sigma, lambda_values, distances=None
+    ):
+        """
+        The function loo_error_estimation_with_eigendecomposition evaluates Rippa's leave-one-out cross-validation (LOOCV) error for one shape parameter and several regularization parameters.
+
+        The transformed matrix A is symmetric, so it is factorized once as A = Q.diag(d).Q'. For each regularization parameter :math:`\lambda`,
+
+            inv(A + :math:`\lambda` I) = Q.diag(1 / (d + :math:`\lambda`)).Q',
+
+        which gives the radial weights alpha and the diagonal of the inverse needed by Rippa's equation at a cost of O(n^2) rather than O(n^3).
+        As in ``loo_error_estimation_with_rippa_method``, the diagonal of the inverse is that of the pseudo-inverse: eigenvalues which are negligible relative to the largest one are discarded.
+
+        Args:
+            self                          : contains, among other things, the input data
+            sigma(float)                  : shape parameter for the parametric bases (Gaussian, Multiquadric, Inverse multiquadric)
+            lambda_values(list)           : regularization parameters
+            distances(NumPy Array)        : Optional, distances from the points to the centres as returned by ``centre_distances``
+
+        Returns:
+            condition_number_pure           : condition number of transformed matrix generated from the input data before regularization
+            condition_number_regularized    : array of condition numbers of the transformed matrix after regularization, one per regularization parameter
+            loo_error_estimate              : array of norms of the leave-one-out cross-validation error vector, one per regularization parameter
+
+        """
+        if distances is None:
+            x_transformed = self.basis_generation(sigma)
+        else:
+            x_transformed = self.basis_generation(sigma, distances)
+        eigenvalues, eigenvectors = np.linalg.eigh(x_transformed)
+        eigenvectors_squared = eigenvectors**2
+        y_projected = np.matmul(eigenvectors.T, self.y_data.reshape(-1))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            condition_number_pure = np.max(np.abs(eigenvalues)) / np.min(
+                np.abs(eigenvalues)
+            )
+            condition_number_regularized = np.zeros(len(lambda_values))
+            loo_error_estimate = np.zeros(len(lambda_values))
+            for k, lambda_reg in enumerate(lambda_values):
+                shifted_eigenvalues = eigenvalues + lambda_reg
+                abs_eigenvalues = np.abs(shifted_eigenvalues)
+                condition_number_regularized[k] = np.max(abs_eigenvalues) / np.min(
+                    abs_eigenvalues
+                )
+                # The radial weights use the full inverse, as the explicit solution
+                # does, while the diagonal of the inverse is evaluated as that of
+                # a pseudo-inverse
+                inverse_eigenvalues = np.zeros(shifted_eigenvalues.shape)
+                nonzero = abs_eigenvalues > 0
+                inverse_eigenvalues[nonzero] = 1 / shifted_eigenvalues[nonzero]
+                radial_weights = np.matmul(
+                    eigenvectors, inverse_eigenvalues * y_projected
+                )
+                inverse_eigenvalues[
+                    abs_eigenvalues <= 1e-15 * np.max(abs_eigenvalues)
+                ] = 0
+                inverse_diagonal = np.matmul(eigenvectors_squared, inverse_eigenvalues)
+
+                # Evaluate loo-estimate with Rippa formula
+                loo_error_estimate[k] = np.linalg.norm(
+                    radial_weights / inverse_diagonal
+                )
+        return condition_number_pure, condition_number_regularized, loo_error_estimate
+
     def leave_one_out_crossvalidation(self):
         """
         The function leave_one_out_crossvalidation determines the best hyperparameters (shape and regularization parameters) for a given RBF fitting problem.
         The function cycles through a set of predefined sets to determine the shape parameter and regularization parameter combination which yields the lowest LOOCV error.
         The LOOCV error for each (shape_parameter, regulkarization parameter) pair is evaluated by calling the function loo_error_estimation_with_rippa_method
+        For the algebraic solution method, all the regularization parameters of a shape parameter are evaluated from a single factorization (see loo_error_estimation_with_eigendecomposition), and the shape parameters are spread over **crossvalidation_workers** threads. The error returned for the best pair is then evaluated with loo_error_estimation_with_rippa_method.
         The pre-defined shape parameter set considers 24 irregularly spaced values ranging between 0.001 - 1000, while the regularization parameter set considers 21 values ranging between 0.00001 - 1.
 
         Args:
@@ -966,41 +1060,70 @@ class RadialBasisFunctions:
 
         machine_precision = np.finfo(float).eps
 
+        if self.solution_method == "algebraic":
+            distances = self.centre_distances()
+
+            def evaluate_shape_parameter(sigma):
+                return self.loo_error_estimation_with_eigendecomposition(
+                    sigma, reg_parameter, distances
+                )
+
+            if self.crossvalidation_workers > 1:
+                with ThreadPoolExecutor(
+                    max_workers=self.crossvalidation_workers
+                ) as executor:
+                    sigma_results = list(executor.map(evaluate_shape_parameter, r_set))
+            else:
+                sigma_results = [evaluate_shape_parameter(sigma) for sigma in r_set]
+            candidate_results = (
+                (sigma, lambda_reg, cond_no_pure, cond_no_reg[j], cv_error[j])
+                for sigma, (cond_no_pure, cond_no_reg, cv_error) in zip(
+                    r_set, sigma_results
+                )
+                for j, lambda_reg in enumerate(reg_parameter)
+            )
+        else:
+            candidate_results = (
+                (sigma, lambda_reg)
+                + self.loo_error_estimation_with_rippa_method(sigma, lambda_reg)
+                for sigma in r_set
+                for lambda_reg in reg_parameter
+            )
+
         error_vector = np.zeros((len(r_set) * len(reg_parameter), 3))
         counter = 0
         print(
             "==========================================================================================================="
         )
-        for i in range(0, len(r_set)):
-            sigma = r_set[i]
-            for j in range(0, len(reg_parameter)):
-                lambda_reg = reg_parameter[j]
-                (
-                    cond_no_pure,
-                    cond_no_reg,
-                    cv_error,
-                ) = self.loo_error_estimation_with_rippa_method(sigma, lambda_reg)
-                error_vector[counter, :] = [sigma, lambda_reg, cv_error]
-                counter += 1
-                print(
-                    sigma,
-                    "   |    ",
-                    lambda_reg,
-                    "   |    ",
-                    cv_error,
-                    "   |    ",
-                    cond_no_pure,
-                    "   |    ",
-                    cond_no_pure * machine_precision,
-                    "   |    ",
-                    cond_no_reg,
-                    "   |    ",
-                    cond_no_reg * machine_precision,
-                )
+        for sigma, lambda_reg, cond_no_pure, cond_no_reg, cv_error in candidate_results:
+            error_vector[counter, :] = [sigma, lambda_reg, cv_error]
+            counter += 1
+            print(
+                sigma,
+                "   |    ",
+                lambda_reg,
+                "   |    ",
+                cv_error,
+                "   |    ",
+                cond_no_pure,
+                "   |    ",
+                cond_no_pure * machine_precision,
+                "   |    ",
+                cond_no_reg,
+                "   |    ",
+                cond_no_reg * machine_precision,
+            )
         minimum_value_column = np.argmin(error_vector[:, 2], axis=0)
         r_best = error_vector[minimum_value_column, 0]
         lambda_best = error_vector[minimum_value_column, 1]
         error_best = error_vector[minimum_value_column, 2]
+        if self.solution_method == "algebraic":
+            # Report the error of the selected pair as evaluated with the explicit
+            # solution, which differs from the eigendecomposition for (nearly)
+            # singular matrices
+            _, _, error_best = self.loo_error_estimation_with_rippa_method(
+                r_best, lambda_best
+            )
         return r_best, lambda_best, error_best
 
     def training(self):
@@ -17,6 +17,7 @@ from six import string_types
 # from builtins import int, str
 import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 import warnings
 import itertools
 
@@ -124,9 +125,8 @@ class SamplingMethods:
         This is done by determining the input data with the smallest L2 distance from a.
 
         The function:
-        1. Calculates the L2 distance between all the input data points and a,
-        2. Sorts the input data based on the calculated L2-distances, and
-        3. Selects the sample point in the first row (after sorting) as the closest sample point.
+        1. Calculates the L2 distance between all the input data points and a, and
+        2. Selects the sample point with the smallest L2-distance as the closest sample point.
 
         Args:
             self: contains, among other things, the input data.
@@ -139,16 +139,46 @@ class SamplingMethods:
         no_y_vars = self.x_data.shape[1] - full_data.shape[1]
         dist = full_data[:, :no_y_vars] - a
         l2_norm = np.sqrt(np.sum((dist**2), axis=1))
-        l2_norm = l2_norm.reshape(l2_norm.shape[0], 1)
-        distances = np.append(full_data, l2_norm, 1)
-        sorted_distances = distances[distances[:, -1].argsort()]
-        closest_point = sorted_distances[0, :-1]
+        closest_point = full_data[np.argmin(l2_norm), :]
         return closest_point
 
+    def nearest_neighbour_indices(self, full_data, generated_sample_points):
+        """
+        Function determines the row indices of the closest points in full_data to each of the generated sample points.
+
+        A KD-tree is built once over the input features of full_data and queried for all the sample points at once,
+        rather than computing and sorting the distances to the whole dataset for every sample point.
+
+        Args:
+            full_data: refers to the input dataset supplied by the user.
+            generated_sample_points(NumPy Array): The vector of points (number_of_sample rows) for which the closest points in the original data are to be found. Each row represents a sample point.
+
+        Returns:
+            NumPy Array: Array containing the row index in full_data of the closest point to each row of generated_sample_points
+
+        Raises:
+            ValueError: when the number of features in generated_sample_points does not match the input data
+        """
+        no_y_vars = self.x_data.shape[1] - full_data.shape[1]
+        x_points = full_data[:, :no_y_vars]
+        generated_sample_points = np.asarray(generated_sample_points, dtype=float)
+        if generated_sample_points.ndim != 2 or (
+            generated_sample_points.shape[1] != x_points.shape[1]
+        ):
+            raise ValueError(
+                "Dimensions of the sample points do not match the input data."
+            )
+        if x_points.shape[1] == 0:
+            # No features to compare, so every point is equally close to the first row
+            return np.zeros(generated_sample_points.shape[0], dtype=int)
+        tree = cKDTree(x_points)
+        _, indices = tree.query(generated_sample_points, k=1)
+        return indices
+
     def points_selection(self, full_data, generated_sample_points):
         """
-        Uses L2-distance evaluation (implemented in nearest_neighbour) to find closest available points in original data to those generated by the sampling technique.
-        Calls the nearest_neighbour function for each row in the input data.
+        Uses L2-distance evaluation to find closest available points in original data to those generated by the sampling technique.
+        The closest points are found for all rows of the generated points at once with a KD-tree (implemented in nearest_neighbour_indices).
 
         Args:
             full_data: refers to the input dataset supplied by the user.
@@ -157,28 +187,26 @@ class SamplingMethods:
         Returns:
             equivalent_points: Array containing the points (in rows) most similar to those in generated_sample_points
         """
-
+        indices = self.nearest_neighbour_indices(full_data, generated_sample_points)
         equivalent_points = np.zeros(
             (generated_sample_points.shape[0], len(self.data_headers))
         )
-        for i in range(0, generated_sample_points.shape[0]):
-            closest_point = self.nearest_neighbour(
-                full_data, generated_sample_points[i, :]
-            )
-            equivalent_points[i, :] = closest_point
+        equivalent_points[:, :] = full_data[indices, :]
         return equivalent_points
 
     def sample_point_selection(self, full_data, sample_points, sampling_type):
         if sampling_type == "selection":
             sd = FeatureScaling()
             scaled_data, data_min, data_max = sd.data_scaling_minmax(full_data)
-            points_closest_scaled = self.points_selection(scaled_data, sample_points)
+            # Deduplicate the selected points by their position in the dataset before unscaling
+            indices = self.nearest_neighbour_indices(scaled_data, sample_points)
+            points_closest_scaled = scaled_data[np.unique(indices), :]
             points_closest_unscaled = sd.data_unscaling_minmax(
                 points_closest_scaled, data_min, data_max
             )
 
             unique_sample_points = np.unique(points_closest_unscaled, axis=0)
-            if unique_sample_points.shape[0] < points_closest_unscaled.shape[0]:
+            if unique_sample_points.shape[0] < sample_points.shape[0]:
                 warnings.warn(
                     "The returned number of samples is less than the requested number due to repetitions during nearest neighbour selection."
                 )
@@ -1259,6 +1287,9 @@ class CVTSampling(SamplingMethods):
         sampling_type=None,
         xlabels=None,
         ylabels=None,
+        batch_size=None,
+        seed=None,
+        max_iterations=1000,
     ):
         """
         Initialization of CVTSampling class. Two inputs are required, while an optional option to control the solution accuracy may be specified.
@@ -1279,6 +1310,10 @@ class CVTSampling(SamplingMethods):
 
                 - The smaller the value of tolerance, the better the solution but the longer the algorithm requires to converge. Default value is :math:`10^{-7}`.
 
+            batch_size(int): Number of random points drawn per iteration. When supplied, mini-batch k-means is used: each centroid is moved towards the mean of its assigned points with a step of (points assigned in batch)/(points assigned so far), and the algorithm stops early once the centroid movement no longer improves. Default is None, which keeps the classical algorithm drawing 1000 points per centroid at every iteration.
+            seed(int): Seed for the random number generator, for reproducible designs. Default is None (NumPy's global random state is used).
+            max_iterations(int): Maximum number of iterations (batches) of the algorithm. Default is 1000.
+
         Returns:
                 **self** function containing the input information.
 
@@ -1292,6 +1327,8 @@ class CVTSampling(SamplingMethods):
 
                 Exception: When the tolerance specified is too loose (tolerance > 0.1) or invalid
 
+                Exception: When **batch_size** or **max_iterations** is not a positive integer
+
                 warnings.warn: when the tolerance specified by the user is too tight (tolerance < :math:`10^{-9}`)
 
         """
@@ -1396,8 +1433,20 @@ class CVTSampling(SamplingMethods):
             raise Exception("Invalid tolerance input")
         self.eps = tolerance
 
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size <= 0
+        ):
+            raise Exception("batch_size must a positive, non-zero integer.")
+        self.batch_size = batch_size
+
+        if not isinstance(max_iterations, int) or max_iterations <= 0:
+            raise Exception("max_iterations must a positive, non-zero integer.")
+        self.max_iterations = max_iterations
+
+        self.rng = np.random.RandomState(seed) if seed is not None else np.random
+
     @staticmethod
-    def random_sample_selection(no_samples, no_features):
+    def random_sample_selection(no_samples, no_features, rng=None):
         """
         Function generates a the required number of samples (no_samples) within an no_features-dimensional space.
         This is achieved by generating an m x n 2-D array using numpy's random.rand function, where
@@ -1408,6 +1457,7 @@ class CVTSampling(SamplingMethods):
         Args:
             no_samples(int): The number of samples to be generated.
             no_features(int): Number of design features/variables in the input data.
+            rng(NumPy RandomState): Random number generator to draw from. Default is None, which uses numpy's global random state.
 
         Returns:
             random_points(NumPy Array): 2-D array of size no_samples x no_features generated from a uniform distribution.
@@ -1417,7 +1467,9 @@ class CVTSampling(SamplingMethods):
             >> array([[0.03149075, 0.70566624], [0.48319597, 0.03810093], [0.19962214, 0.57641408]])
 
         """
-        random_points = np.random.rand(no_samples, no_features)
+        if rng is None:
+            rng = np.random
+        random_points = rng.rand(no_samples, no_features)
         return random_points
 
     @staticmethod
@@ -1437,6 +1489,33 @@ class CVTSampling(SamplingMethods):
         euc_d = np.sqrt(np.sum(d_sq, axis=1))
         return euc_d
 
+    @staticmethod
+    def closest_centres(points, centres, block_size=None):
+        """
+        The function closest_centres returns the index of the closest centre to each point.
+
+        Squared distances are evaluated from the expansion ||p||^2 - 2 p.c + ||c||^2 on blocks of points, so that the memory required is bounded by block_size x no_centres regardless of the number of points.
+
+        Args:
+            points(NumPy Array): A 2-D array of points, size no_points x no_features.
+            centres(NumPy Array): A 2-D array of centres, size no_centres x no_features.
+            block_size(int): Number of points processed at a time. Default is None, which keeps each block to about :math:`2^{22}` distances.
+
+        Returns:
+            closest(NumPy Array): 1-D array of size no_points containing the index of the closest centre of each point.
+
+        """
+        if block_size is None:
+            block_size = max(1, 2**22 // max(1, centres.shape[0]))
+        centres_sq = np.sum(centres**2, axis=1)
+        closest = np.empty(points.shape[0], dtype=np.intp)
+        for start in range(0, points.shape[0], block_size):
+            block = points[start : start + block_size, :]
+            # ||p||^2 is constant along each row and does not affect the argmin
+            distances = centres_sq - 2 * (block @ centres.T)
+            closest[start : start + block_size] = np.argmin(distances, axis=1)
+        return closest
+
     @staticmethod
     def create_centres(
         initial_centres, current_random_points, current_centres, counter
@@ -1460,15 +1539,23 @@ class CVTSampling(SamplingMethods):
         (3) Create the new centres as the weighted average of the current centres (initial_centres) and the mean data calculated in the second step. The weighting is done based on the number of iterations (counter).
 
         """
-        centres = np.zeros((initial_centres.shape[0], initial_centres.shape[1]))
-        current_centres = current_centres.reshape(current_centres.shape[0], 1)
-        for i in range(0, initial_centres.shape[0]):
-            data_matrix = current_random_points[current_centres[:, 0] == i]
-            m_prime, n_prime = data_matrix.shape
-            if m_prime == 0:
-                centres[i, :] = np.mean(initial_centres, axis=0)
-            else:
-                centres[i, :] = np.mean(data_matrix, axis=0)
+        no_centres = initial_centres.shape[0]
+        current_centres = np.asarray(current_centres, dtype=np.intp).ravel()
+        counts = np.bincount(current_centres, minlength=no_centres)
+        sums = np.column_stack(
+            [
+                np.bincount(
+                    current_centres,
+                    weights=current_random_points[:, j],
+                    minlength=no_centres,
+                )
+                for j in range(initial_centres.shape[1])
+            ]
+        )
+        centres = np.empty(initial_centres.shape)
+        occupied = counts > 0
+        centres[occupied, :] = sums[occupied, :] / counts[occupied, None]
+        centres[~occupied, :] = np.mean(initial_centres, axis=0)
 
         # Weighted average based on previous number of iterations
         centres = ((counter * initial_centres) + centres) / (counter + 1)
@@ -1479,38 +1566,49 @@ class CVTSampling(SamplingMethods):
         The ``sample_points`` method determines the best/optimal centre points (centroids) for a data set based on the minimization of the total distance between points and centres.
 
         Procedure based on McQueen's algorithm: iteratively minimize distance, and re-position centroids.
-        Centre re-calculation done as the mean of each data cluster around each centre.
+        Centre re-calculation done as the mean of each data cluster around each centre. When **batch_size** is set, the mini-batch variant of the algorithm is used instead.
 
         Returns:
             NumPy Array or Pandas Dataframe:     A numpy array or Pandas dataframe containing the final **number_of_samples** centroids obtained by the CVT algorithm.
 
         """
         _, n = self.x_data.shape
+        if self.batch_size is None:
+            sample_points = self._classical_centres(n)
+        else:
+            sample_points = self._minibatch_centres(n)
+
+        unique_sample_points = self.sample_point_selection(
+            self.data, sample_points, self.sampling_type
+        )
+        if len(self.data_headers) > 0 and self.df_flag:
+            unique_sample_points = pd.DataFrame(
+                unique_sample_points, columns=self.data_headers
+            )
+        return unique_sample_points
+
+    def _classical_centres(self, n):
+        """
+        McQueen's algorithm: at every iteration, number_of_centres * 1000 random points are classified and the centres are moved to the weighted average of the previous centres and the cluster means.
+        """
         size_multiple = 1000
-        initial_centres = self.random_sample_selection(self.number_of_centres, n)
+        initial_centres = self.random_sample_selection(
+            self.number_of_centres, n, self.rng
+        )
         # Iterative optimization process
         cost_old = 0
         cost_new = 0
         cost_change = float("Inf")
         counter = 1
-        while (cost_change > self.eps) and (counter <= 1000):
+        while (cost_change > self.eps) and (counter <= self.max_iterations):
             cost_old = cost_new
             current_random_points = self.random_sample_selection(
-                self.number_of_centres * size_multiple, n
+                self.number_of_centres * size_multiple, n, self.rng
+            )
+            # Classify random points by closest centre and estimate new centres
+            current_centres = self.closest_centres(
+                current_random_points, initial_centres
             )
-            distance_matrix = np.zeros(
-                (current_random_points.shape[0], initial_centres.shape[0])
-            )  # Vector to store distances from centroids
-            current_centres = np.zeros(
-                (current_random_points.shape[0], 1)
-            )  # Vector containing the centroid each point belongs to
-
-            # Calculate distance between random points and centres, sort and estimate new centres
-            for i in range(0, self.number_of_centres):
-                distance_matrix[:, i] = self.eucl_distance(
-                    current_random_points, initial_centres[i, :]
-                )
-            current_centres = np.argmin(distance_matrix, axis=1)
             new_centres = self.create_centres(
                 initial_centres, current_random_points, current_centres, counter
             )
@@ -1520,17 +1618,54 @@ class CVTSampling(SamplingMethods):
             cost_new = np.sqrt(np.sum(distance_btw_centres**2))
             cost_change = np.abs(cost_old - cost_new)
             counter += 1
-            # print(counter, cost_change)
             if cost_change >= self.eps:
                 initial_centres = new_centres
+        return new_centres
 
-        sample_points = new_centres
+    def _minibatch_centres(self, n, max_no_improvement=10, smoothing=0.1):
+        """
+        Mini-batch k-means: every iteration classifies batch_size random points and moves each centre towards the mean of its points, with a step equal to the fraction of all points assigned to that centre so far which come from the current batch.
 
-        unique_sample_points = self.sample_point_selection(
-            self.data, sample_points, self.sampling_type
-        )
-        if len(self.data_headers) > 0 and self.df_flag:
-            unique_sample_points = pd.DataFrame(
-                unique_sample_points, columns=self.data_headers
+        The algorithm stops once the centre movement drops below the tolerance, when the exponentially smoothed movement has not improved for max_no_improvement consecutive batches, or after max_iterations batches.
+        """
+        no_centres = self.number_of_centres
+        centres = self.random_sample_selection(no_centres, n, self.rng)
+        total_counts = np.zeros(no_centres)
+        smoothed_cost = None
+        best_cost = float("Inf")
+        no_improvement = 0
+        for _ in range(self.max_iterations):
+            batch = self.random_sample_selection(self.batch_size, n, self.rng)
+            labels = self.closest_centres(batch, centres)
+            counts = np.bincount(labels, minlength=no_centres)
+            occupied = counts > 0
+            if not occupied.any():
+                continue
+            sums = np.column_stack(
+                [
+                    np.bincount(labels, weights=batch[:, j], minlength=no_centres)
+                    for j in range(n)
+                ]
             )
-        return unique_sample_points
+            total_counts += counts
+            step = (
+                sums[occupied, :] - counts[occupied, None] * centres[occupied, :]
+            ) / total_counts[occupied, None]
+            centres[occupied, :] += step
+            cost = np.sqrt(np.sum(step**2))
+
+            # Early stopping on the smoothed centre movement
+            if cost <= self.eps:
+                break
+            if smoothed_cost is None:
+                smoothed_cost = cost
+            else:
+                smoothed_cost = (1 - smoothing) * smoothed_cost + smoothing * cost
+            if smoothed_cost < best_cost:
+                best_cost = smoothed_cost
+                no_improvement = 0
+            else:
+                no_improvement += 1
+                if no_improvement >= max_no_improvement:
+                    break
+        return centres
@@ -13,6 +13,7 @@
 import sys
 import os
 import io
+import gc
 from unittest.mock import patch
 
 sys.path.append(os.path.abspath(".."))  # current folder is ~/tests
@@ -23,6 +24,9 @@ from scipy.spatial import distance
 import scipy.optimize as opt
 import scipy.stats as stats
 import pytest
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 class TestKrigingModel:
@@ -179,6 +183,52 @@ class TestKrigingModel:
         inverse_x = KrigingClass.covariance_inverse_generator(cov_matrix)
         np.testing.assert_array_equal(np.round(inverse_x, 7), np.round(cov_matrix, 7))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("block_size", [1, 2, 1024])
+    def test_distance_matrix_generator(self, block_size):
+        KrigingClass = KrigingModel(pd.DataFrame(self.full_data))
+        x = KrigingClass.x_data_scaled
+        x_b = x[1:4, :]
+        theta = np.array([1, 2])
+        p = 2
+        distance_matrix = KrigingClass.distance_matrix_generator(
+            x, x_b, theta, p, block_size=block_size
+        )
+        distance_matrix_exp = np.zeros((x.shape[0], x_b.shape[0]))
+        for i in range(0, x.shape[0]):
+            distance_matrix_exp[i, :] = np.matmul((np.abs(x[i, :] - x_b)) ** p, theta)
+        np.testing.assert_allclose(distance_matrix, distance_matrix_exp, rtol=1e-12)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_kriging_statistics(self, array_type):
+        input_array = array_type(self.training_data)
+        KrigingClass = KrigingModel(input_array[0:3], regularization=True)
+        cov_matrix = np.array(
+            [
+                [1.000001, 0.60653066, 0.13533528],
+                [0.60653066, 1.000001, 0.60653066],
+                [0.13533528, 0.60653066, 1.000001],
+            ]
+        )
+        cov_factor = KrigingClass.covariance_cholesky_generator(cov_matrix)
+        mean, y_mu, sigma_sq, lndetcov = KrigingClass.kriging_statistics(
+            cov_factor, KrigingClass.y_data
+        )
+        assert np.round(mean[0][0], 5) == 20.18496
+        np.testing.assert_array_equal(
+            np.round(y_mu, 5), np.array([[-18.18496], [-6.93496], [16.81504]])
+        )
+        assert np.round(sigma_sq[0][0], 4) == np.round(272.84104637, 4)
+        assert pytest.approx(lndetcov, rel=1e-10) == np.log(np.linalg.det(cov_matrix))
+
+    @pytest.mark.unit
+    def test_covariance_cholesky_generator_not_pd(self):
+        KrigingClass = KrigingModel(np.array(self.training_data[0:3]))
+        cov_matrix = np.array([[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+        with pytest.raises(np.linalg.LinAlgError):
+            KrigingClass.covariance_cholesky_generator(cov_matrix)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_kriging_mean(self, array_type):
@@ -275,6 +325,49 @@ class TestKrigingModel:
         grad_vec_exp = np.array([0, 0, 0])
         np.testing.assert_array_equal(np.round(grad_vec, 5), np.round(grad_vec_exp, 5))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("regularization", [True, False])
+    def test_analytic_gradient(self, regularization):
+        KrigingClass = KrigingModel(
+            np.array(self.training_data), regularization=regularization
+        )
+        p = 2
+        var_vector = np.array([-0.5, 0.3, 1.00000000e-03])
+        conc_log_like, grad_vec = KrigingClass.objective_and_gradient(
+            var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+        )
+        assert conc_log_like == KrigingClass.objective_function(
+            var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+        )
+        grad_vec_num = KrigingClass.numerical_gradient(
+            var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+        )
+        np.testing.assert_allclose(grad_vec, grad_vec_num, rtol=1e-5, atol=1e-6)
+        np.testing.assert_array_equal(
+            KrigingClass.analytic_gradient(
+                var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+            ),
+            grad_vec,
+        )
+        if not regularization:
+            assert grad_vec[-1] == 0
+
+    @pytest.mark.unit
+    def test_analytic_gradient_not_pd(self):
+        KrigingClass = KrigingModel(np.array(self.training_data[0:3]))
+        p = 2
+        var_vector = np.array([-3, -3, -1.0])
+        conc_log_like, grad_vec = KrigingClass.objective_and_gradient(
+            var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p
+        )
+        assert conc_log_like == 1e4
+        np.testing.assert_array_equal(grad_vec, np.zeros(3))
+
+    @pytest.mark.unit
+    def test_analytic_gradients_wrongtype(self):
+        with pytest.raises(Exception, match="analytic_gradients must be boolean."):
+            KrigingModel(np.array(self.test_data), analytic_gradients=1)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_parameter_optimization_01(self, array_type):
@@ -295,6 +388,31 @@ class TestKrigingModel:
         assert len(opt_results.x) == 3
         assert opt_results.minimization_failures == False
 
+    @pytest.mark.unit
+    def test_parameter_optimization_analytic(self):
+        np.random.seed(0)
+        KrigingClass = KrigingModel(np.array(self.training_data))
+        p = 2
+        opt_results = KrigingClass.parameter_optimization(p, analytic_gradients=True)
+        assert len(opt_results.x) == 3
+        assert opt_results.fun < 1e4
+
+    @pytest.mark.unit
+    def test_parameter_optimization_basinhopping_analytic(self):
+        np.random.seed(0)
+        KrigingClass = KrigingModel(
+            np.array(self.training_data[0:3]), numerical_gradients=False
+        )
+        p = 2
+        with patch.object(
+            KrigingClass, "objective_function", side_effect=AssertionError
+        ):
+            opt_results = KrigingClass.parameter_optimization(
+                p, analytic_gradients=True
+            )
+        assert len(opt_results.x) == 3
+        assert opt_results.minimization_failures == False
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_optimal_parameter_evaluation(self, array_type):
@@ -546,5 +664,40 @@ class TestKrigingModel:
         KrigingClass.parity_residual_plots()
 
 
+@pytest.mark.performance
+class TestKrigingGradientPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to evaluate the gradient of the Kriging likelihood by
+    finite differences and analytically, for increasing numbers of features.
+    """
+
+    @pytest.mark.performance
+    def test_performance(self):
+        for n_features in [5, 10, 20]:
+            rng = np.random.default_rng(0)
+            x = rng.uniform(size=(300, n_features))
+            y = np.sum(np.sin(3 * x), axis=1)
+            KrigingClass = KrigingModel(np.column_stack((x, y)), overwrite=True)
+            var_vector = np.append(rng.uniform(-1, 1, n_features), 1e-3)
+            args = (KrigingClass.x_data_scaled, KrigingClass.y_data, 2)
+
+            gc.collect()
+            timer = TicTocTimer()
+            grad_num = KrigingClass.numerical_gradient(var_vector, *args)
+            self.recordData(
+                f"finite-difference gradient, {n_features} features",
+                timer.toc(f"finite-difference gradient, {n_features} features"),
+            )
+            gc.collect()
+            timer.tic(None)
+            grad_an = KrigingClass.analytic_gradient(var_vector, *args)
+            self.recordData(
+                f"analytic gradient, {n_features} features",
+                timer.toc(f"analytic gradient, {n_features} features"),
+            )
+
+            np.testing.assert_allclose(grad_an, grad_num, rtol=1e-4, atol=1e-4)
+
+
 if __name__ == "__main__":
     pytest.main()
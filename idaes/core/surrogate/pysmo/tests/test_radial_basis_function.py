@@ -12,6 +12,7 @@
 #################################################################################
 import sys
 import os
+import gc
 from unittest.mock import patch
 
 sys.path.append(os.path.abspath(".."))  # current folder is ~/tests\
@@ -23,6 +24,9 @@ import numpy as np
 import pandas as pd
 from scipy.spatial import distance
 import pytest
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 class TestFeatureScaling:
@@ -354,6 +358,18 @@ class TestRadialBasisFunction:
         assert RbfClass1.filename == file_name1
         assert RbfClass2.filename == file_name2
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test__init__15(self, array_type):
+        input_array = array_type(self.test_data)
+        RbfClass = RadialBasisFunctions(input_array)
+        assert RbfClass.crossvalidation_workers == 1
+        RbfClass = RadialBasisFunctions(input_array, crossvalidation_workers=4)
+        assert RbfClass.crossvalidation_workers == 4
+        for value in [0, -1, 1.5]:
+            with pytest.raises(Exception):
+                RadialBasisFunctions(input_array, crossvalidation_workers=value)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_r2_distance(self, array_type):
@@ -1045,6 +1061,64 @@ class TestRadialBasisFunction:
         assert output_1 == np.linalg.cond(expected_x)
         np.testing.assert_array_equal(output_2, expected_errors)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("basis_function", ["gaussian", "imq", "cubic"])
+    def test_loo_error_estimation_with_eigendecomposition_01(self, basis_function):
+        input_array = np.array(self.training_data)
+        shape_factor = 0.5
+        reg_params = [0.0001, 0.01, 0.1]
+        data_feed = RadialBasisFunctions(input_array, basis_function=basis_function)
+        x_transformed = data_feed.basis_generation(shape_factor)
+
+        (
+            output_0,
+            output_1,
+            output_2,
+        ) = data_feed.loo_error_estimation_with_eigendecomposition(
+            shape_factor, reg_params, data_feed.centre_distances()
+        )
+        assert output_0 == pytest.approx(np.linalg.cond(x_transformed), rel=1e-3)
+        assert output_1.shape == output_2.shape == (len(reg_params),)
+        for k, reg_param in enumerate(reg_params):
+            x_regularized = x_transformed + reg_param * np.eye(x_transformed.shape[0])
+            expected_radial_weights = np.linalg.solve(x_regularized, data_feed.y_data)
+            expected_inverse_x = np.diag(np.linalg.pinv(x_regularized))
+            expected_errors = np.linalg.norm(
+                expected_radial_weights.reshape(-1) / expected_inverse_x
+            )
+            assert output_1[k] == pytest.approx(np.linalg.cond(x_regularized), rel=1e-6)
+            assert output_2[k] == pytest.approx(expected_errors, rel=1e-6)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("basis_function", ["gaussian", "imq", "cubic"])
+    def test_loo_error_estimation_with_eigendecomposition_02(self, basis_function):
+        input_array = np.array(self.training_data)
+        shape_factor = 1
+        reg_param = 0.1
+        data_feed = RadialBasisFunctions(
+            input_array, basis_function=basis_function, solution_method="algebraic"
+        )
+        expected = data_feed.loo_error_estimation_with_rippa_method(
+            shape_factor, reg_param
+        )
+        output = data_feed.loo_error_estimation_with_eigendecomposition(
+            shape_factor, [reg_param]
+        )
+        assert output[0] == pytest.approx(expected[0], rel=1e-3)
+        assert output[1][0] == pytest.approx(expected[1], rel=1e-6)
+        assert output[2][0] == pytest.approx(expected[2], rel=1e-6)
+
+    @pytest.mark.unit
+    def test_leave_one_out_crossvalidation_workers(self):
+        input_array = np.array(self.training_data)
+        results = []
+        for workers in [1, 3]:
+            data_feed = RadialBasisFunctions(
+                input_array, regularization=True, crossvalidation_workers=workers
+            )
+            results.append(data_feed.leave_one_out_crossvalidation())
+        assert results[0] == results[1]
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_leave_one_out_crossvalidation_01(self, array_type):
@@ -2300,5 +2374,64 @@ class TestRadialBasisFunction:
         data_feed.parity_residual_plots()
 
 
+@pytest.mark.performance
+class TestLeaveOneOutPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time for Rippa's leave-one-out error with one factorization per
+    regularization candidate and with one eigendecomposition per shape
+    parameter, and for the full leave-one-out grid search.
+    """
+
+    @pytest.mark.performance
+    def test_performance(self):
+        rng = np.random.RandomState(0)
+        x = rng.rand(400, 2)
+        input_array = np.column_stack([x, np.sin(5 * x[:, 0]) + x[:, 1] ** 2])
+        data_feed = RadialBasisFunctions(input_array, regularization=True)
+        sigma = 1.0
+        reg_params = [0.00001, 0.0001, 0.001, 0.01, 0.1, 1]
+
+        gc.collect()
+        timer = TicTocTimer()
+        expected_errors = []
+        for reg_param in reg_params:
+            # One solve and one pseudo-inverse per (sigma, lambda) candidate
+            x_regularized = data_feed.basis_generation(sigma) + reg_param * np.eye(
+                input_array.shape[0]
+            )
+            radial_weights = np.linalg.inv(x_regularized) @ data_feed.y_data
+            inverse_diagonal = np.diag(np.linalg.pinv(x_regularized))
+            expected_errors.append(
+                np.linalg.norm(radial_weights.reshape(-1) / inverse_diagonal)
+            )
+        self.recordData(
+            "LOO error per candidate",
+            timer.toc("Rippa LOOCV, one factorization per candidate"),
+        )
+        gc.collect()
+        timer.tic(None)
+        _, _, errors = data_feed.loo_error_estimation_with_eigendecomposition(
+            sigma, reg_params
+        )
+        self.recordData(
+            "LOO error per shape parameter",
+            timer.toc("Rippa LOOCV, one factorization per shape parameter"),
+        )
+
+        np.testing.assert_allclose(errors, expected_errors, rtol=1e-6)
+
+        for workers in [1, 4]:
+            data_feed = RadialBasisFunctions(
+                input_array, regularization=True, crossvalidation_workers=workers
+            )
+            gc.collect()
+            timer.tic(None)
+            data_feed.leave_one_out_crossvalidation()
+            self.recordData(
+                f"LOOCV grid search, {workers} threads",
+                timer.toc(f"LOOCV grid search, {workers} thread(s)"),
+            )
+
+
 if __name__ == "__main__":
     pytest.main()
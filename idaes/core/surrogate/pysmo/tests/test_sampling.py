@@ -15,6 +15,9 @@ import numpy as np
 import pandas as pd
 import pytest
 import sys, os
+import gc
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 
 sys.path.append(os.path.abspath(".."))  # current folder is ~/tests
 # this
@@ -27,6 +30,7 @@ from idaes.core.surrogate.pysmo.sampling import (
     SamplingMethods,
     FeatureScaling,
 )
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 class TestFeatureScaling:
@@ -260,6 +264,42 @@ class TestSamplingMethods:
                 input_array, generated_sample_points
             )
 
+    @pytest.mark.unit
+    def test_nearest_neighbour_indices_01(self):
+        rng = np.random.default_rng(0)
+        input_array = rng.uniform(size=(500, 4))
+        generated_sample_points = rng.uniform(size=(50, 3))
+        sampling_methods = self._create_sampling(input_array, generated_sample_points)
+        indices = sampling_methods.nearest_neighbour_indices(
+            input_array, generated_sample_points
+        )
+        for i in range(0, generated_sample_points.shape[0]):
+            closest_point = SamplingMethods.nearest_neighbour(
+                sampling_methods, input_array, generated_sample_points[i, :]
+            )
+            np.testing.assert_array_equal(input_array[indices[i], :], closest_point)
+
+    @pytest.mark.unit
+    def test_nearest_neighbour_indices_02(self):
+        input_array = np.array(self.test_data_3d)
+        generated_sample_points = np.array([[0.5], [10]])
+        sampling_methods = self._create_sampling(input_array, generated_sample_points)
+        with pytest.raises(ValueError):
+            sampling_methods.nearest_neighbour_indices(
+                input_array, generated_sample_points
+            )
+
+    @pytest.mark.unit
+    def test_sample_point_selection_duplicates(self):
+        input_array = np.array(self.test_data_3d)
+        generated_sample_points = np.array([[0, 0], [0.01, 0.01], [1, 1]])
+        sampling_methods = self._create_sampling(input_array, generated_sample_points)
+        with pytest.warns(UserWarning, match="less than the requested number"):
+            unique_sample_points = sampling_methods.sample_point_selection(
+                input_array, generated_sample_points, sampling_type="selection"
+            )
+        np.testing.assert_array_equal(unique_sample_points, input_array[[0, -1], :])
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array])
     def test_sample_point_selection_01(self, array_type):
@@ -2194,6 +2234,86 @@ class TestCVTSampling:
         )
         np.testing.assert_array_equal(expected_output, output)
 
+    @pytest.mark.unit
+    def test_create_centres_05(self):
+        initial_centres = np.array([[0, 0], [1, 1], [0.5, 0]])
+        current_random_points = np.array([[0.6, 0.6], [0.3, 0.3]])
+        current_centres = np.array([1, 0])
+        counter = 1
+        expected_output = np.array([[0.15, 0.15], [0.8, 0.8], [0.5, 1 / 6]])
+        output = CVTSampling.create_centres(
+            initial_centres, current_random_points, current_centres, counter
+        )
+        np.testing.assert_allclose(expected_output, output)
+
+    @pytest.mark.unit
+    def test_closest_centres(self):
+        rng = np.random.RandomState(0)
+        points = rng.rand(50, 3)
+        centres = rng.rand(7, 3)
+        expected_output = np.argmin(
+            np.array(
+                [CVTSampling.eucl_distance(points, centres[i, :]) for i in range(7)]
+            ),
+            axis=0,
+        )
+        for block_size in [None, 1, 8, 100]:
+            output = CVTSampling.closest_centres(points, centres, block_size)
+            np.testing.assert_array_equal(expected_output, output)
+
+    @pytest.mark.unit
+    def test_batch_size_invalid(self):
+        for batch_size in [0, -5, 1.5]:
+            with pytest.raises(Exception):
+                CVTSampling(
+                    self.input_array_list,
+                    number_of_samples=5,
+                    sampling_type="creation",
+                    batch_size=batch_size,
+                )
+
+    @pytest.mark.unit
+    def test_max_iterations_invalid(self):
+        with pytest.raises(Exception):
+            CVTSampling(
+                self.input_array_list,
+                number_of_samples=5,
+                sampling_type="creation",
+                max_iterations=0,
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("batch_size", [None, 256])
+    def test_sample_points_seed(self, batch_size):
+        samples = [
+            CVTSampling(
+                self.input_array_list,
+                number_of_samples=10,
+                sampling_type="creation",
+                batch_size=batch_size,
+                seed=42,
+            ).sample_points()
+            for _ in range(2)
+        ]
+        np.testing.assert_array_equal(samples[0], samples[1])
+
+    @pytest.mark.unit
+    def test_sample_points_minibatch(self):
+        CVTClass = CVTSampling(
+            self.input_array_list,
+            number_of_samples=20,
+            sampling_type="creation",
+            batch_size=500,
+            seed=0,
+            max_iterations=50,
+        )
+        unique_sample_points = CVTClass.sample_points()
+        input_array = np.array(self.input_array_list)
+        assert unique_sample_points.shape == (20, input_array.shape[1])
+        for i in range(input_array.shape[1]):
+            assert (unique_sample_points[:, i] >= input_array[0, i]).all()
+            assert (unique_sample_points[:, i] <= input_array[1, i]).all()
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array])
     def test_sample_points_01(self, array_type):
@@ -2240,5 +2360,83 @@ class TestCVTSampling:
             )
 
 
+@pytest.mark.performance
+class TestSelectionPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to select the nearest data points to LHS samples one sample
+    at a time and with the KD-tree.
+    """
+
+    @pytest.mark.performance
+    def test_performance(self):
+        rng = np.random.default_rng(0)
+        full_data = rng.uniform(size=(200000, 5))
+        sampling = LatinHypercubeSampling(
+            full_data, number_of_samples=200, sampling_type="selection"
+        )
+        generated_sample_points = sampling.lhs_points_generation()
+
+        gc.collect()
+        timer = TicTocTimer()
+        closest_loop = np.array(
+            [
+                sampling.nearest_neighbour(full_data, generated_sample_points[i, :])
+                for i in range(generated_sample_points.shape[0])
+            ]
+        )
+        self.recordData(
+            "per-sample selection",
+            timer.toc("per-sample nearest neighbour selection"),
+        )
+        gc.collect()
+        timer.tic(None)
+        closest_tree = sampling.points_selection(full_data, generated_sample_points)
+        self.recordData(
+            "KD-tree selection", timer.toc("KD-tree nearest neighbour selection")
+        )
+
+        np.testing.assert_array_equal(closest_tree, closest_loop)
+
+
+@pytest.mark.performance
+class TestCVTPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to create CVT samples with the classical algorithm and with
+    mini-batches.
+    """
+
+    @pytest.mark.performance
+    def test_performance(self):
+        bounds = [[0] * 10, [1] * 10]
+        gc.collect()
+        timer = TicTocTimer()
+        classical = CVTSampling(
+            bounds,
+            number_of_samples=200,
+            sampling_type="creation",
+            seed=0,
+            max_iterations=20,
+        ).sample_points()
+        self.recordData(
+            "classical CVT", timer.toc("classical CVT, 20 iterations of 200k points")
+        )
+        gc.collect()
+        timer.tic(None)
+        minibatch = CVTSampling(
+            bounds,
+            number_of_samples=200,
+            sampling_type="creation",
+            batch_size=4096,
+            seed=0,
+            max_iterations=200,
+        ).sample_points()
+        self.recordData(
+            "mini-batch CVT",
+            timer.toc("mini-batch CVT, up to 200 batches of 4096 points"),
+        )
+
+        assert classical.shape == minibatch.shape == (200, 10)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -13,10 +13,13 @@
 
 
 # stdlib
+from concurrent.futures import ProcessPoolExecutor
 import io
 import json
 from json import JSONEncoder, JSONDecodeError
 import logging
+import os
+import tempfile
 from typing import Dict, Union
 
 # third-party
@@ -47,6 +50,8 @@ _log = idaeslog.getLogger(__name__)
 # Global variables
 # ----------------
 GLOBAL_FUNCS = {"sin": sin, "cos": cos, "log": log, "exp": exp}
+# Default number of rows passed to PySMO models at once by evaluate_surrogate
+DEFAULT_BATCH_SIZE = 10000
 
 
 class PysmoSurrogateTrainingResult:
@@ -156,12 +161,34 @@ class PysmoTrainedSurrogate:
 # -------------------------
 
 
+def _train_output(trainer, output_label, seed):
+    """Train the model for one output of ``trainer``; used by worker processes."""
+    # Worker processes may inherit the same random state, so reseed for each output
+    np.random.seed(seed)
+    # PySMO models save themselves to a pickle file, so give each output a file
+    # of its own to keep concurrent workers from writing to the same file
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "solution.pickle")
+        return trainer._train_output(output_label, fname=fname)
+
+
 class PysmoTrainer(SurrogateTrainer):
     """Base class for Pysmo surrogate trainer classes."""
 
     # Initialize with configuration for base SurrogateTrainer
     CONFIG = SurrogateTrainer.CONFIG()
 
+    CONFIG.declare(
+        "num_workers",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of worker processes used to train the models for the "
+            "different outputs concurrently. The default of 1 trains the outputs one "
+            "after the other in the current process.",
+        ),
+    )
+
     # Subclasses must override this with a specific surrogate model type name
     model_type = "base"
 
@@ -193,7 +220,7 @@ class PysmoTrainer(SurrogateTrainer):
         return self._trained
 
     def _create_model(
-        self, pysmo_input: pd.DataFrame, output_label: str
+        self, pysmo_input: pd.DataFrame, output_label: str, fname: str = None
     ) -> Union[pr.PolynomialRegression, rbf.RadialBasisFunctions, krg.KrigingModel]:
         """Subclasses must override this and make it return a PySMO model."""
         raise NotImplementedError(
@@ -204,26 +231,60 @@ class PysmoTrainer(SurrogateTrainer):
         """Subclasses should override this to return a dict of metrics for the model."""
         return {}
 
+    def _train_output(self, output_label, fname=None) -> PysmoSurrogateTrainingResult:
+        """
+        Create and train the PySMO model for a single output. The model is saved
+        to ``fname``, or to PySMO's default file if None.
+        """
+        # Create input dataframe
+        pysmo_input = pd.concat(
+            [
+                self._training_dataframe[self._input_labels],
+                self._training_dataframe[[output_label]],
+            ],
+            axis=1,
+        )
+        # Create and train model
+        model = self._create_model(pysmo_input, output_label, fname=fname)
+        model.training()
+        # Store results
+        result = PysmoSurrogateTrainingResult()
+        result.model = model
+        result.metrics = self._get_metrics(model)
+        return result
+
     def _training_main_loop(self):
-        for i, output_label in enumerate(self._output_labels):
-            # Create input dataframe
-            pysmo_input = pd.concat(
-                [
-                    self._training_dataframe[self._input_labels],
-                    self._training_dataframe[[self._output_labels[i]]],
-                ],
-                axis=1,
-            )
-            # Create and train model
-            model = self._create_model(pysmo_input, output_label)
-            model.training()
-            # Store results
-            result = PysmoSurrogateTrainingResult()
-            result.model = model
-            result.metrics = self._get_metrics(model)
-            self._trained.add_result(output_label, result)
-            # Log the status
-            _log.info(f"Model for output {output_label} trained successfully")
+        # Each output gets a seed, and results are collected in the order of the
+        # output labels, so the trained surrogate does not depend on the number
+        # of workers or on scheduling. The seeds are drawn from a copy of the
+        # global random state, which is left untouched.
+        state = np.random.get_state()
+        rng = np.random.RandomState()
+        rng.set_state(state)
+        seeds = rng.randint(0, 2**31 - 1, size=len(self._output_labels))
+        num_workers = min(self.config.num_workers, len(self._output_labels))
+        if num_workers > 1:
+            # Outputs are independent, so train them in a process pool
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                results = executor.map(
+                    _train_output,
+                    [self] * len(self._output_labels),
+                    self._output_labels,
+                    seeds,
+                )
+                for output_label, result in zip(self._output_labels, results):
+                    self._trained.add_result(output_label, result)
+                    _log.info(f"Model for output {output_label} trained successfully")
+        else:
+            try:
+                for output_label, seed in zip(self._output_labels, seeds):
+                    np.random.seed(seed)
+                    result = self._train_output(output_label)
+                    self._trained.add_result(output_label, result)
+                    # Log the status
+                    _log.info(f"Model for output {output_label} trained successfully")
+            finally:
+                np.random.set_state(state)
 
 
 class PysmoPolyTrainer(PysmoTrainer):
@@ -294,7 +355,7 @@ class PysmoPolyTrainer(PysmoTrainer):
     def __init__(self, **settings):
         super().__init__(**settings)
 
-    def _create_model(self, pysmo_input, output_label):
+    def _create_model(self, pysmo_input, output_label, fname=None):
         model = pr.PolynomialRegression(
             pysmo_input,
             pysmo_input,
@@ -303,6 +364,7 @@ class PysmoPolyTrainer(PysmoTrainer):
             solution_method=self.config.solution_method,
             multinomials=self.config.multinomials,
             number_of_crossvalidations=self.config.number_of_crossvalidations,
+            fname=fname,
             overwrite=True,
         )
         variable_headers = model.get_feature_vector()
@@ -342,7 +404,7 @@ class PysmoRBFTrainer(PysmoTrainer):
     base_model_type = "rbf"
     model_type = "rbf"
 
-    CONFIG = SurrogateTrainer.CONFIG()
+    CONFIG = PysmoTrainer.CONFIG()
 
     CONFIG.declare(
         "basis_function",
@@ -372,17 +434,29 @@ class PysmoRBFTrainer(PysmoTrainer):
         ),
     )
 
+    CONFIG.declare(
+        "crossvalidation_workers",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of threads used to evaluate the shape parameter candidates "
+            "of the leave-one-out cross-validation grid search concurrently.",
+        ),
+    )
+
     def __init__(self, **settings):
         super().__init__(**settings)
         self.model_type = f"{self.config.basis_function} {self.base_model_type}"
 
-    def _create_model(self, pysmo_input, output_label):
+    def _create_model(self, pysmo_input, output_label, fname=None):
         model = rbf.RadialBasisFunctions(
             pysmo_input,
             basis_function=self.config.basis_function,
             solution_method=self.config.solution_method,
             regularization=self.config.regularization,
+            fname=fname,
             overwrite=True,
+            crossvalidation_workers=self.config.crossvalidation_workers,
         )
         variable_headers = model.get_feature_vector()
         return model
@@ -427,15 +501,28 @@ class PysmoKrigingTrainer(PysmoTrainer):
         ),
     )
 
+    CONFIG.declare(
+        "analytic_gradients",
+        ConfigValue(
+            default=False,
+            domain=Bool,
+            description="Choice of whether the gradients of the likelihood used in Kriging model training "
+            "are evaluated analytically (True) or by central differencing (False). "
+            "Analytic gradients need a single co-variance matrix factorization per gradient evaluation.",
+        ),
+    )
+
     def __init__(self, **settings):
         super().__init__(**settings)
 
-    def _create_model(self, pysmo_input, output_label):
+    def _create_model(self, pysmo_input, output_label, fname=None):
         model = krg.KrigingModel(
             pysmo_input,
             numerical_gradients=self.config.numerical_gradients,
             regularization=self.config.regularization,
+            fname=fname,
             overwrite=True,
+            analytic_gradients=self.config.analytic_gradients,
         )
         variable_headers = model.get_feature_vector()
         return model
@@ -468,26 +555,44 @@ class PysmoSurrogate(SurrogateBase):
             input_bounds,
         )
 
-    def evaluate_surrogate(self, inputs: pd.DataFrame) -> pd.DataFrame:
+    def evaluate_surrogate(
+        self, inputs: pd.DataFrame, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> pd.DataFrame:
         """Evaluate the surrogate model at a set of user-provided values.
 
+        The inputs are passed to the ``predict_output`` method of the PySMO model for
+        each output in chunks of up to ``batch_size`` rows, so each model is evaluated
+        with a few array operations rather than once per row.
+
         Args:
             inputs: The dataframe of input values to be used in the evaluation.
                 The dataframe needs to contain a column corresponding to each of the input labels.
                 Additional columns are fine, but are not used.
+            batch_size: Maximum number of rows passed to a model at once. Kriging and RBF
+                models create intermediate arrays of size ``batch_size`` times the number of
+                training points (or centres), so this bounds the memory used.
+                If None, all rows are evaluated in a single batch.
 
         Returns:
             output: A dataframe of the the output values evaluated at the provided inputs.
                 The index of the output dataframe should match the index of the provided inputs.
         """
-        inputdata = inputs[self._input_labels].to_numpy()
+        inputdata = inputs[self._input_labels].to_numpy(dtype=np.float64)
         outputs = np.zeros(shape=(inputs.shape[0], len(self._output_labels)))
 
-        for i in range(inputdata.shape[0]):
-            row_data = inputdata[i, :].reshape(1, len(self._input_labels))
-            for j, output_label in enumerate(self._output_labels):
-                result = self._trained.get_result(output_label)
-                outputs[i, j] = result.model.predict_output(row_data)
+        n_rows = inputdata.shape[0]
+        if batch_size is None:
+            batch_size = max(n_rows, 1)
+        elif batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, not {batch_size}")
+
+        for j, output_label in enumerate(self._output_labels):
+            model = self._trained.get_result(output_label).model
+            for start in range(0, n_rows, batch_size):
+                stop = min(start + batch_size, n_rows)
+                outputs[start:stop, j] = model.predict_output(
+                    inputdata[start:stop, :]
+                ).reshape(stop - start)
 
         return pd.DataFrame(
             data=outputs, index=inputs.index, columns=self._output_labels
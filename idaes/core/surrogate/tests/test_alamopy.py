@@ -18,12 +18,15 @@ import numpy as np
 import pandas as pd
 import io
 import os
+import gc
 from math import sin, cos, log, exp
 from pathlib import Path
 from io import StringIO
 
 from pyomo.environ import Var, Constraint
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 
 from idaes.core.surrogate.alamopy import (
     AlamoTrainer,
@@ -35,6 +38,7 @@ from idaes.core.surrogate.alamopy import (
 from idaes.core.surrogate.surrogate_block import SurrogateBlock
 from idaes.core.util.exceptions import ConfigurationError
 from idaes.core.surrogate.metrics import compute_fit_metrics
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 dirpath = Path(__file__).parent.resolve()
@@ -1313,6 +1317,60 @@ class TestAlamoSurrogate:
                 + 5 * exp(inputs["x2"][i] ** 5)
             )
 
+    @pytest.mark.unit
+    def test_evaluate_surrogate_rowwise(self, alm_surr3):
+        x = [0.2, 0.4, 0.6, 0.8, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0]
+
+        inputs = np.array([np.tile(x, len(x)), np.repeat(x, len(x))])
+        inputs = pd.DataFrame(inputs.transpose(), columns=["x1", "x2"])
+
+        out_vec = alm_surr3.evaluate_surrogate(inputs)
+        out_row = alm_surr3.evaluate_surrogate(inputs, vectorized=False)
+
+        assert alm_surr3._vec_unsupported == set()
+        for i in range(inputs.shape[0]):
+            assert pytest.approx(out_vec["z1"][i], rel=1e-12) == out_row["z1"][i]
+
+    @pytest.mark.unit
+    def test_evaluate_surrogate_fallback(self):
+        # tanh has no entry in NUMPY_FUNCS, so must be evaluated row-wise
+        alm_surr = AlamoSurrogate(
+            {"z1": " z1 == 2*x1 + x2", "z2": " z2 == tanh(x1)"},
+            ["x1", "x2"],
+            ["z1", "z2"],
+        )
+        inputs = pd.DataFrame({"x1": [1.0, 2.0, 3.0], "x2": [4.0, 5.0, 6.0]})
+
+        with pytest.raises(NameError):
+            alm_surr.evaluate_surrogate(inputs, vectorized=False)
+
+        alm_surr._fcn = {"z1": lambda x1, x2: 2 * x1 + x2, "z2": lambda x1, x2: -x1}
+        out = alm_surr.evaluate_surrogate(inputs)
+
+        assert alm_surr._vec_unsupported == {"z2"}
+        assert list(out["z1"]) == [6.0, 9.0, 12.0]
+        assert list(out["z2"]) == [-1.0, -2.0, -3.0]
+
+    @pytest.mark.unit
+    def test_evaluate_surrogate_domain_error(self):
+        alm_surr = AlamoSurrogate(
+            {"z1": " z1 == 2*x1 + x2", "z2": " z2 == log(x1)"},
+            ["x1", "x2"],
+            ["z1", "z2"],
+        )
+        inputs = pd.DataFrame({"x1": [1.0, -2.0, 3.0], "x2": [4.0, 5.0, 6.0]})
+
+        # the same error is raised with and without vectorization
+        for vectorized in [True, False]:
+            with pytest.raises(ValueError, match="math domain error"):
+                alm_surr.evaluate_surrogate(inputs, vectorized=vectorized)
+
+        # the output is evaluated with NumPy again for valid inputs
+        out = alm_surr.evaluate_surrogate(inputs.iloc[[0, 2]])
+        assert alm_surr._vec_unsupported == set()
+        assert list(out["z1"]) == [6.0, 12.0]
+        assert out["z2"].to_numpy() == pytest.approx([0.0, log(3.0)])
+
     @pytest.mark.unit
     def test_populate_block_funcs(self, alm_surr3):
         blk = SurrogateBlock(concrete=True)
@@ -1396,6 +1454,44 @@ class TestAlamoSurrogate:
         assert not os.path.isfile(fname)
 
 
+@pytest.mark.performance
+class TestAlamoEvaluatePerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to evaluate an ALAMO surrogate row-wise with Pyomo and with
+    the vectorized NumPy path.
+    """
+
+    number_of_rows = 20000
+
+    @pytest.mark.performance
+    def test_performance(self):
+        alm_surr = AlamoSurrogate(
+            {"z1": " z1 == 2*sin(x1**2) - 3*cos(x2**3) - 4*log(x1**4) + 5*exp(x2**5)"},
+            ["x1", "x2"],
+            ["z1"],
+        )
+        rng = np.random.default_rng(42)
+        inputs = pd.DataFrame(
+            rng.uniform(0.2, 1.2, size=(self.number_of_rows, 2)), columns=["x1", "x2"]
+        )
+
+        gc.collect()
+        timer = TicTocTimer()
+        out_row = alm_surr.evaluate_surrogate(inputs, vectorized=False)
+        self.recordData(
+            "row-wise evaluation", timer.toc(f"row-wise evaluation, {len(inputs)} rows")
+        )
+        gc.collect()
+        timer.tic(None)
+        out_vec = alm_surr.evaluate_surrogate(inputs)
+        self.recordData(
+            "vectorized evaluation",
+            timer.toc(f"vectorized evaluation, {len(inputs)} rows"),
+        )
+
+        np.testing.assert_allclose(out_vec.to_numpy(), out_row.to_numpy(), rtol=1e-12)
+
+
 @pytest.mark.skipif(alamo.executable is None, reason="ALAMO not available")
 @pytest.mark.integration
 class TestWorkflow:
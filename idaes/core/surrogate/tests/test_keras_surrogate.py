@@ -19,6 +19,7 @@ pytest.importorskip("tensorflow.keras", reason="tensorflow.keras not available")
 pytest.importorskip("omlt", reason="omlt not available")
 
 import os.path
+import numpy as np
 import pandas as pd
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
@@ -217,6 +218,49 @@ def test_keras_evaluate():
     pd.testing.assert_frame_equal(y, expected_y, rtol=rtol, atol=atol)
 
 
+@pytest.mark.unit
+def test_keras_evaluate_batches():
+    keras_surrogate = create_keras_model(
+        name="PT_data_2_10_10_2_sigmoid", return_keras_model_only=False
+    )
+    x = pd.DataFrame(
+        {
+            "Temperature_K": np.linspace(360, 380, 25),
+            "Pressure_Pa": np.linspace(1.05 * 101325, 1.15 * 101325, 25),
+        },
+        index=range(100, 125),
+    )
+    expected_y = keras_surrogate.evaluate_surrogate(x)
+
+    # single dataframe, split into batches
+    batches = list(keras_surrogate.evaluate_surrogate_batches(x, batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    y = pd.concat(batches)
+    pd.testing.assert_frame_equal(y, expected_y, rtol=rtol, atol=atol)
+
+    # iterable of dataframes
+    chunks = (x.iloc[i : i + 7] for i in range(0, len(x), 7))
+    y = pd.concat(keras_surrogate.evaluate_surrogate_batches(chunks, batch_size=5))
+    pd.testing.assert_frame_equal(y, expected_y, rtol=rtol, atol=atol)
+
+    # memory-mapped array
+    with TempfileManager.new_context() as tf:
+        fname = tf.create_tempfile(suffix=".npy")
+        np.save(fname, x.to_numpy())
+        x_mmap = np.load(fname, mmap_mode="r")
+        y = pd.concat(keras_surrogate.evaluate_surrogate_batches(x_mmap, batch_size=8))
+        del x_mmap
+    np.testing.assert_allclose(
+        y.to_numpy(), expected_y.to_numpy(), rtol=rtol, atol=atol
+    )
+    assert list(y.index) == list(range(25))
+
+    with pytest.raises(ValueError):
+        list(keras_surrogate.evaluate_surrogate_batches(x, batch_size=0))
+    with pytest.raises(ValueError):
+        list(keras_surrogate.evaluate_surrogate_batches(np.zeros((5, 3))))
+
+
 @pytest.mark.unit
 @pytest.mark.skipif(not SolverFactory("ipopt").available(False), reason="no Ipopt")
 def test_keras_surrogate_auto_creating_variables():
@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 import io
 import os
+import gc
 from math import sin, cos, log, exp
 
 from pathlib import Path
@@ -25,8 +26,10 @@ from io import StringIO
 import re
 
 import pyomo as pyo
-from pyomo.environ import ConcreteModel, Var, Constraint
+from pyomo.environ import ConcreteModel, Var, Constraint, value
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
 
 from idaes.core.surrogate.pysmo import (
     polynomial_regression as pr,
@@ -47,6 +50,7 @@ from idaes.core.surrogate.pysmo_surrogate import (
 from idaes.core.surrogate.surrogate_block import SurrogateBlock
 from idaes.core.util.exceptions import ConfigurationError
 from idaes.core.surrogate.metrics import compute_fit_metrics
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 dirpath = Path(__file__).parent.resolve()
@@ -698,6 +702,8 @@ class TestPysmoRBFTrainer:
         assert pysmo_rbf_trainer.config.basis_function == None
         assert pysmo_rbf_trainer.config.regularization == None
         assert pysmo_rbf_trainer.config.solution_method == None
+        assert pysmo_rbf_trainer.config.num_workers == 1
+        assert pysmo_rbf_trainer.config.crossvalidation_workers == 1
 
     @pytest.mark.unit
     def test_set_basis_function_righttype_1(self, pysmo_rbf_trainer):
@@ -812,9 +818,20 @@ class TestPysmoRBFTrainer:
         assert model.basis_function == "gaussian"
         assert model.regularization == True
         assert model.solution_method == "algebraic"
+        assert model.crossvalidation_workers == 1
         # assert model.filename == 'pysmo_Nonerbf_z5.pickle'
         assert list(model.feature_list._data.keys()) == data.columns.tolist()[:-1]
 
+    @pytest.mark.unit
+    def test_create_model_crossvalidation_workers(self, pysmo_rbf_trainer):
+        pysmo_rbf_trainer.config.crossvalidation_workers = 4
+        output_label = "z5"
+        data = {"x1": [1, 2, 3, 4], "x2": [5, 6, 7, 8], "z1": [10, 20, 30, 40]}
+        data = pd.DataFrame(data)
+
+        model = pysmo_rbf_trainer._create_model(data, output_label)
+        assert model.crossvalidation_workers == 4
+
     @pytest.mark.unit
     def test_create_model_cubic(self, pysmo_rbf_trainer):
         pysmo_rbf_trainer.config.basis_function = "cubic"
@@ -883,6 +900,7 @@ class TestPysmoKrigingTrainer:
         assert pysmo_krg_trainer.model_type == "kriging"
         assert pysmo_krg_trainer.config.numerical_gradients == True
         assert pysmo_krg_trainer.config.regularization == True
+        assert pysmo_krg_trainer.config.num_workers == 1
 
     @pytest.mark.unit
     def test_set_regularization_righttype_1(self, pysmo_krg_trainer):
@@ -1010,6 +1028,77 @@ class TestPysmoKrigingTrainer:
         assert model.num_vars == data.shape[1]
         assert list(model.feature_list._data.keys()) == data.columns.tolist()[:-1]
 
+    @pytest.mark.unit
+    def test_create_model_analytic_gradients(self, pysmo_krg_trainer):
+        output_label = "z5"
+        data = {"x1": [1, 2, 3, 4], "x2": [5, 6, 7, 8], "z1": [10, 20, 30, 40]}
+        data = pd.DataFrame(data)
+
+        assert pysmo_krg_trainer.config.analytic_gradients == False
+        model = pysmo_krg_trainer._create_model(data, output_label)
+        assert model.analytic_gradients == False
+
+        pysmo_krg_trainer.config.analytic_gradients = True
+        model = pysmo_krg_trainer._create_model(data, output_label)
+        assert model.analytic_gradients == True
+
+    @pytest.mark.unit
+    def test_set_num_workers_wrongtype(self, pysmo_krg_trainer):
+        for value in [0, -1, 1.5]:
+            with pytest.raises(ValueError):
+                pysmo_krg_trainer.config.num_workers = value
+
+    @pytest.mark.component
+    def test_train_surrogate_parallel(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        training_data = {
+            "x1": [1, 2, 3, 4, 5, 6],
+            "x2": [5, 6, 7, 8, 9, 10],
+            "z1": [10, 20, 30, 40, 50, 60],
+            "z2": [6, 8, 10, 12, 14, 16],
+            "z3": [1, 4, 9, 16, 25, 36],
+        }
+        training_data = pd.DataFrame(training_data)
+        input_labels = ["x1", "x2"]
+        output_labels = ["z1", "z2", "z3"]
+
+        trained = []
+        for num_workers in [1, 2, 3]:
+            np.random.seed(0)
+            pysmo_trainer = PysmoKrigingTrainer(
+                input_labels=input_labels,
+                output_labels=output_labels,
+                training_dataframe=training_data,
+                num_workers=num_workers,
+            )
+            state = np.random.get_state()
+            trained.append(pysmo_trainer.train_surrogate())
+            # the global random state of the caller is not changed
+            after = np.random.get_state()
+            assert state[0] == after[0]
+            np.testing.assert_array_equal(state[1], after[1])
+            assert state[2:] == after[2:]
+            # worker processes do not write the models to the working directory
+            assert os.path.exists("solution.pickle") == (num_workers == 1)
+            if num_workers == 1:
+                os.remove("solution.pickle")
+
+        for a in trained:
+            assert a.output_labels == output_labels
+            assert a.num_outputs == 3
+            for output_label in output_labels:
+                assert isinstance(a.get_result(output_label).model, krg.KrigingModel)
+        for a in trained[1:]:
+            for output_label in output_labels:
+                assert (
+                    trained[0].get_result(output_label).expression_str
+                    == a.get_result(output_label).expression_str
+                )
+                assert (
+                    trained[0].get_result(output_label).metrics
+                    == a.get_result(output_label).metrics
+                )
+
 
 class TestPysmoSurrogate:
     @pytest.fixture
@@ -2912,6 +3001,47 @@ class TestPysmoSurrogate:
         # Check for clean up
         assert not os.path.isfile(fname)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "jstring", [jstring_poly_3, jstring_poly_4, jstring_rbf, jstring_krg]
+    )
+    def test_evaluate_batch_size(self, jstring):
+        pysmo_surr = PysmoSurrogate.load(StringIO(jstring))
+
+        x = [0.2, 0.4, 0.6, 0.8, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0]
+        inputs = np.array([np.tile(x, len(x)), np.repeat(x, len(x))])
+        inputs = pd.DataFrame(inputs.transpose(), columns=["x1", "x2"])
+
+        out = pysmo_surr.evaluate_surrogate(inputs)
+        out_single = pysmo_surr.evaluate_surrogate(inputs, batch_size=None)
+        out_chunked = pysmo_surr.evaluate_surrogate(inputs, batch_size=7)
+
+        # Compare with the Pyomo expressions of the models, evaluated row by row
+        m = ConcreteModel()
+        m.x = Var(["x1", "x2"])
+        expressions = {
+            o: pysmo_surr._trained.get_result(o).model.generate_expression(
+                [m.x["x1"], m.x["x2"]]
+            )
+            for o in pysmo_surr._output_labels
+        }
+        for o in pysmo_surr._output_labels:
+            for i in range(inputs.shape[0]):
+                m.x["x1"].set_value(inputs["x1"][i])
+                m.x["x2"].set_value(inputs["x2"][i])
+                expected = value(expressions[o])
+                assert pytest.approx(out[o][i], rel=1e-6) == expected
+                assert pytest.approx(out_single[o][i], rel=1e-6) == expected
+                assert pytest.approx(out_chunked[o][i], rel=1e-6) == expected
+
+    @pytest.mark.unit
+    def test_evaluate_batch_size_invalid(self):
+        pysmo_surr = PysmoSurrogate.load(StringIO(jstring_poly_1))
+        inputs = pd.DataFrame({"x1": [1.0, 2.0], "x2": [3.0, 4.0]})
+
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            pysmo_surr.evaluate_surrogate(inputs, batch_size=0)
+
 
 @pytest.mark.integration
 class TestRegressionWorkflow:
@@ -3190,3 +3320,41 @@ class TestKrigingWorkflow:
         assert metrics["z1"]["RMSE"] == pytest.approx(
             pysmo_trainer_krg._data["z1"].metrics["RMSE"], rel=1e-8
         )
+
+
+@pytest.mark.performance
+class TestTrainSurrogateParallelPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to train Kriging surrogates for several outputs with one
+    and several worker processes.
+    """
+
+    @pytest.mark.performance
+    def test_performance(self):
+        rng = np.random.RandomState(0)
+        x = rng.rand(150, 3)
+        training_data = pd.DataFrame(x, columns=["x1", "x2", "x3"])
+        output_labels = [f"z{i}" for i in range(8)]
+        for i, output_label in enumerate(output_labels):
+            training_data[output_label] = np.sin((i + 1) * x[:, 0]) + x[:, 1] * x[:, 2]
+
+        expressions = {}
+        for num_workers in [1, 2, 4]:
+            np.random.seed(0)
+            pysmo_trainer = PysmoKrigingTrainer(
+                input_labels=["x1", "x2", "x3"],
+                output_labels=output_labels,
+                training_dataframe=training_data,
+                num_workers=num_workers,
+            )
+            label = f"train {len(output_labels)} outputs, {num_workers} worker(s)"
+            gc.collect()
+            timer = TicTocTimer()
+            trained = pysmo_trainer.train_surrogate()
+            self.recordData(label, timer.toc(label))
+            expressions[num_workers] = [
+                trained.get_result(o).expression_str for o in output_labels
+            ]
+
+        # Training does not depend on the number of workers
+        assert expressions[1] == expressions[2] == expressions[4]
@@ -0,0 +1,246 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Performance tests for the evaluation and Pyomo block construction of the
+ALAMO, PySMO and Keras surrogates.
+
+The surrogates are built from the synthetic data set bundled in the data folder
+(or, for ALAMO, from fixed expressions), so no ALAMO executable or solver is needed.
+"""
+import gc
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyomo.common.fileutils import this_file_dir
+from pyomo.common.timing import TicTocTimer
+from pyomo.core.expr.current import sizeof_expression
+from pyomo.environ import ConcreteModel, Constraint
+import pyomo.common.unittest as unittest
+
+from idaes.core.surrogate.alamopy import AlamoSurrogate
+from idaes.core.surrogate.keras_surrogate import (
+    KerasSurrogate,
+    keras_available,
+    omlt_available,
+)
+from idaes.core.surrogate.pysmo_surrogate import (
+    PysmoPolyTrainer,
+    PysmoRBFTrainer,
+    PysmoKrigingTrainer,
+    PysmoSurrogate,
+)
+from idaes.core.surrogate.surrogate_block import SurrogateBlock
+from idaes.core.util.model_statistics import (
+    number_variables,
+    number_total_constraints,
+)
+from idaes.core.util.performance import PerformanceBaseClass
+
+
+data_folder = os.path.join(this_file_dir(), "data")
+
+input_labels = ["x1", "x2"]
+output_labels = ["z1", "z2"]
+input_bounds = {"x1": (-1.5, 1.5), "x2": (-1.5, 1.5)}
+
+
+def load_benchmark_data():
+    return pd.read_csv(os.path.join(data_folder, "synthetic_benchmark_data.csv"))
+
+
+class SurrogatePerformanceBase(PerformanceBaseClass, unittest.TestCase):
+    """
+    Common performance test for surrogate objects. Derived classes implement
+    build_surrogate, which returns the surrogate object (derived from
+    SurrogateBase) to be tested.
+
+    The following data is recorded:
+
+    * evaluation time and rows per second of ``evaluate_surrogate``,
+    * time to build the Pyomo block with ``SurrogateBlock.build_model``,
+    * number of variables, constraints and expression nodes of the block.
+    """
+
+    __test__ = False
+
+    # Number of rows used to time evaluate_surrogate
+    number_of_rows = 100000
+    # Keyword arguments passed to SurrogateBlock.build_model
+    build_options = {}
+
+    def build_surrogate(self):
+        raise NotImplementedError(
+            "Test class has not implemented a build_surrogate method."
+        )
+
+    def evaluation_inputs(self, surrogate):
+        """Random points within the bounds of the surrogate inputs"""
+        rng = np.random.RandomState(42)
+        bounds = surrogate.input_bounds()
+        return pd.DataFrame(
+            {
+                k: rng.uniform(bounds[k][0], bounds[k][1], self.number_of_rows)
+                for k in surrogate.input_labels()
+            }
+        )
+
+    @pytest.mark.performance
+    def test_performance(self):
+        surrogate = self.build_surrogate()
+        inputs = self.evaluation_inputs(surrogate)
+
+        # Evaluate surrogate and record execution time
+        gc.collect()
+        timer = TicTocTimer()
+        outputs = surrogate.evaluate_surrogate(inputs)
+        t_eval = timer.toc(f"evaluate surrogate, {inputs.shape[0]} rows")
+        self.recordData("evaluate surrogate", t_eval)
+        self.recordData("evaluate surrogate rows per second", inputs.shape[0] / t_eval)
+        assert outputs.shape == (inputs.shape[0], surrogate.n_outputs())
+        assert np.all(np.isfinite(outputs.to_numpy()))
+
+        # Build Pyomo block and record execution time and model size
+        m = ConcreteModel()
+        m.surrogate = SurrogateBlock(concrete=True)
+        gc.collect()
+        timer.tic(None)
+        m.surrogate.build_model(surrogate, **dict(self.build_options))
+        self.recordData("build model", timer.toc("build model"))
+
+        n_vars = number_variables(m)
+        n_cons = number_total_constraints(m)
+        n_nodes = sum(
+            sizeof_expression(c.body)
+            for c in m.component_data_objects(Constraint, descend_into=True)
+        )
+        self.recordData("number of variables", n_vars)
+        self.recordData("number of constraints", n_cons)
+        self.recordData("number of expression nodes", n_nodes)
+        assert n_vars >= surrogate.n_inputs() + surrogate.n_outputs()
+        assert n_cons >= surrogate.n_outputs()
+
+
+@pytest.mark.performance
+class TestAlamoPerformance(SurrogatePerformanceBase):
+    __test__ = True
+
+    def build_surrogate(self):
+        surrogate_expressions = {
+            "z1": " z1 == 1.02 * x1**2 - 0.49 * x1 * x2 + 0.51 * x2 + 0.13 * x2**2"
+            " + 0.02 * exp(x2) + 0.98",
+            "z2": " z2 == 0.97 * sin(x1) + 0.30 * x2**3 - 0.01 * x1 * x2"
+            " + 0.02 * cos(x2) + log(x1 + 2) * 0.01",
+        }
+        return AlamoSurrogate(
+            surrogate_expressions, input_labels, output_labels, input_bounds
+        )
+
+
+@pytest.mark.performance
+class TestPysmoPolyPerformance(SurrogatePerformanceBase):
+    __test__ = True
+
+    def build_surrogate(self):
+        trainer = PysmoPolyTrainer(
+            input_labels=input_labels,
+            output_labels=output_labels,
+            input_bounds=input_bounds,
+            training_dataframe=load_benchmark_data(),
+            maximum_polynomial_order=4,
+            multinomials=True,
+            solution_method="mle",
+        )
+        return PysmoSurrogate(
+            trainer.train_surrogate(), input_labels, output_labels, input_bounds
+        )
+
+
+@pytest.mark.performance
+class TestPysmoRBFPerformance(SurrogatePerformanceBase):
+    __test__ = True
+
+    def build_surrogate(self):
+        trainer = PysmoRBFTrainer(
+            input_labels=input_labels,
+            output_labels=output_labels,
+            input_bounds=input_bounds,
+            training_dataframe=load_benchmark_data(),
+            basis_function="gaussian",
+        )
+        return PysmoSurrogate(
+            trainer.train_surrogate(), input_labels, output_labels, input_bounds
+        )
+
+
+@pytest.mark.performance
+class TestPysmoKrigingPerformance(SurrogatePerformanceBase):
+    __test__ = True
+
+    def build_surrogate(self):
+        np.random.seed(0)
+        trainer = PysmoKrigingTrainer(
+            input_labels=input_labels,
+            output_labels=output_labels,
+            input_bounds=input_bounds,
+            training_dataframe=load_benchmark_data(),
+        )
+        return PysmoSurrogate(
+            trainer.train_surrogate(), input_labels, output_labels, input_bounds
+        )
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    not keras_available or not omlt_available,
+    reason="tensorflow.keras or omlt not available",
+)
+class TestKerasPerformance(SurrogatePerformanceBase):
+    __test__ = True
+
+    build_options = {"formulation": KerasSurrogate.Formulation.FULL_SPACE}
+
+    def build_surrogate(self):
+        from idaes.core.surrogate.keras_surrogate import load_keras_json_hd5
+        from idaes.core.surrogate.sampling.scaling import OffsetScaler
+
+        keras_model = load_keras_json_hd5(
+            os.path.join(data_folder, "keras_models"), "PT_data_2_10_10_2_sigmoid"
+        )
+        input_scaler = OffsetScaler(
+            expected_columns=["Temperature_K", "Pressure_Pa"],
+            offset_series=pd.Series(
+                {"Temperature_K": 369.983611, "Pressure_Pa": 111421.319811}
+            ),
+            factor_series=pd.Series(
+                {"Temperature_K": 5.836047, "Pressure_Pa": 5917.954504}
+            ),
+        )
+        output_scaler = OffsetScaler(
+            expected_columns=["EnthMol", "VapFrac"],
+            offset_series=pd.Series({"EnthMol": 54599.629980, "VapFrac": 0.403307}),
+            factor_series=pd.Series({"EnthMol": 14654.226615, "VapFrac": 0.430181}),
+        )
+        return KerasSurrogate(
+            keras_model,
+            input_labels=["Temperature_K", "Pressure_Pa"],
+            output_labels=["EnthMol", "VapFrac"],
+            input_bounds={
+                "Temperature_K": (360, 380),
+                "Pressure_Pa": (1.05 * 101325, 1.15 * 101325),
+            },
+            input_scaler=input_scaler,
+            output_scaler=output_scaler,
+        )
@@ -25,7 +25,7 @@ from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
 import pint
-from pyomo.environ import Block, value
+from pyomo.environ import Block, Param, Var, value
 from pyomo.network import Arc
 from pyomo.network.port import Port
 
@@ -121,6 +121,100 @@ def validate_flowsheet(fs: Dict) -> Tuple[bool, str]:
     return True, ""
 
 
+def _values_signature(block) -> Tuple:
+    """Values of the variables and mutable parameters in a block, including
+    its sub-blocks, in a form that can be compared to detect changes.
+    """
+    values = [
+        (v.value, v.fixed) for v in block.component_data_objects(Var, descend_into=True)
+    ]
+    for param in block.component_objects(Param, descend_into=True):
+        if param.mutable:
+            values.extend(p.value for p in param.values())
+    return tuple(values)
+
+
+def flowsheet_signature(flowsheet) -> Tuple:
+    """Signature of the structure and values of a flowsheet.
+
+    The serialization of a flowsheet (see :class:`FlowsheetSerializer`) only
+    changes if its signature does, so comparing signatures is a quick way to
+    find out whether it needs to be serialized again.
+
+    Args:
+        flowsheet: The flowsheet
+
+    Returns:
+        Tuple of the arcs (with their source and destination), the values
+        of the flowsheet's own variables, and the names and values of the
+        top-level blocks
+    """
+    arcs = tuple(
+        (arc.getname(), str(arc.source), str(arc.dest))
+        for arc in flowsheet.component_objects(Arc, descend_into=False)
+    )
+    own_values = tuple(
+        (v.value, v.fixed)
+        for v in flowsheet.component_data_objects(Var, descend_into=False)
+    )
+    blocks = tuple(
+        (block.getname(), _values_signature(block))
+        for block in flowsheet.component_data_objects(Block, descend_into=False)
+    )
+    return arcs, own_values, blocks
+
+
+class SerializerCache:
+    """Results of the serialization of a flowsheet, which are reused by the
+    next serialization of the same flowsheet.
+
+    If the flowsheet did not change at all (see :func:`flowsheet_signature`),
+    the previous result is returned as-is. Otherwise, only the contents of
+    the unit models whose variable values changed are serialized again.
+
+    Example usage::
+
+        cache = SerializerCache()
+        fs_dict = cache.serialize(m.fs, "my_flowsheet")
+        # ... change or solve the model
+        fs_dict = cache.serialize(m.fs, "my_flowsheet")
+
+    Attributes:
+        signature: Signature of the flowsheet for `result`
+        result: Serialized flowsheet. This is shared by all callers, so it
+            must not be modified.
+        units: Serialized contents of each unit model, with the signature
+            of its values
+    """
+
+    def __init__(self):
+        self.signature = None
+        self.result = None
+        self.units = {}
+        self._name = None
+
+    def serialize(self, flowsheet, name: str, signature: Tuple = None) -> Dict:
+        """Serialize a flowsheet, reusing previous results where possible.
+
+        Args:
+            flowsheet: The flowsheet to serialize
+            name: The name of the flowsheet
+            signature: Signature of the flowsheet, if it was already computed
+
+        Returns:
+            Serialized flowsheet, as from :meth:`FlowsheetSerializer.as_dict`
+
+        Raises:
+            ValueError if the flowsheet is found to be invalid
+        """
+        if signature is None:
+            signature = flowsheet_signature(flowsheet)
+        if self.result is None or signature != self.signature or name != self._name:
+            self.result = FlowsheetSerializer(flowsheet, name, cache=self).as_dict()
+            self.signature, self._name = signature, name
+        return self.result
+
+
 class FlowsheetSerializer:
     """Serializes the flowsheet into one dict with two sections.
 
@@ -146,13 +240,21 @@ class FlowsheetSerializer:
         re.IGNORECASE,
     )
 
-    def __init__(self, flowsheet, name: str, validate: bool = True):
+    def __init__(
+        self,
+        flowsheet,
+        name: str,
+        validate: bool = True,
+        cache: SerializerCache = None,
+    ):
         """Serialize input flowsheet with given name
 
         Args:
             flowsheet: The flowsheet to serialize
             name: The name of the flowsheet (also called its 'id' in some contexts)
             validate: If True, validate that the flowsheet is a reaonsable IDAES model, first
+            cache: If given, reuse the serialized contents of unit models in the
+                cache whose values did not change, and update the cache
         Raises:
             ValueError if validation is on and flowsheet is found to be invalid
         """
@@ -201,9 +303,14 @@ class FlowsheetSerializer:
         self.name = name
         self.flowsheet = flowsheet
         self._positioning_model = None
+        self._cache = cache
+        self._unit_signatures = {}
+        self._cached_units = {}
         # serialize
         self._ingest_flowsheet()
         self._construct_output_json()
+        if cache is not None:
+            self._update_cache()
 
     def as_dict(self):
         return self._out_json
@@ -377,6 +484,16 @@ class FlowsheetSerializer:
             for port in unit.component_objects(Port, descend_into=False):
                 self.ports[port] = unit
 
+            if self._cache is not None:
+                signature = _values_signature(unit)
+                self._unit_signatures[unit_name] = signature
+                cached = self._cache.units.get(unit_name, None)
+                if cached is not None and cached[0] == signature:
+                    # values did not change: reuse the serialized contents
+                    self._cached_units[unit_name] = cached
+                    self._serialized_contents[unit_name] = cached[1]
+                    return
+
             performance_contents, stream_df = unit.serialize_contents()
             if stream_df is not None and not stream_df.empty:
                 # If there is a stream dataframe then we need to reset the index so we can get the variable names
@@ -565,7 +682,9 @@ class FlowsheetSerializer:
                 "type": unit_type,
                 "image": "/images/icons/" + unit_icon.icon,
             }
-            if unit_name in self._serialized_contents:
+            if unit_name in self._cached_units:
+                unit_contents.update(self._cached_units[unit_name][2])
+            elif unit_name in self._serialized_contents:
                 for pfx in "performance", "stream":
                     content_type = pfx + "_contents"
                     c = (
@@ -589,6 +708,23 @@ class FlowsheetSerializer:
                 "label": self.labels[edge],
             }
 
+    def _update_cache(self):
+        """Store the serialized contents of the unit models in the cache."""
+        units = {}
+        for unit_name, signature in self._unit_signatures.items():
+            unit_json = self._out_json["model"]["unit_models"].get(unit_name, {})
+            contents = {
+                k: unit_json[k]
+                for k in ("performance_contents", "stream_contents")
+                if k in unit_json
+            }
+            units[unit_name] = (
+                signature,
+                self._serialized_contents[unit_name],
+                contents,
+            )
+        self._cache.units = units
+
     def _add_port_item(self, cell_index, group, id):
         """Add port item to jointjs element"""
         new_port_item = {"group": group, "id": id}
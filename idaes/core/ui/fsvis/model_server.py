@@ -17,18 +17,20 @@ The main class is `FlowsheetServer`, which is instantiated from the `visualize()
 """
 
 # stdlib
+import copy
+import hashlib
 import http.server
 import json
 from pathlib import Path
 import re
 import socket
 import threading
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 from urllib.parse import urlparse
 
 # package
 from idaes import logger
-from ..flowsheet import FlowsheetDiff, FlowsheetSerializer
+from ..flowsheet import FlowsheetDiff, SerializerCache, flowsheet_signature
 from . import persist, errors
 
 _log = logger.getLogger(__name__)
@@ -39,6 +41,45 @@ _static_dir = _this_dir / "static"
 _template_dir = _this_dir / "templates"
 
 
+class _CachedFlowsheet:
+    """Flowsheet value last returned by the server, and what it was computed
+    from: the signature of the flowsheet in memory and the stamp of the
+    stored flowsheet. While both are unchanged, the value is still current.
+    """
+
+    def __init__(self):
+        self.serializer_cache = SerializerCache()
+        self.flowsheet = None
+        self.signature = None
+        self.store_stamp = None
+        self.merged = None
+        self._json = None
+
+    def is_current(self, flowsheet, signature, store_stamp) -> bool:
+        return (
+            self.merged is not None
+            and store_stamp is not None
+            and store_stamp == self.store_stamp
+            and flowsheet is self.flowsheet
+            and signature == self.signature
+        )
+
+    def update(self, flowsheet, signature, store_stamp, merged: Dict):
+        self.flowsheet, self.signature = flowsheet, signature
+        self.store_stamp, self.merged = store_stamp, merged
+        self._json = None
+
+    def invalidate(self):
+        self.merged, self._json = None, None
+
+    def as_json(self) -> Tuple[bytes, str]:
+        """Encoded JSON of the merged value, and its entity tag."""
+        if self._json is None:
+            value = utf8_encode(json.dumps(self.merged))
+            self._json = value, f'"{hashlib.sha1(value).hexdigest()}"'
+        return self._json
+
+
 class FlowsheetServer(http.server.HTTPServer):
     """A simple HTTP server that runs in its own thread.
 
@@ -56,6 +97,7 @@ class FlowsheetServer(http.server.HTTPServer):
         super().__init__(("127.0.0.1", self._port), FlowsheetServerHandler)
         self._dsm = persist.DataStoreManager()
         self._flowsheets = {}
+        self._cached = {}
         self._thr = None
         self._settings_block = {}
 
@@ -116,6 +158,7 @@ class FlowsheetServer(http.server.HTTPServer):
         # replace all but 'unreserved' (RFC 3896) chars with a dash; remove duplicate dashes
         id_ = self.canonical_flowsheet_name(id_)
         self._flowsheets[id_] = flowsheet
+        self._cached[id_] = _CachedFlowsheet()
         _log.debug(f"Flowsheet '{id_}' storage is {store}")
         self._dsm.add(id_, store)
         # First try to update, so as not to overwrite saved value
@@ -124,7 +167,7 @@ class FlowsheetServer(http.server.HTTPServer):
         except errors.FlowsheetNotFoundInDatastore:
             _log.debug(f"No existing flowsheet found in {store}: saving new value")
             # If not found in datastore, save new value
-            fs_dict = FlowsheetSerializer(flowsheet, id_).as_dict()
+            fs_dict = self._serialize_flowsheet(id_, flowsheet)
             store.save(fs_dict)
         else:
             _log.debug(f"Existing flowsheet found in {store}: saving merged value")
@@ -153,6 +196,8 @@ class FlowsheetServer(http.server.HTTPServer):
         Raises:
             ProcessingError, if parsing of JSON failed (see :meth:`DataStoreManager.save()`)
         """
+        if id_ in self._cached:
+            self._cached[id_].invalidate()
         try:
             self._dsm.save(id_, flowsheet)
         except errors.DatastoreError as err:
@@ -176,6 +221,49 @@ class FlowsheetServer(http.server.HTTPServer):
             FlowsheetNotFound (subclass) if the flowsheet id is known, but it can't be retrieved
             ProcessingError for internal errors
         """
+        # Return a copy of the merged value
+        return copy.deepcopy(self._update_cached(id_).merged)
+
+    def flowsheet_json(self, id_: str) -> Tuple[bytes, str]:
+        """Update flowsheet, as for :meth:`update_flowsheet`, and get it as JSON.
+
+        Args:
+            id_: Identifier of flowsheet to update.
+
+        Returns:
+            Tuple of the UTF-8 encoded JSON of the merged flowsheet, and an
+            entity tag (ETag) which only changes if the JSON does.
+
+        Raises:
+            See :meth:`update_flowsheet`
+        """
+        return self._update_cached(id_).as_json()
+
+    # === Internal methods ===
+
+    def _update_cached(self, id_: str) -> _CachedFlowsheet:
+        """Update the cached value of a flowsheet.
+
+        If neither the flowsheet in memory nor the flowsheet in the datastore
+        changed since the last update, the cached value is still current.
+        Otherwise, the stored flowsheet is loaded and merged with the current
+        value, which is serialized again, but only for the unit models whose
+        values changed.
+        """
+        try:
+            store_stamp = self._dsm.stamp(id_)
+        except KeyError:
+            raise errors.FlowsheetUnknown(id_)
+        cached = self._cached.setdefault(id_, _CachedFlowsheet())
+        obj = self._flowsheets.get(id_, None)
+        if obj is not None and cached.merged is not None:
+            try:
+                signature = flowsheet_signature(obj)
+            except (AttributeError, KeyError) as err:
+                raise errors.ProcessingError(f"Cannot serialize flowsheet: {err}")
+            if cached.is_current(obj, signature, store_stamp):
+                _log.debug("Flowsheet in memory and in datastore are unchanged")
+                return cached
         # Get saved flowsheet from datastore
         try:
             saved = self._load_flowsheet(id_)
@@ -189,25 +277,27 @@ class FlowsheetServer(http.server.HTTPServer):
         except KeyError:
             raise errors.FlowsheetNotFoundInMemory(id_)
         try:
-            obj_dict = self._serialize_flowsheet(id_, obj)
-        except ValueError as err:
+            signature = flowsheet_signature(obj)
+            obj_dict = self._serialize_flowsheet(id_, obj, signature=signature)
+        except (AttributeError, KeyError, ValueError) as err:
             raise errors.ProcessingError(f"Cannot serialize flowsheet: {err}")
+        # The serialized value is shared with the cache, and the "cells"
+        # are modified by the diff
+        obj_dict = dict(obj_dict, cells=copy.deepcopy(obj_dict["cells"]))
         # Compare saved and current value
         diff = FlowsheetDiff(saved, obj_dict)
         _log.debug(f"diff: {diff}")
         if not diff:
             # If no difference do nothing
             _log.debug("Stored flowsheet is the same as the flowsheet in memory")
-            merged = saved
         else:
             # Otherwise, save this merged value before returning it
             num, pl = len(diff), "s" if len(diff) > 1 else ""
             _log.debug(f"Stored flowsheet and model in memory differ by {num} item{pl}")
             self.save_flowsheet(id_, diff.merged())
-        # Return [a copy of the] merged value
-        return diff.merged(do_copy=True)
-
-    # === Internal methods ===
+            store_stamp = self._dsm.stamp(id_)
+        cached.update(obj, signature, store_stamp, diff.merged())
+        return cached
 
     def _load_flowsheet(self, id_) -> Union[Dict, str]:
         return self._dsm.load(id_)
@@ -216,10 +306,12 @@ class FlowsheetServer(http.server.HTTPServer):
         """Get a flowsheet with the given ID."""
         return self._flowsheets[id_]
 
-    @staticmethod
-    def _serialize_flowsheet(id_, flowsheet):
+    def _serialize_flowsheet(self, id_, flowsheet, signature=None):
+        cached = self._cached.setdefault(id_, _CachedFlowsheet())
         try:
-            result = FlowsheetSerializer(flowsheet, id_).as_dict()
+            result = cached.serializer_cache.serialize(
+                flowsheet, id_, signature=signature
+            )
         except (AttributeError, KeyError) as err:
             raise ValueError(f"Error serializing flowsheet: {err}")
         return result
@@ -295,6 +387,10 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
     def _get_fs(self, id_: str):
         """Get updated flowsheet.
 
+        The response has an ETag header. If the request has an If-None-Match
+        header with the same value, the flowsheet did not change and the
+        response is "304 Not Modified", without a body.
+
         Args:
             id_: Flowsheet identifier
 
@@ -302,7 +398,7 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             None
         """
         try:
-            merged = self.server.update_flowsheet(id_)
+            value, etag = self.server.flowsheet_json(id_)
         except errors.FlowsheetUnknown as err:
             # User error: user asked for a flowsheet by an unknown ID
             self.send_error(404, message=str(err))
@@ -311,8 +407,13 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
             # Internal error: flowsheet ID is found, but other things are missing
             self.send_error(500, message=str(err))
             return
+        if self._etag_matches(etag):
+            self.send_response(304)
+            self._send_cache_headers(etag)
+            self.end_headers()
+            return
         # Return merged flowsheet
-        self._write_json(200, merged)
+        self._write_json(200, value, etag=etag)
 
     def _get_setting(self, setting_key_: str):
         """Get setting value.
@@ -366,15 +467,32 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(value)
 
-    def _write_json(self, code, data):
-        str_json = json.dumps(data)
-        value = utf8_encode(str_json)
+    def _write_json(self, code, data, etag=None):
+        if isinstance(data, bytes):
+            value = data  # already encoded
+        else:
+            value = utf8_encode(json.dumps(data))
         self.send_response(code)
         self.send_header("Content-type", "application/json")
         self.send_header("Content-length", str(len(value)))
+        if etag is not None:
+            self._send_cache_headers(etag)
         self.end_headers()
         self.wfile.write(value)
 
+    def _send_cache_headers(self, etag):
+        self.send_header("ETag", etag)
+        # the flowsheet can change at any time, so always revalidate
+        self.send_header("Cache-Control", "no-cache")
+
+    def _etag_matches(self, etag) -> bool:
+        header = self.headers.get("If-None-Match", None)
+        if header is None:
+            return False
+        tags = [t.strip() for t in header.split(",")]
+        # weak comparison, as required for If-None-Match (RFC 7232)
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
     def _write_html(self, code, page):
         value = utf8_encode(page)
         self.send_response(code)
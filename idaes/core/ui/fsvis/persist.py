@@ -19,6 +19,7 @@ Currently implemented methods are trivial storage in memory and storage to a fil
 from abc import ABC, abstractmethod
 import json
 from pathlib import Path
+import time
 from typing import Dict, Union
 
 # package
@@ -27,6 +28,10 @@ from . import errors
 
 _log = logger.getLogger(__name__)
 
+# Files modified less than this many nanoseconds ago may be modified again
+# without a change of their modification time
+_RACY_NS = 1_000_000_000
+
 
 class DataStore(ABC):
     @abstractmethod
@@ -47,6 +52,17 @@ class DataStore(ABC):
         """
         pass
 
+    def stamp(self):
+        """Get a value that changes whenever the stored data changes.
+
+        This is used to avoid loading the data again when it is unchanged.
+
+        Returns:
+            A value that can be compared to a previous stamp, or None if
+            it is not known whether the data changed (the default)
+        """
+        return None
+
     @classmethod
     def create(cls, dest=None) -> "DataStore":
         """Factory method to create and return the appropriate DataStore subclass
@@ -134,6 +150,21 @@ class FileDataStore(DataStore):
             raise ValueError(f"File '{self._p}' not found")
         return data
 
+    def stamp(self):
+        """Stamp from the modification time, size, and inode of the file.
+
+        Returns:
+            Stamp, or None if the file does not exist or was modified too
+            recently to tell whether it is being modified again
+        """
+        try:
+            st = self._p.stat()
+        except OSError:
+            return None
+        if time.time_ns() - st.st_mtime_ns < _RACY_NS:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
     def __str__(self):
         return f"file '{self._p}'"
 
@@ -145,6 +176,7 @@ class FileDataStore(DataStore):
 class MemoryDataStore(DataStore):
     def __init__(self):
         self._data = None
+        self._version = 0
 
     def save(self, data: Union[str, Dict]):
         """Store data in memory.
@@ -169,12 +201,17 @@ class MemoryDataStore(DataStore):
             self._data = data
         else:
             self._data = _parse_json(data)
+        self._version += 1
 
     def load(self) -> Dict:
         if self._data is None:
             raise ValueError("Data is empty")
         return self._data
 
+    def stamp(self):
+        """Number of times the data was saved."""
+        return self._version
+
     def __str__(self):
         return "__MEMORY__"
 
@@ -254,6 +291,20 @@ class DataStoreManager:
         _log.debug(f"Flowsheet '{id_}' loaded")
         return value
 
+    def stamp(self, id_: str):
+        """Get the stamp of the stored flowsheet with a given identifier.
+
+        Args:
+            id_: Flowsheet identifier
+
+        Returns:
+            Stamp (see :meth:`DataStore.stamp`)
+
+        Raises:
+            KeyError if the flowsheet is not found
+        """
+        return self._find(id_).stamp()
+
     def _find(self, id_: str):
         try:
             store = self._id_store[id_]
@@ -14,9 +14,15 @@
 Tests for model_server module
 """
 # stdlib
+import gc
+import json
+
 # ext
 import pytest
-from pyomo.environ import ConcreteModel
+from pyomo.common.timing import TicTocTimer
+import pyomo.common.unittest as unittest
+from pyomo.environ import ConcreteModel, TransformationFactory
+from pyomo.network import Arc
 
 # pkg
 from idaes.core.ui.fsvis import model_server, errors, persist
@@ -24,7 +30,9 @@ from idaes.core import FlowsheetBlock
 from idaes.models.properties.activity_coeff_models.BTX_activity_coeff_VLE import (
     BTXParameterBlock,
 )
-from idaes.models.unit_models import Flash
+from idaes.models.unit_models import Flash, Heater, Mixer
+from idaes.core.ui.flowsheet import FlowsheetDiff, FlowsheetSerializer
+from idaes.core.util.performance import PerformanceBaseClass
 
 
 @pytest.mark.unit
@@ -63,6 +71,49 @@ def test_update_flowsheet(flash_model):
         srv.update_flowsheet("oscar")
 
 
+class CountingDataStore(persist.MemoryDataStore):
+    def __init__(self):
+        super().__init__()
+        self.n_loads = 0
+
+    def load(self):
+        self.n_loads += 1
+        return super().load()
+
+
+@pytest.mark.unit
+def test_flowsheet_json_cached(flash_model):
+    srv = model_server.FlowsheetServer()
+    store = CountingDataStore()
+    fs = flash_model.fs
+    srv.add_flowsheet("oscar", fs, store)
+    value, etag = srv.flowsheet_json("oscar")
+    assert value == json.dumps(srv.update_flowsheet("oscar")).encode("utf-8")
+    n_loads = store.n_loads
+    # unchanged: the datastore is not loaded again
+    assert srv.flowsheet_json("oscar") == (value, etag)
+    assert store.n_loads == n_loads
+
+    # change the model: the new values are returned, and saved
+    flow = fs.flash.inlet.flow_mol[0].value
+    fs.flash.inlet.flow_mol.fix(2)
+    try:
+        value2, etag2 = srv.flowsheet_json("oscar")
+    finally:
+        fs.flash.inlet.flow_mol.fix(flow)
+    assert etag2 != etag
+    assert value2 == json.dumps(store.load()).encode("utf-8")
+    assert json.loads(value2)["model"] != json.loads(value)["model"]
+
+    # change the layout, e.g. from the UI
+    saved = srv.update_flowsheet("oscar")
+    saved["cells"][0]["position"] = {"x": 123, "y": 456}
+    srv.save_flowsheet("oscar", json.dumps(saved))
+    value3, etag3 = srv.flowsheet_json("oscar")
+    assert etag3 not in (etag, etag2)
+    assert json.loads(value3)["cells"][0]["position"] == {"x": 123, "y": 456}
+
+
 @pytest.fixture(scope="module")
 def flash_model():
     """Flash unit model. Use '.fs' attribute to get the flowsheet."""
@@ -105,6 +156,22 @@ def test_flowsheet_server_run(flash_model):
     # now /fs should work
     resp = requests.get(f"http://localhost:{srv.port}/fs?id=oscar")
     assert resp.ok
+    # unchanged flowsheet
+    etag = resp.headers["ETag"]
+    for if_none_match in (etag, f"W/{etag}", f'"bogus", {etag}', "*"):
+        resp = requests.get(
+            f"http://localhost:{srv.port}/fs?id=oscar",
+            headers={"If-None-Match": if_none_match},
+        )
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert not resp.content
+    resp = requests.get(
+        f"http://localhost:{srv.port}/fs?id=oscar",
+        headers={"If-None-Match": '"bogus"'},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] == etag
     print("Bogus PUT")
     resp = requests.put(f"http://localhost:{srv.port}/fs")
     assert not resp.ok
@@ -126,3 +193,70 @@ def test_flowsheet_server_run(flash_model):
     )
     assert resp.ok
     assert resp.json()["setting_value"] == 5000
+
+
+@pytest.mark.performance
+class TestUpdateFlowsheetPerformance(PerformanceBaseClass, unittest.TestCase):
+    """
+    Record the time to answer repeated requests for a flowsheet by serializing
+    and diffing it every time, and with the cached serialization when the
+    flowsheet is unchanged or one unit has changed.
+    """
+
+    n_heaters = 20
+    n_requests = 5
+
+    def build_model(self):
+        m = ConcreteModel()
+        m.fs = FlowsheetBlock(dynamic=False)
+        m.fs.BT_props = BTXParameterBlock()
+        m.fs.M01 = Mixer(property_package=m.fs.BT_props)
+        prev = m.fs.M01
+        for i in range(self.n_heaters):
+            unit = Heater(property_package=m.fs.BT_props)
+            m.fs.add_component(f"H{i}", unit)
+            m.fs.add_component(f"s{i}", Arc(source=prev.outlet, destination=unit.inlet))
+            prev = unit
+        TransformationFactory("network.expand_arcs").apply_to(m.fs)
+        return m
+
+    @pytest.mark.performance
+    def test_performance(self):
+        m = self.build_model()
+        srv = model_server.FlowsheetServer()
+        srv.add_flowsheet("bench", m.fs, persist.MemoryDataStore())
+        n_requests = self.n_requests
+
+        def update_without_cache():
+            saved = srv._load_flowsheet("bench")
+            new = FlowsheetSerializer(m.fs, "bench").as_dict()
+            return json.dumps(FlowsheetDiff(saved, new).merged())
+
+        gc.collect()
+        timer = TicTocTimer()
+        for _ in range(n_requests):
+            update_without_cache()
+        self.recordData(
+            "serialize and diff",
+            timer.toc(f"serialize and diff: {n_requests} requests"),
+        )
+        gc.collect()
+        timer.tic(None)
+        for _ in range(n_requests):
+            srv.flowsheet_json("bench")
+        self.recordData(
+            "unchanged flowsheet",
+            timer.toc(f"unchanged flowsheet: {n_requests} requests"),
+        )
+        gc.collect()
+        timer.tic(None)
+        for i in range(n_requests):
+            m.fs.H0.heat_duty.fix(i + 1)
+            srv.flowsheet_json("bench")
+        self.recordData(
+            "one unit changed", timer.toc(f"one unit changed: {n_requests} requests")
+        )
+
+        assert json.loads(srv.flowsheet_json("bench")[0]) == json.loads(
+            update_without_cache()
+        )
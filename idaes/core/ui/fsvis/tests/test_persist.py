@@ -82,6 +82,36 @@ def test_datastoremanager_save_load(tmp_path):
     _save_and_load_data_dsm("bar", dsm)
 
 
+@pytest.mark.unit
+def test_data_store_stamp(tmp_path, monkeypatch):
+    mstore = persist.MemoryDataStore()
+    stamp = mstore.stamp()
+    with pytest.raises(errors.DatastoreError):
+        mstore.save(bad_data)
+    assert mstore.stamp() == stamp
+    mstore.save(data)
+    assert mstore.stamp() != stamp
+
+    p = tmp_path / "test.json"
+    fstore = persist.FileDataStore(p)
+    assert fstore.stamp() is None  # no file
+    fstore.save(data)
+    assert fstore.stamp() is None  # file was just modified
+    # files are no longer being modified after a while
+    monkeypatch.setattr(persist, "_RACY_NS", 0)
+    stamp = fstore.stamp()
+    assert stamp is not None
+    assert fstore.stamp() == stamp
+    fstore.save({"foo": "a different value"})
+    assert fstore.stamp() != stamp
+
+    dsm = persist.DataStoreManager()
+    dsm.add("bar", mstore)
+    assert dsm.stamp("bar") == mstore.stamp()
+    with pytest.raises(KeyError):
+        dsm.stamp("foo")
+
+
 # === Functions ===
 
 
@@ -20,6 +20,8 @@ import pytest
 from idaes.core.ui.flowsheet import (
     FlowsheetSerializer,
     FlowsheetDiff,
+    SerializerCache,
+    flowsheet_signature,
     validate_flowsheet,
 )
 from idaes.models.properties.swco2 import SWCO2ParameterBlock
@@ -331,6 +333,51 @@ def test_flowsheet_serializer_flash(flash_flowsheet, flash_flowsheet_json):
         pytest.fail("Serialized flowsheet does not match expected")
 
 
+def _mixer_heater_flash():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.BT_props = BTXParameterBlock()
+    m.fs.M01 = Mixer(property_package=m.fs.BT_props)
+    m.fs.H02 = Heater(property_package=m.fs.BT_props)
+    m.fs.F03 = Flash(property_package=m.fs.BT_props)
+    m.fs.s01 = Arc(source=m.fs.M01.outlet, destination=m.fs.H02.inlet)
+    m.fs.s02 = Arc(source=m.fs.H02.outlet, destination=m.fs.F03.inlet)
+    TransformationFactory("network.expand_arcs").apply_to(m.fs)
+    return m.fs
+
+
+@pytest.mark.unit
+def test_serializer_cache():
+    fs = _mixer_heater_flash()
+    cache = SerializerCache()
+    test_dict = cache.serialize(fs, "demo")
+    assert test_dict == FlowsheetSerializer(fs, "demo").as_dict()
+    assert set(cache.units) == {"M01", "H02", "F03"}
+    # nothing changed
+    assert cache.serialize(fs, "demo") is test_dict
+    assert flowsheet_signature(fs) == cache.signature
+
+    # change values in one unit
+    fs.H02.heat_duty.fix(100)
+    fs.H02.control_volume.properties_out[0].temperature.set_value(360)
+    assert flowsheet_signature(fs) != cache.signature
+    new_dict = cache.serialize(fs, "demo")
+    assert new_dict is not test_dict
+    assert new_dict == FlowsheetSerializer(fs, "demo").as_dict()
+    units, new_units = (d["model"]["unit_models"] for d in (test_dict, new_dict))
+    for name in "M01", "F03":
+        # reused
+        contents = units[name]["performance_contents"]
+        assert new_units[name]["performance_contents"] is contents
+    assert new_units["H02"] != units["H02"]
+
+    # change the structure
+    fs.s03 = Arc(source=fs.F03.vap_outlet, destination=fs.M01.inlet_1)
+    new_dict = cache.serialize(fs, "demo")
+    assert "s03" in new_dict["model"]["arcs"]
+    assert new_dict == FlowsheetSerializer(fs, "demo").as_dict()
+
+
 def report_failure(test_dict, stored_dict):
     test_json, stored_json = (json.dumps(d, indent=2) for d in (test_dict, stored_dict))
     diff = dict_diff(test_dict, stored_dict)
@@ -10,5 +10,12 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
-from .model_serializer import to_json, from_json, StoreSpec
+from .model_serializer import (
+    to_json,
+    from_json,
+    to_npz,
+    from_npz,
+    StoreSpec,
+    StateLoader,
+)
 from .tags import svg_tag, ModelTag, ModelTagGroup
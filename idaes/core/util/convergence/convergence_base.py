@@ -63,19 +63,21 @@ import getpass
 import importlib as il
 import json
 import logging
+import multiprocessing
 import numpy as np
+import os
 import sys
 from io import StringIO
 
 # pyomo
-from pyomo.common.tempfiles import TempfileManager
 from pyomo.common.tee import capture_output
 from pyomo.core import Param, Var
-from pyomo.opt import TerminationCondition
 from pyomo.common.log import LoggingIntercept
 
 # idaes
 import idaes.core.util.convergence.mpi_utils as mpiu
+from idaes.core.solvers.ipopt_stats import ipopt_solve_with_stats
+from idaes.core.util.model_serializer import StateLoader
 from idaes.core.dmf import resource
 import idaes.logger as idaeslog
 
@@ -247,38 +249,8 @@ def _run_ipopt_with_stats(model, solver, max_iter=500, max_cpu_time=120):
        Returns a tuple with (solve status object, bool (solve successful or
        not), number of iters, solve time)
     """
-    # ToDo: Check that the "solver" is, in fact, IPOPT
-
-    TempfileManager.push()
-    tempfile = TempfileManager.create_tempfile(suffix="ipopt_out", text=True)
-    opts = {"output_file": tempfile, "max_iter": max_iter, "max_cpu_time": max_cpu_time}
-
-    status_obj = solver.solve(model, options=opts, tee=True)
-    solved = True
-    if status_obj.solver.termination_condition != TerminationCondition.optimal:
-        solved = False
-
-    iters = 0
-    time = 0
-    # parse the output file to get the iteration count, solver times, etc.
-    with open(tempfile, "r") as f:
-        for line in f:
-            if line.startswith("Number of Iterations....:"):
-                tokens = line.split()
-                iters = int(tokens[3])
-            elif line.startswith(
-                "Total CPU secs in IPOPT (w/o function evaluations)   ="
-            ):
-                tokens = line.split()
-                time += float(tokens[9])
-            elif line.startswith(
-                "Total CPU secs in NLP function evaluations           ="
-            ):
-                tokens = line.split()
-                time += float(tokens[8])
-
-    TempfileManager.pop(remove=True)
-    return status_obj, solved, iters, time
+    stats = ipopt_solve_with_stats(model, solver, max_iter, max_cpu_time)
+    return stats.results, stats.solved, stats.iterations, stats.time
 
 
 def _progress_bar(fraction, msg, length=20):
@@ -410,7 +382,12 @@ def write_sample_file(
         json.dump(jsondict, fd, indent=3)
 
 
-def run_convergence_evaluation_from_sample_file(sample_file):
+def run_convergence_evaluation_from_sample_file(sample_file, **kwargs):
+    """
+    Load a sample file and run the convergence evaluation. Additional keyword
+    arguments (schedule, n_workers, reuse_model, result_callback) are passed
+    to run_convergence_evaluation.
+    """
     # load the sample file
     try:
         with open(sample_file, "r") as fd:
@@ -430,7 +407,7 @@ def run_convergence_evaluation_from_sample_file(sample_file):
             f"Invalid value specified for convergence_evaluation_class_str:"
             "{convergence_evaluation_class_str} in sample file: {sample_file}"
         )
-    return run_convergence_evaluation(jsondict, conv_eval)
+    return run_convergence_evaluation(jsondict, conv_eval, **kwargs)
 
 
 def run_single_sample_from_sample_file(sample_file, name):
@@ -465,11 +442,201 @@ def run_single_sample(sample_file_dict, conv_eval, name):
     return _run_ipopt_with_stats(model, solver)
 
 
-def run_convergence_evaluation(sample_file_dict, conv_eval):
+class _SampleEvaluator(object):
+    """
+    Callable that runs the convergence evaluation for one sample point and
+    returns its results dictionary. Each worker process creates one
+    evaluator. If reuse_model is True, the worker builds and initializes a
+    single model with get_initialized_model, stores its initialized state in
+    a StateLoader and loads that state back into the model before each
+    subsequent sample, instead of building a new model for every sample.
+    """
+
+    def __init__(self, conv_eval, inputs, reuse_model=False):
+        self.conv_eval = conv_eval
+        self.inputs = inputs
+        self.reuse_model = reuse_model
+        self._model = None
+        self._initial_state = None
+        self._solver = None
+
+    def _get_model_and_solver(self):
+        if not self.reuse_model:
+            return self.conv_eval.get_initialized_model(), self.conv_eval.get_solver()
+        if self._model is None:
+            self._model = self.conv_eval.get_initialized_model()
+            self._initial_state = StateLoader(self._model)
+            self._solver = self.conv_eval.get_solver()
+        else:
+            self._initial_state.load(self._model)
+        return self._model, self._solver
+
+    def __call__(self, sample_point):
+        sample_name = sample_point["_name"]
+        # capture the output
+        # ToDo: make this an option and turn off for single sample execution
+        output_buffer = StringIO()
+        with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
+            with capture_output():  # as str_out:
+                model, solver = self._get_model_and_solver()
+                _set_model_parameters_from_sample(model, self.inputs, sample_point)
+                (status_obj, solved, iters, time) = _run_ipopt_with_stats(model, solver)
+
+        if not solved:
+            _log.error(f"Sample: {sample_name} failed to converge.")
+
+        results_dict = OrderedDict()
+        results_dict["name"] = sample_name
+        results_dict["sample_point"] = sample_point
+        results_dict["solved"] = solved
+        results_dict["iters"] = iters
+        results_dict["time"] = time
+        return results_dict
+
+
+# Evaluator of the current process when running with a multiprocessing pool
+_pool_evaluator = None
+
+
+def _init_pool_worker(conv_eval, inputs, reuse_model):
+    global _pool_evaluator
+    _pool_evaluator = _SampleEvaluator(conv_eval, inputs, reuse_model=reuse_model)
+
+
+def _run_pool_task(task):
+    i, sample_point = task
+    return i, _pool_evaluator(sample_point)
+
+
+# MPI message tags for the dynamic master/worker scheduler
+_TASK_TAG = 1
+_RESULT_TAG = 2
+
+
+def _run_mpi_master(comm, samples_list, on_result):
+    """
+    Hand out samples to the worker ranks one at a time as they become idle,
+    and collect their results. Returns the list of results in sample order.
+    """
+    status = mpiu.MPI.Status()
+    n_workers = comm.Get_size() - 1
+    results = [None] * len(samples_list)
+    error = None
+    next_task = 0
+    while n_workers > 0:
+        msg = comm.recv(source=mpiu.MPI.ANY_SOURCE, tag=_RESULT_TAG, status=status)
+        worker = status.Get_source()
+        if msg is not None:
+            i, results_dict, exc = msg
+            if exc is not None:
+                # stop handing out samples and raise once all workers stopped
+                error = error or exc
+            else:
+                results[i] = results_dict
+                on_result(results_dict)
+        if error is None and next_task < len(samples_list):
+            comm.send((next_task, samples_list[next_task]), dest=worker, tag=_TASK_TAG)
+            next_task += 1
+        else:
+            comm.send(None, dest=worker, tag=_TASK_TAG)
+            n_workers -= 1
+    if error is not None:
+        raise error
+    return results
+
+
+def _run_mpi_worker(comm, evaluator):
+    """
+    Request samples from the master rank and send back the results until the
+    master signals that there are no samples left.
+    """
+    comm.send(None, dest=0, tag=_RESULT_TAG)
+    while True:
+        task = comm.recv(source=0, tag=_TASK_TAG)
+        if task is None:
+            return
+        i, sample_point = task
+        try:
+            msg = (i, evaluator(sample_point), None)
+        except Exception as exc:
+            msg = (i, None, exc)
+        comm.send(msg, dest=0, tag=_RESULT_TAG)
+
+
+def _run_static(samples_list, evaluator, on_result):
+    task_mgr = mpiu.ParallelTaskManager(len(samples_list))
+    local_samples_list = task_mgr.global_to_local_data(samples_list)
+
+    results = list()
+    for (si, ss) in enumerate(local_samples_list):
+        # print progress on the rank-0 process
+        if task_mgr.is_root():
+            _progress_bar(
+                float(si) / float(len(local_samples_list)),
+                "Root Process: {}".format(ss["_name"]),
+            )
+        results_dict = evaluator(ss)
+        on_result(results_dict)
+        results.append(results_dict)
+
+    return task_mgr.gather_global_data(results)
+
+
+def _run_dynamic(samples_list, evaluator, on_result, n_workers):
+    mpi_interface = mpiu.MPIInterface()
+    if mpi_interface.have_mpi and mpi_interface.size > 1:
+        comm = mpi_interface.comm
+        if mpi_interface.rank == 0:
+            return _run_mpi_master(comm, samples_list, on_result)
+        _run_mpi_worker(comm, evaluator)
+        return None
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(samples_list))
+    if n_workers <= 1:
+        results = list()
+        for ss in samples_list:
+            results_dict = evaluator(ss)
+            on_result(results_dict)
+            results.append(results_dict)
+        return results
+
+    results = [None] * len(samples_list)
+    with multiprocessing.Pool(
+        n_workers,
+        initializer=_init_pool_worker,
+        initargs=(evaluator.conv_eval, evaluator.inputs, evaluator.reuse_model),
+    ) as pool:
+        # chunksize of one so samples are handed out as workers become idle
+        for i, results_dict in pool.imap_unordered(
+            _run_pool_task, enumerate(samples_list), chunksize=1
+        ):
+            results[i] = results_dict
+            on_result(results_dict)
+    return results
+
+
+def run_convergence_evaluation(
+    sample_file_dict,
+    conv_eval,
+    schedule="static",
+    n_workers=None,
+    reuse_model=False,
+    result_callback=None,
+):
     """
     Run convergence evaluation and generate the statistics based on information
     in the sample_file.
 
+    With the static schedule (the default), the samples are split evenly
+    across the MPI processes (if any) up front. With the dynamic schedule,
+    samples are handed out one at a time to idle workers, which balances the
+    load when solve times vary widely between samples. When running under MPI
+    with more than one process, rank 0 acts as the master and the other ranks
+    solve the samples; otherwise the samples are solved by a local pool of
+    n_workers processes.
+
     Parameters
     ----------
     sample_file_dict : dict
@@ -479,10 +646,35 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
     conv_eval : ConvergenceEvaluation
         The ConvergenceEvaluation object that should be used
 
+    schedule : str
+        How samples are assigned to processes, "static" or "dynamic"
+
+    n_workers : int
+        Number of local worker processes for the dynamic schedule without
+        MPI. If None (default), use the number of CPUs.
+
+    reuse_model : bool
+        If True, each process builds and initializes one model and resets it
+        to the initialized state before each sample, instead of calling
+        get_initialized_model for every sample. Only the variable values,
+        bounds and fixed flags, mutable parameter values and active flags are
+        reset, so this should only be used with models whose initialized
+        state is fully described by these.
+
+    result_callback : callable
+        Optional function called with the results dictionary of each sample
+        as soon as it is solved (on the root process for the dynamic schedule,
+        on each process for the static schedule).
+
     Returns
     -------
-       N/A
+       Tuple of the inputs, the samples and the list of results dictionaries
+       in sample order (None for the results on non-root MPI processes)
     """
+    if schedule not in ("static", "dynamic"):
+        raise ValueError(
+            f"Unknown schedule {schedule}, expected 'static' or 'dynamic'."
+        )
     inputs = sample_file_dict["inputs"]
     samples = sample_file_dict["samples"]
 
@@ -494,43 +686,25 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
     for k, v in samples.items():
         v["_name"] = k
         samples_list.append(v)
-    n_samples = len(samples_list)
 
-    task_mgr = mpiu.ParallelTaskManager(n_samples)
-    local_samples_list = task_mgr.global_to_local_data(samples_list)
+    evaluator = _SampleEvaluator(conv_eval, inputs, reuse_model=reuse_model)
+    if schedule == "static":
+        global_results = _run_static(
+            samples_list, evaluator, result_callback or (lambda r: None)
+        )
+    else:
+        n_done = [0]
 
-    results = list()
-    for (si, ss) in enumerate(local_samples_list):
-        sample_name = ss["_name"]
-        # print progress on the rank-0 process
-        if task_mgr.is_root():
+        def on_result(results_dict):
+            n_done[0] += 1
             _progress_bar(
-                float(si) / float(len(local_samples_list)),
-                "Root Process: {}".format(sample_name),
+                float(n_done[0]) / float(len(samples_list)),
+                "Completed: {}".format(results_dict["name"]),
             )
+            if result_callback is not None:
+                result_callback(results_dict)
 
-        # capture the output
-        # ToDo: make this an option and turn off for single sample execution
-        output_buffer = StringIO()
-        with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
-            with capture_output():  # as str_out:
-                model = conv_eval.get_initialized_model()
-                _set_model_parameters_from_sample(model, inputs, ss)
-                solver = conv_eval.get_solver()
-                (status_obj, solved, iters, time) = _run_ipopt_with_stats(model, solver)
-
-        if not solved:
-            _log.error(f"Sample: {sample_name} failed to converge.")
-
-        results_dict = OrderedDict()
-        results_dict["name"] = sample_name
-        results_dict["sample_point"] = ss
-        results_dict["solved"] = solved
-        results_dict["iters"] = iters
-        results_dict["time"] = time
-        results.append(results_dict)
-
-    global_results = task_mgr.gather_global_data(results)
+        global_results = _run_dynamic(samples_list, evaluator, on_result, n_workers)
     return inputs, samples, global_results
 
 
@@ -16,6 +16,7 @@ Test classes for the convergence evaluation testing module
 Author: Carl Laird
 """
 import pyomo.environ as pe
+from pyomo.opt import SolverResults, TerminationCondition
 import idaes.core.util.convergence.convergence_base as cb
 
 
@@ -101,3 +102,31 @@ class ConvEvalUnfixedVarMutableParam(ConvEvalFixedVarMutableParam):
 
         # return the initialized model
         return m
+
+
+class StubIpoptSolver(object):
+    """
+    Stands in for the Ipopt executable without solving anything. It reports
+    one iteration if the model is in its initialized state (zero otherwise)
+    and the value of var_a as the solve time, then moves the model away from
+    the initialized state. It is defined at module level so that worker
+    processes started with spawn can unpickle it.
+    """
+
+    def solve(self, model, options=None, tee=False, **kwargs):
+        iters = 1 if pe.value(model.x) == 2.0 and pe.value(model.y) == 2.0 else 0
+        model.x.value = 7.0
+        model.y.fix(3.0)
+        print(f"Number of Iterations....: {iters}")
+        print(f"Total seconds in IPOPT = {pe.value(model.var_a)!r}")
+        results = SolverResults()
+        results.solver.termination_condition = TerminationCondition.optimal
+        return results
+
+
+class ConvEvalStubSolver(ConvEvalFixedVarMutableParam):
+    def __init__(self):
+        super(ConvEvalStubSolver, self).__init__()
+
+    def get_solver(self):
+        return StubIpoptSolver()
@@ -15,6 +15,7 @@ Tests for the convergence testing module
 
 Author: Carl Laird
 """
+from collections import OrderedDict
 import io
 import json
 import pytest
@@ -24,6 +25,7 @@ import pyomo.environ as pe
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.unittest import assertStructuredAlmostEqual
 import idaes.core.util.convergence.convergence_base as cb
+import idaes.core.util.convergence.tests.conv_eval_classes as cev
 import idaes
 
 # See if ipopt is available and set up solver
@@ -261,6 +263,100 @@ def test_convergence_evaluation_fixedvar_mutableparam():
     #     os.remove(results_fname)
 
 
+class CountingConvEval(cev.ConvEvalStubSolver):
+    """Counts the models built, to check that the model is reused"""
+
+    n_models = 0
+
+    def get_initialized_model(self):
+        CountingConvEval.n_models += 1
+        return super().get_initialized_model()
+
+
+@pytest.fixture
+def sample_file_dict():
+    spec = cev.ConvEvalFixedVarMutableParam().get_specification()
+    fname = os.path.join(wrtdir, "ceval_fixedvar_mutableparam.5.43.json")
+    cb.write_sample_file(
+        spec, fname, ceval_fixedvar_mutableparam_str, n_points=5, seed=43
+    )
+    with open(fname) as f:
+        d = json.load(f, object_pairs_hook=OrderedDict)
+    os.remove(fname)
+    return d
+
+
+@pytest.mark.unit
+def test_convergence_evaluation_invalid_schedule(sample_file_dict):
+    with pytest.raises(ValueError, match="Unknown schedule"):
+        cb.run_convergence_evaluation(
+            sample_file_dict, cev.ConvEvalFixedVarMutableParam(), schedule="random"
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("schedule", ["static", "dynamic"])
+@pytest.mark.parametrize("reuse_model", [False, True])
+def test_convergence_evaluation_reuse_model(sample_file_dict, schedule, reuse_model):
+    CountingConvEval.n_models = 0
+    streamed = []
+    inputs, samples, results = cb.run_convergence_evaluation(
+        sample_file_dict,
+        CountingConvEval(),
+        schedule=schedule,
+        n_workers=1,
+        reuse_model=reuse_model,
+        result_callback=streamed.append,
+    )
+
+    assert CountingConvEval.n_models == (1 if reuse_model else 5)
+    assert [r["name"] for r in results] == [f"Sample-{i}" for i in range(1, 6)]
+    assert streamed == results
+    for r in results:
+        # each sample starts from the initialized state with the sampled input
+        assert r["iters"] == 1
+        assert r["time"] == pytest.approx(samples[r["name"]]["var_a"])
+
+
+@pytest.mark.unit
+def test_convergence_evaluation_dynamic_pool(sample_file_dict):
+    # the stub solver is picklable, so it also reaches workers started with
+    # spawn (the default on Windows and macOS)
+    streamed = []
+    inputs, samples, results = cb.run_convergence_evaluation(
+        sample_file_dict,
+        cev.ConvEvalStubSolver(),
+        schedule="dynamic",
+        n_workers=2,
+        reuse_model=True,
+        result_callback=streamed.append,
+    )
+
+    # results are streamed in the order they finish, but returned in sample
+    # order
+    assert [r["name"] for r in results] == [f"Sample-{i}" for i in range(1, 6)]
+    assert sorted(r["name"] for r in streamed) == [r["name"] for r in results]
+    for r in results:
+        assert r["iters"] == 1
+        assert r["time"] == pytest.approx(samples[r["name"]]["var_a"])
+
+
+@pytest.mark.skipif(not ipopt_available, reason="Ipopt solver not available")
+@pytest.mark.component
+def test_convergence_evaluation_dynamic_schedule(sample_file_dict):
+    conv_eval = cev.ConvEvalFixedVarMutableParam()
+    _, _, static_results = cb.run_convergence_evaluation(
+        sample_file_dict, conv_eval, schedule="static"
+    )
+    _, _, dynamic_results = cb.run_convergence_evaluation(
+        sample_file_dict, conv_eval, schedule="dynamic", n_workers=2, reuse_model=True
+    )
+    for r_static, r_dynamic in zip(static_results, dynamic_results):
+        assert r_static["name"] == r_dynamic["name"]
+        assert r_dynamic["solved"]
+        assert r_static["iters"] == r_dynamic["iters"]
+
+
 if __name__ == "__main__":
     # test_convergence_evaluation_specification_file_fixedvar_mutableparam()
     # test_convergence_evaluation_specification_file_unfixedvar_mutableparam()
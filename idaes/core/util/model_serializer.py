@@ -18,17 +18,22 @@ from pyomo.environ import *
 from pyomo.network import Port, Arc
 from pyomo.dae import *
 from pyomo.core.base.component import ComponentData
+from pyomo.core.base.component_namer import index_repr, name_repr
 import json
 import datetime
 import time
 import gzip
+import hashlib
 import logging
 
+import numpy as np
+
 _log = logging.getLogger(__name__)
 
 # Some more inforation about this module
 __author__ = "John Eslick"
 __format_version__ = 4
+__columnar_format_version__ = 1
 
 
 def _can_serialize(o):
@@ -996,3 +1001,557 @@ def from_json(o, sd=None, fname=None, s=None, wts=None, gz=None, root_name=None)
     pdict["etime_read_dict"] = read_time - dict_time
     pdict["etime_read_suffixes"] = suffix_time - read_time
     return pdict
+
+
+# Columns stored in a columnar snapshot.  Each group holds one kind of
+# component data, and each column is a contiguous array with one entry per
+# component in the group's name index.
+_columnar_groups = {
+    "var": ("value", "lb", "ub", "fixed"),
+    "param": ("value",),
+    "constraint": ("active",),
+    "block": ("active",),
+}
+
+
+class _ColumnarIndex(object):
+    """
+    Stable index of the component data stored in a columnar snapshot.  The
+    components of each group are collected in one walk over the blocks of the
+    model, along with their names relative to the root component.  Reading and
+    writing a snapshot is then a gather or scatter over these lists.
+
+    Components are grouped by isinstance, as to_json() does, so subclasses such
+    as DerivativeVar are stored with the variables and the contents of
+    Disjuncts and other Block subclasses are included.
+
+    Args:
+        o: root Pyomo block (a model or block data object)
+        with_names: if False, skip generating the component names and digest.
+            The structure attribute can still be compared with that of another
+            index to check that the components are in the same positions.
+    """
+
+    # isinstance checks for each group, specific classes first
+    _group_classes = (
+        (Var, "var"),
+        (Param, "param"),
+        (Constraint, "constraint"),
+        (Block, "block"),
+    )
+
+    def __init__(self, o, with_names=True):
+        comps = {g: [] for g in _columnar_groups}
+        cnames = {g: [] for g in _columnar_groups}
+        # (group, local name, index keys or None if scalar) for each component,
+        # in order
+        structure = []
+        # block data objects visited, parents first
+        self.blocks = []
+        # blocks are visited depth first, parents before children, each with
+        # its name prefix so names are generated from the parent's without
+        # walking up the tree
+        stack = [(o, "")]
+        while stack:
+            bd, pre = stack.pop()
+            self.blocks.append(bd)
+            children = []
+            for c in bd.component_objects(descend_into=False):
+                g = self._group(c)
+                if g is None or c.is_reference():
+                    # references are indexed under the component they belong to
+                    continue
+                start = len(comps[g])
+                if c.is_indexed():
+                    comps[g].extend(c.values())
+                    keys = tuple(c.keys())
+                else:
+                    comps[g].append(c)
+                    keys = None
+                structure.append((g, c.local_name, keys))
+                if with_names:
+                    base = pre + name_repr(c.local_name)
+                    if c.is_indexed():
+                        cnames[g].extend(base + index_repr(idx) for idx in c.keys())
+                    else:
+                        cnames[g].append(base)
+                if g == "block":
+                    if with_names:
+                        children.extend(
+                            (el, name + ".")
+                            for el, name in zip(comps[g][start:], cnames[g][start:])
+                        )
+                    else:
+                        children.extend((el, "") for el in comps[g][start:])
+            stack.extend(reversed(children))
+        self.components = comps
+        self.structure = structure
+        if with_names:
+            self.names = {g: np.array(n, dtype=str) for g, n in cnames.items()}
+            self.digest = _names_digest(self.names)
+        else:
+            self.names = None
+            self.digest = None
+
+    @classmethod
+    def _group(cls, c):
+        """
+        Return the group of a component, or None if it is not stored.
+        """
+        for klass, g in cls._group_classes:
+            if isinstance(c, klass):
+                if g == "param" and not c.mutable:
+                    return None
+                return g
+        return None
+
+    def gather(self):
+        """
+        Collect the current model state into a dictionary of arrays.
+        """
+        var = self.components["var"]
+        return {
+            "var_value": np.array([v.value for v in var], dtype=float),
+            "var_lb": np.array([v.lb for v in var], dtype=float),
+            "var_ub": np.array([v.ub for v in var], dtype=float),
+            "var_fixed": np.array([v.fixed for v in var], dtype=bool),
+            "param_value": np.array(
+                [p.value for p in self.components["param"]], dtype=float
+            ),
+            "constraint_active": np.array(
+                [c.active for c in self.components["constraint"]], dtype=bool
+            ),
+            "block_active": np.array(
+                [b.active for b in self.components["block"]], dtype=bool
+            ),
+        }
+
+    def positions(self, group, names):
+        """
+        Match stored names to components in this index.
+
+        Args:
+            group: component group key
+            names: array of names stored in a snapshot
+
+        Returns:
+            None if the stored names are identical to the index, otherwise a
+            tuple of arrays (positions in index, positions in snapshot) for the
+            names found in both.  Names missing from either side are ignored.
+        """
+        if np.array_equal(self.names[group], names):
+            return None
+        lookup = {n: i for i, n in enumerate(self.names[group].tolist())}
+        pairs = [(lookup[n], j) for j, n in enumerate(names.tolist()) if n in lookup]
+        if not pairs:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        model_pos, stored_pos = zip(*pairs)
+        return np.array(model_pos, dtype=int), np.array(stored_pos, dtype=int)
+
+    def scatter(self, column, model_pos, values):
+        """
+        Set one column of the model state.
+
+        Args:
+            column: column key, e.g. "var_value"
+            model_pos: positions in the index to set, or None for all
+            values: array or list of values in the same order as model_pos
+
+        Returns:
+            None
+        """
+        group, attr = column.split("_", 1)
+        comps = self.components[group]
+        if model_pos is not None:
+            comps = [comps[i] for i in model_pos.tolist()]
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        if column == "var_value":
+            for v, x in zip(comps, values):
+                v.set_value(None if x != x else x, skip_validation=True)
+        elif column == "var_lb":
+            for v, x in zip(comps, values):
+                v.setlb(None if x != x else x)
+        elif column == "var_ub":
+            for v, x in zip(comps, values):
+                v.setub(None if x != x else x)
+        elif column == "var_fixed":
+            for v, x in zip(comps, values):
+                v.fixed = x
+        elif column == "param_value":
+            for p, x in zip(comps, values):
+                p.set_value(None if x != x else x)
+        else:  # active flags
+            for c, x in zip(comps, values):
+                if c.active != x:
+                    _set_active(c, x)
+
+
+def _names_digest(names):
+    """
+    Hash of the name index of a columnar snapshot, used to check that a delta
+    snapshot is applied to the same model structure it was taken from.
+    """
+    h = hashlib.sha1()
+    for g in _columnar_groups:
+        h.update(g.encode("utf-8"))
+        h.update("\n".join(names[g].tolist()).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _changed(new, old):
+    """
+    Return the positions where two columns differ, treating NaN as equal to NaN.
+    """
+    if new.dtype == bool:
+        return np.flatnonzero(new != old)
+    return np.flatnonzero(~((new == old) | (np.isnan(new) & np.isnan(old))))
+
+
+def _load_snapshot(sd=None, fname=None):
+    """
+    Get a columnar snapshot dictionary either from sd or by reading fname.
+    """
+    if sd is not None:
+        return sd
+    if fname is None:
+        raise Exception("Need to specify a data source to load from")
+    with np.load(fname, allow_pickle=False) as f:
+        return {k: f[k] for k in f.files}
+
+
+def to_npz(o, fname=None, reference=None, metadata=None, return_dict=False):
+    """
+    Save the state of a model as a columnar snapshot. Variable values, bounds
+    and fixed flags, mutable parameter values and constraint and block active
+    flags are stored in contiguous NumPy arrays along with a stable index of
+    component names relative to o. Compared to to_json(), this is much faster
+    and more compact for large models, but only stores the standard model
+    state (use to_json() with a StoreSpec for suffixes, BooleanVars or other
+    attributes). As with to_json(), components are grouped by type with
+    isinstance, so for example DerivativeVars are stored with the variables.
+
+    If a reference snapshot is given, a delta snapshot is created which only
+    stores the entries that differ from the reference. A delta snapshot can only
+    be loaded into a model with the same structure as the reference.
+
+    Args:
+        o: The Pyomo component object to save.  Usually a Pyomo model, but could
+            also be a subcomponent of a model (usually a sub-block).
+        fname: file name to save the snapshot to as a compressed npz file, if
+            None only create the snapshot dictionary
+        reference: full snapshot dictionary or npz file name to take the
+            difference from, if None (default) store the full state
+        metadata: A dictionary of additional metadata to add, must be json
+            serializable.
+        return_dict: default is False, if True return the snapshot dictionary
+
+    Returns:
+        If return_dict is True, returns a dictionary of NumPy arrays. If fname
+        is given the dictionary is also written to a compressed npz file.
+    """
+    if metadata is None:
+        metadata = {}
+    if reference is not None and not isinstance(reference, dict):
+        reference = _load_snapshot(fname=reference)
+    now = datetime.datetime.now()
+    index = _ColumnarIndex(o)
+    state = index.gather()
+    sd = {
+        "format_version": np.array(__columnar_format_version__),
+        "metadata": np.array(
+            json.dumps(
+                {
+                    "date": datetime.date.isoformat(now.date()),
+                    "time": datetime.time.isoformat(now.time()),
+                    "other": metadata,
+                }
+            )
+        ),
+        "digest": np.array(index.digest),
+    }
+    if reference is None:
+        sd["delta"] = np.array(False)
+        for g in _columnar_groups:
+            sd[f"{g}_names"] = index.names[g]
+        sd.update(state)
+    else:
+        if bool(reference["delta"]):
+            raise ValueError(
+                "The reference for a delta snapshot must be a full snapshot"
+            )
+        if str(reference["digest"]) != index.digest:
+            raise ValueError(
+                "The reference snapshot was taken from a model with a different "
+                "structure"
+            )
+        sd["delta"] = np.array(True)
+        for column, new in state.items():
+            changed = _changed(new, reference[column])
+            sd[f"{column}_index"] = changed
+            sd[column] = new[changed]
+    if fname is not None:
+        np.savez_compressed(fname, **sd)
+    if return_dict:
+        return sd
+    return None
+
+
+def from_npz(o, sd=None, fname=None, reference=None):
+    """
+    Load the state of a Pyomo component from a columnar snapshot created by
+    to_npz().  Must only specify one of sd or fname as a non-None value. When
+    the model has the same structure as the saved one, the state is restored by
+    scattering each array directly onto the model components; otherwise
+    components are matched by name, and entries missing from either the model
+    or the snapshot are ignored.
+
+    A delta snapshot only sets the entries that changed relative to its
+    reference. If a reference snapshot is given the reference is loaded first,
+    otherwise the delta is applied on top of the current model state. Either
+    way the model must have the same structure as the reference.
+
+    Args:
+        o: Pyomo component to for which to load state
+        sd: snapshot dictionary to load, if None, use fname
+        fname: npz file to load, only used if sd is None
+        reference: full snapshot dictionary or npz file name a delta snapshot
+            was taken against, ignored for full snapshots
+
+    Returns:
+        Dictionary with some perfomance information. The keys are
+        "etime_load_file", how long in seconds it took to load the npz file,
+        "etime_index", how long it took to index the model components and
+        "etime_read", how long it took to set the model state.
+    """
+    start_time = time.time()
+    sd = _load_snapshot(sd=sd, fname=fname)
+    if reference is not None and not isinstance(reference, dict):
+        reference = _load_snapshot(fname=reference)
+    load_time = time.time()
+    index = _ColumnarIndex(o)
+    index_time = time.time()
+    if bool(sd["delta"]):
+        if str(sd["digest"]) != index.digest:
+            raise ValueError(
+                "Delta snapshots can only be loaded into a model with the same "
+                "structure as the model they were taken from"
+            )
+        if reference is not None:
+            _scatter_snapshot(index, reference)
+        for g, columns in _columnar_groups.items():
+            for a in columns:
+                column = f"{g}_{a}"
+                index.scatter(column, sd[f"{column}_index"], sd[column])
+    else:
+        _scatter_snapshot(index, sd)
+    read_time = time.time()
+    return {
+        "etime_load_file": load_time - start_time,
+        "etime_index": index_time - load_time,
+        "etime_read": read_time - index_time,
+    }
+
+
+def _scatter_snapshot(index, sd):
+    """
+    Set the model state from a full snapshot.
+    """
+    for g, columns in _columnar_groups.items():
+        pos = index.positions(g, sd[f"{g}_names"])
+        for a in columns:
+            column = f"{g}_{a}"
+            if pos is None:
+                index.scatter(column, None, sd[column])
+            else:
+                index.scatter(column, pos[0], sd[column][pos[1]])
+
+
+def _relative_name(c, root):
+    """
+    Name of a component relative to a root block, or None if the component is
+    not in the root block.
+    """
+    b = c.parent_block()
+    while b is not None and b is not root:
+        b = b.parent_block()
+    if b is None:
+        return None
+    return c.getname(fully_qualified=True, relative_to=root)
+
+
+class StateLoader(object):
+    """
+    A model state compiled against a template block, which can be loaded
+    repeatedly into blocks with the same structure as the template (for example
+    the period blocks of a multi-period model).  The state is matched to the
+    template components once when the loader is created.  Loading it into a
+    block then only collects the block's components in the same order as the
+    template, checks that they have the same local names and index keys, and
+    sets the stored values directly, without generating or looking up each
+    component's full name.
+
+    The stored state is the same as for to_json() with the default StoreSpec:
+    variable values, bounds and fixed flags, mutable parameter values,
+    constraint and block active flags, BooleanVar values and fixed flags and
+    Suffix data.
+
+    Args:
+        template: Pyomo block (model or block data object) with the structure of
+            the blocks the state is to be loaded into
+        sd: Optional state to compile, either a columnar snapshot from to_npz()
+            or a state dictionary from to_json(). A to_json() state is first
+            loaded into the template with from_json(). If None (default), the
+            current state of the template is used.
+        fname: npz file to load the state from, only used if sd is None
+
+    Raises:
+        ValueError: when loading a delta snapshot, which requires its reference
+    """
+
+    def __init__(self, template, sd=None, fname=None):
+        if sd is None and fname is not None:
+            sd = _load_snapshot(fname=fname)
+        if sd is not None and "__metadata__" in sd:
+            # to_json() state dictionary
+            from_json(template, sd=sd)
+            sd = None
+        self._index = _ColumnarIndex(template)
+        if sd is not None:
+            if bool(sd["delta"]):
+                raise ValueError(
+                    "A StateLoader can not be created from a delta snapshot, load "
+                    "the snapshot into the template with from_npz() first"
+                )
+            # Match the stored state to the template once, entries not in the
+            # template are dropped and template entries not stored keep their
+            # current state
+            _scatter_snapshot(self._index, sd)
+        self._state = {k: v.tolist() for k, v in self._index.gather().items()}
+        # keep values as they are (e.g. int), rather than converted to float
+        comps = self._index.components
+        self._state["var_value"] = [v.value for v in comps["var"]]
+        self._state["param_value"] = [p.value for p in comps["param"]]
+        self._compile_extra(template)
+
+    def _compile_extra(self, template):
+        """
+        Compile the BooleanVar and Suffix state of the template, which is not
+        in the columnar index.  BooleanVars and Suffixes are located by name,
+        suffix entries by their position in the index if they have one, or
+        else by name.
+        """
+        position = {}
+        for g, comps in self._index.components.items():
+            for i, c in enumerate(comps):
+                position[id(c)] = (g, i)
+        blocks = self._index.blocks
+        self._boolean_vars = []
+        for bv in (
+            bv
+            for bd in blocks
+            for bv in bd.component_data_objects(BooleanVar, descend_into=False)
+        ):
+            name = _relative_name(bv, template)
+            if name is not None:
+                self._boolean_vars.append((name, bv.value, bv.fixed))
+        self._suffixes = []
+        for suffix in (
+            suffix
+            for bd in blocks
+            for suffix in bd.component_objects(Suffix, descend_into=False)
+        ):
+            entries = []
+            for c, val in suffix.items():
+                if id(c) in position:
+                    entries.append((position[id(c)], val))
+                else:
+                    name = _relative_name(c, template)
+                    if name is not None:
+                        entries.append((name, val))
+            self._suffixes.append((_relative_name(suffix, template), entries))
+
+    def load(self, blk):
+        """
+        Load the compiled state into a block.  If the components of the block
+        do not have the same names and index keys as those of the template, the
+        components are matched to the template by name instead, and components
+        missing from either are ignored (as from_json() does).
+
+        Args:
+            blk: Pyomo block with the same structure as the template
+
+        Returns:
+            None
+        """
+        # Compare the components of each block of blk with those of the template
+        # by local name and index keys, rather than generating every name
+        index = _ColumnarIndex(blk, with_names=False)
+        if index.structure == self._index.structure:
+            for column, values in self._state.items():
+                index.scatter(column, None, values)
+            self._load_extra(blk, lambda g, i: index.components[g][i])
+            return
+        _log.debug(
+            f"Structure of {blk.name} differs from the StateLoader template, "
+            "matching components by name"
+        )
+        index = _ColumnarIndex(blk)
+        for g, columns in _columnar_groups.items():
+            pos = index.positions(g, self._index.names[g])
+            for a in columns:
+                column = f"{g}_{a}"
+                if pos is None:
+                    index.scatter(column, None, self._state[column])
+                else:
+                    values = self._state[column]
+                    index.scatter(column, pos[0], [values[j] for j in pos[1].tolist()])
+        lookup = {}
+
+        def locate(g, i):
+            if g not in lookup:
+                lookup[g] = {n: j for j, n in enumerate(index.names[g].tolist())}
+            j = lookup[g].get(self._index.names[g][i], None)
+            return None if j is None else index.components[g][j]
+
+        self._load_extra(blk, locate)
+
+    def _load_extra(self, blk, locate):
+        """
+        Load the BooleanVar and Suffix state.
+
+        Args:
+            blk: Pyomo block to load the state into
+            locate: function of (group, position in the template index) which
+                returns the corresponding component of blk, or None
+        """
+        for name, val, fixed in self._boolean_vars:
+            bv = blk.find_component(name)
+            if bv is not None:
+                bv.set_value(val)
+                bv.fixed = fixed
+        for suffix_name, entries in self._suffixes:
+            suffix = blk.find_component(suffix_name)
+            if suffix is None:
+                continue
+            for key, val in entries:
+                if isinstance(key, tuple):
+                    c = locate(*key)
+                else:
+                    c = blk.find_component(key)
+                if c is not None:
+                    suffix[c] = val
+
+    def load_all(self, blocks):
+        """
+        Load the compiled state into each block of an iterable of blocks.
+
+        Args:
+            blocks: iterable of Pyomo blocks with the same structure as the
+                template
+
+        Returns:
+            None
+        """
+        for blk in blocks:
+            self.load(blk)
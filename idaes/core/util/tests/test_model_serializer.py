@@ -16,11 +16,25 @@ Test for functions to save/load Pyomo model state to a dict or json
 
 import unittest
 import os
+import gc
 
+import numpy as np
 from pyomo.environ import *
-from idaes.core.util import to_json, from_json, StoreSpec
+from pyomo.dae import ContinuousSet, DerivativeVar
+from pyomo.gdp import Disjunct
+from pyomo.common.timing import TicTocTimer
+from pyomo.common import unittest as pyo_unittest
+from idaes.core.util import (
+    to_json,
+    from_json,
+    to_npz,
+    from_npz,
+    StoreSpec,
+    StateLoader,
+)
 from idaes.core.util.model_serializer import _only_fixed
 from idaes.core.dmf.util import mkdtemp
+from idaes.core.util.performance import PerformanceBaseClass
 import shutil
 import pytest
 
@@ -586,5 +600,447 @@ class TestModelSerialize(unittest.TestCase):
         assert value(model.b[2].x[3, 3]) == 3
 
 
+def setup_dae_model():
+    model = ConcreteModel()
+    model.t = ContinuousSet(bounds=(0, 1))
+    model.x = Var(model.t, initialize=1)
+    model.dx = DerivativeVar(model.x, wrt=model.t)
+    TransformationFactory("dae.finite_difference").apply_to(model, nfe=4)
+    return model
+
+
+class TestColumnarSnapshot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dirname = mkdtemp()
+        cls.fname = os.path.join(cls.dirname, "crAzYStuff1010202030.npz")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.dirname)
+
+    def tearDown(self):
+        try:
+            os.remove(self.fname)
+        except:
+            pass
+
+    @staticmethod
+    def setup_model(n=3):
+        model = ConcreteModel()
+        model.p = Param([1, 2], initialize={1: 1, 2: 2}, mutable=True)
+        model.q = Param(initialize=4)
+        model.b = Block(range(n))
+        for i in range(n):
+            b = model.b[i]
+            b.x = Var([1, 2], initialize=i % 10, bounds=(-10, 10))
+            b.y = Var(initialize=None)
+            b.c = Constraint(expr=b.x[1] == model.p[1] * b.x[2])
+        model.b[0].x[1].fix(3)
+        return model
+
+    @staticmethod
+    def perturb(model):
+        model.p[1] = 5
+        model.b[0].x[1].unfix()
+        model.b[0].x[1].value = 7
+        model.b[1].x[2].setlb(None)
+        model.b[1].x[2].setub(4)
+        model.b[1].y.value = 2
+        model.b[1].c.deactivate()
+        model.b[2].deactivate()
+
+    def assert_original(self, model):
+        assert value(model.p[1]) == 1
+        assert model.b[0].x[1].fixed
+        assert value(model.b[0].x[1]) == 3
+        assert model.b[1].x[2].lb == -10
+        assert model.b[1].x[2].ub == 10
+        assert model.b[1].y.value is None
+        assert model.b[1].c.active
+        assert model.b[2].active
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        model = self.setup_model()
+        sd = to_npz(model, return_dict=True)
+        assert list(sd["var_names"]) == [
+            "b[0].x[1]",
+            "b[0].x[2]",
+            "b[0].y",
+            "b[1].x[1]",
+            "b[1].x[2]",
+            "b[1].y",
+            "b[2].x[1]",
+            "b[2].x[2]",
+            "b[2].y",
+        ]
+        assert list(sd["param_names"]) == ["p[1]", "p[2]"]
+        assert np.isnan(sd["var_value"][2])
+        self.perturb(model)
+        from_npz(model, sd=sd)
+        self.assert_original(model)
+
+    @pytest.mark.unit
+    def test_round_trip_file(self):
+        model = self.setup_model()
+        to_npz(model, fname=self.fname, metadata={"case": 1})
+        self.perturb(model)
+        pdict = from_npz(model, fname=self.fname)
+        self.assert_original(model)
+        assert set(pdict) == {"etime_load_file", "etime_index", "etime_read"}
+
+    @pytest.mark.unit
+    def test_different_structure(self):
+        model = self.setup_model()
+        sd = to_npz(model, return_dict=True)
+        model2 = self.setup_model(n=4)
+        model2.z = Var(initialize=1)
+        self.perturb(model2)
+        model2.b[3].x[1].value = 11
+        from_npz(model2, sd=sd)
+        self.assert_original(model2)
+        # components not in the snapshot are left alone
+        assert value(model2.b[3].x[1]) == 11
+        assert value(model2.z) == 1
+
+    @pytest.mark.unit
+    def test_sub_block(self):
+        model = self.setup_model()
+        sd = to_npz(model.b[0], return_dict=True)
+        assert list(sd["var_names"]) == ["x[1]", "x[2]", "y"]
+        model.b[1].x[1].fix(3)
+        model.b[1].x[2].value = 0
+        from_npz(model.b[1], sd=sd)
+        assert model.b[1].x[1].fixed
+        assert value(model.b[1].x[1]) == 3
+        assert value(model.b[1].x[2]) == 0
+
+    @pytest.mark.unit
+    def test_round_trip_dae(self):
+        model = setup_dae_model()
+        for t in model.t:
+            model.dx[t].value = 5.0
+        to_npz(model, fname=self.fname)
+        model2 = setup_dae_model()
+        from_npz(model2, fname=self.fname)
+        for t in model2.t:
+            assert value(model2.x[t]) == 1
+            assert value(model2.dx[t]) == 5.0
+
+    @pytest.mark.unit
+    def test_delta(self):
+        model = self.setup_model()
+        reference = to_npz(model, return_dict=True)
+        self.perturb(model)
+        delta = to_npz(model, reference=reference, return_dict=True)
+        assert "var_names" not in delta
+        assert list(delta["var_value_index"]) == [0, 5]
+        assert list(delta["var_fixed_index"]) == [0]
+        assert list(delta["param_value_index"]) == [0]
+        assert list(delta["block_active_index"]) == [2]
+        assert len(delta["constraint_active"]) == 1
+
+        # apply the delta on top of the reference state
+        from_npz(model, sd=reference)
+        self.assert_original(model)
+        from_npz(model, sd=delta)
+        assert value(model.p[1]) == 5
+        assert not model.b[0].x[1].fixed
+        assert value(model.b[0].x[1]) == 7
+        assert model.b[1].x[2].lb is None
+        assert model.b[1].x[2].ub == 4
+        assert value(model.b[1].y) == 2
+        assert not model.b[1].c.active
+        assert not model.b[2].active
+
+        # load the reference then the delta from files
+        to_npz(model, fname=self.fname, reference=reference)
+        model2 = self.setup_model()
+        model2.b[0].x[2].value = 9
+        from_npz(model2, fname=self.fname, reference=reference)
+        assert value(model2.b[0].x[2]) == 0
+        assert value(model2.b[0].x[1]) == 7
+        assert not model2.b[2].active
+
+    @pytest.mark.unit
+    def test_delta_structure_mismatch(self):
+        model = self.setup_model()
+        reference = to_npz(model, return_dict=True)
+        delta = to_npz(model, reference=reference, return_dict=True)
+        with pytest.raises(ValueError, match="reference for a delta"):
+            to_npz(model, reference=delta)
+        model2 = self.setup_model(n=4)
+        with pytest.raises(ValueError, match="different structure"):
+            to_npz(model2, reference=reference)
+        with pytest.raises(ValueError, match="same structure"):
+            from_npz(model2, sd=delta)
+
+    @pytest.mark.unit
+    def test_no_source(self):
+        model = self.setup_model()
+        with pytest.raises(Exception, match="Need to specify a data source"):
+            from_npz(model)
+
+
+@pytest.mark.performance
+class TestColumnarSnapshotPerformance(PerformanceBaseClass, pyo_unittest.TestCase):
+    """
+    Record the time to save and load the state of a model with many blocks with
+    to_json/from_json and with columnar snapshots.
+    """
+
+    def build_model(self):
+        return TestColumnarSnapshot.setup_model(n=20000)
+
+    @pytest.mark.performance
+    def test_performance(self):
+        model = self.build_model()
+        dirname = mkdtemp()
+        try:
+            fname = os.path.join(dirname, "snapshot.npz")
+            gc.collect()
+            timer = TicTocTimer()
+            sd = to_json(model, return_dict=True)
+            self.recordData("to_json", timer.toc("to_json"))
+            from_json(model, sd=sd)
+            self.recordData("from_json", timer.toc("from_json"))
+            to_npz(model, fname=fname)
+            self.recordData("to_npz", timer.toc("to_npz"))
+            from_npz(model, fname=fname)
+            self.recordData("from_npz", timer.toc("from_npz"))
+            TestColumnarSnapshot.perturb(model)
+            gc.collect()
+            timer.tic(None)
+            delta = to_npz(model, reference=fname, return_dict=True)
+            self.recordData("to_npz delta", timer.toc("to_npz delta"))
+            assert list(delta["var_value_index"]) == [0, 5]
+        finally:
+            shutil.rmtree(dirname)
+
+
+class TestStateLoader(unittest.TestCase):
+    @staticmethod
+    def build_flowsheet(b):
+        b.p = Param(initialize=1, mutable=True)
+        b.x = Var([1, 2], initialize=1, bounds=(0, 10))
+        b.y = Var(initialize=1)
+        b.c = Constraint(expr=b.x[1] + b.x[2] == b.y)
+        b.sub = Block()
+        b.sub.z = Var(initialize=0)
+
+    @staticmethod
+    def initialize(b):
+        b.p = 3
+        b.x[1].fix(2)
+        b.x[2] = 4
+        b.x[2].setub(5)
+        b.y = 6
+        b.sub.deactivate()
+
+    @classmethod
+    def setup_model(cls, n=5):
+        m = ConcreteModel()
+        m.period = Block(range(n))
+        for i in range(n):
+            cls.build_flowsheet(m.period[i])
+        return m
+
+    @staticmethod
+    def assert_initialized(b):
+        assert value(b.p) == 3
+        assert b.x[1].fixed
+        assert value(b.x[1]) == 2
+        assert value(b.x[2]) == 4
+        assert b.x[2].ub == 5
+        assert b.x[2].lb == 0
+        assert value(b.y) == 6
+        assert value(b.sub.z) == 0
+        assert not b.sub.active
+
+    @pytest.mark.unit
+    def test_load_from_template(self):
+        template = ConcreteModel()
+        self.build_flowsheet(template)
+        self.initialize(template)
+        loader = StateLoader(template)
+        m = self.setup_model()
+        loader.load_all(m.period.values())
+        for b in m.period.values():
+            self.assert_initialized(b)
+
+    @pytest.mark.unit
+    def test_load_from_json(self):
+        template = ConcreteModel()
+        self.build_flowsheet(template)
+        self.initialize(template)
+        sd = to_json(template, return_dict=True)
+        template = ConcreteModel()
+        self.build_flowsheet(template)
+        loader = StateLoader(template, sd=sd)
+        # the json state is loaded into the template
+        self.assert_initialized(template)
+        m = self.setup_model()
+        loader.load(m.period[3])
+        self.assert_initialized(m.period[3])
+        assert not m.period[2].x[1].fixed
+
+    @pytest.mark.unit
+    def test_load_from_npz(self):
+        m = self.setup_model()
+        self.initialize(m.period[0])
+        sd = to_npz(m.period[0], return_dict=True)
+        template = ConcreteModel()
+        self.build_flowsheet(template)
+        loader = StateLoader(template, sd=sd)
+        loader.load_all(m.period[i] for i in range(1, 5))
+        for b in m.period.values():
+            self.assert_initialized(b)
+
+        with pytest.raises(ValueError, match="delta snapshot"):
+            StateLoader(template, sd=to_npz(template, reference=sd, return_dict=True))
+
+    @pytest.mark.unit
+    def test_load_different_structure(self):
+        template = ConcreteModel()
+        self.build_flowsheet(template)
+        self.initialize(template)
+        loader = StateLoader(template)
+        m = self.setup_model(n=1)
+        m.period[0].w = Var(initialize=7)
+        loader.load(m.period[0])
+        self.assert_initialized(m.period[0])
+        assert value(m.period[0].w) == 7
+
+    @pytest.mark.unit
+    def test_load_same_sizes_different_structure(self):
+        template = ConcreteModel()
+        template.a = Var(initialize=1)
+        template.b = Var(initialize=2)
+        template.c = Var([1, 2], initialize=3)
+        loader = StateLoader(template)
+        # same number of components, but named and ordered differently
+        m = ConcreteModel()
+        m.b = Var(initialize=0)
+        m.c = Var([2, 3], initialize=0)
+        m.a = Var(initialize=0)
+        loader.load(m)
+        assert value(m.a) == 1
+        assert value(m.b) == 2
+        assert value(m.c[2]) == 3
+        assert value(m.c[3]) == 0
+
+    @pytest.mark.unit
+    def test_load_same_sizes_different_keys(self):
+        template = ConcreteModel()
+        template.x = Var([1, 2], initialize={1: 1, 2: 2})
+        template.y = Var(["a", "b"], initialize={"a": 3, "b": 4})
+        loader = StateLoader(template)
+        # same components and sizes, but different index keys or key order
+        m = ConcreteModel()
+        m.x = Var([2, 3], initialize=0)
+        m.y = Var(["b", "a"], initialize=0)
+        loader.load(m)
+        assert value(m.x[2]) == 2
+        assert value(m.x[3]) == 0
+        assert value(m.y["a"]) == 3
+        assert value(m.y["b"]) == 4
+
+    @pytest.mark.unit
+    def test_load_dae(self):
+        template = setup_dae_model()
+        for t in template.t:
+            template.x[t].value = 2.0
+            template.dx[t].value = 5.0
+        loader = StateLoader(template)
+        m = setup_dae_model()
+        loader.load(m)
+        for t in m.t:
+            assert value(m.x[t]) == 2.0
+            assert value(m.dx[t]) == 5.0
+
+    @pytest.mark.unit
+    def test_load_disjunct(self):
+        template = ConcreteModel()
+        template.d = Disjunct()
+        template.d.v = Var(initialize=3)
+        template.d.c = Constraint(expr=template.d.v <= 4)
+        template.d.c.deactivate()
+        loader = StateLoader(template)
+        m = ConcreteModel()
+        m.d = Disjunct()
+        m.d.v = Var(initialize=0)
+        m.d.c = Constraint(expr=m.d.v <= 4)
+        loader.load(m)
+        assert value(m.d.v) == 3
+        assert not m.d.c.active
+
+    @pytest.mark.unit
+    def test_load_suffix_boolean_var_int(self):
+        template = ConcreteModel()
+        self.build_flowsheet(template)
+        template.n = Var(initialize=5, within=Integers)
+        template.flag = BooleanVar(initialize=True)
+        template.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        template.scaling_factor[template.x[1]] = 1e-3
+        template.scaling_factor[template.sub] = 2
+        template.scaling_factor[template.flag] = 4
+        loader = StateLoader(template)
+        m = self.setup_model(n=2)
+        for b in m.period.values():
+            b.n = Var(initialize=0, within=Integers)
+            b.flag = BooleanVar()
+            b.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        # matched directly and by name
+        m.period[1].w = Var()
+        loader.load_all(m.period.values())
+        for b in m.period.values():
+            assert b.n.value == 5
+            assert isinstance(b.n.value, int)
+            assert b.flag.value is True
+            assert b.scaling_factor[b.x[1]] == 1e-3
+            assert b.scaling_factor[b.sub] == 2
+            assert b.scaling_factor[b.flag] == 4
+            assert len(b.scaling_factor) == 3
+
+
+@pytest.mark.performance
+class TestStateLoaderPerformance(PerformanceBaseClass, pyo_unittest.TestCase):
+    """
+    Record the time to load one state into many identical blocks with
+    from_json and with a StateLoader.
+    """
+
+    n_blocks = 2000
+
+    def build_model(self):
+        return TestStateLoader.setup_model(n=self.n_blocks)
+
+    @pytest.mark.performance
+    def test_performance(self):
+        m = self.build_model()
+        template = ConcreteModel()
+        TestStateLoader.build_flowsheet(template)
+        TestStateLoader.initialize(template)
+
+        gc.collect()
+        timer = TicTocTimer()
+        sd = to_json(template, return_dict=True)
+        for b in m.period.values():
+            from_json(b, sd=sd)
+        self.recordData(
+            "from_json", timer.toc(f"from_json into {self.n_blocks} blocks")
+        )
+        gc.collect()
+        timer.tic(None)
+        loader = StateLoader(template)
+        loader.load_all(m.period.values())
+        self.recordData(
+            "StateLoader", timer.toc(f"StateLoader into {self.n_blocks} blocks")
+        )
+        for b in m.period.values():
+            TestStateLoader.assert_initialized(b)
+
+
 if __name__ == "__main__":
     unittest.main()